@@ -23,14 +23,20 @@ from __future__ import annotations
 import argparse
 import asyncio
 import sys
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Tuple
 
 
 # ---------------------------------------------------------------------------
 # Import the SDK
 # ---------------------------------------------------------------------------
 try:
-    from ai_native_vscode_bridge import BridgeClient
+    from ai_native_vscode_bridge import (
+        BridgeClient,
+        BridgeError,
+        BridgeEventStream,
+        DiagnosticsIndex,
+    )
 except ImportError:
     print(
         "❌  ai-native-bridge SDK not installed.\n"
@@ -62,123 +68,304 @@ def fmt_diagnostic(d: Dict[str, Any]) -> str:
 
 
 # ---------------------------------------------------------------------------
-# Agent core
+# Verification: wait for VS Code to republish diagnostics
 # ---------------------------------------------------------------------------
-async def run_agent(port: int, severity_filter: str | None, dry_run: bool) -> None:
-    client = BridgeClient.from_workspace(port=port)
-
-    # ── Step 0: Health check ───────────────────────────────────────────
-    print("🔌 Connecting to VS Code Bridge …")
-    pong = await client.call("bridge.ping")
-    print(f"   ✅  Connected (protocol: {pong.get('protocol', '?')})\n")
+class DiagnosticsWatcher:
+    """
+    Resolves waiters when a `diagnostics.changed` event arrives for a URI,
+    and keeps `index` current from the same events.
+
+    Call `expect(uri)` *before* committing an edit so the event can't slip
+    past between the commit and the wait.
+    """
+
+    def __init__(self, stream: BridgeEventStream, index: DiagnosticsIndex) -> None:
+        self._stream = stream
+        self._index = index
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+
+    def expect(self, uri: str) -> asyncio.Future:
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(uri, []).append(fut)
+        return fut
+
+    async def run(self) -> None:
+        async for event in self._stream:
+            self._index.handle_event(event)
+            uri = (event.get("params") or {}).get("uri")
+            for fut in self._waiters.pop(uri, ()):
+                if not fut.done():
+                    fut.set_result(None)
+
+    @staticmethod
+    async def wait(fut: asyncio.Future, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(fut, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
 
-    # ── Step 1: Observe — list all diagnostics ─────────────────────────
-    print("🔍 Fetching workspace diagnostics …")
-    result = await client.call("diagnostics.list")
-    files: List[Dict[str, Any]] = result.get("files", [])
 
-    if not files:
-        print("   🎉  No diagnostics — workspace is clean!")
-        return
-
-    # Optionally filter by severity
-    min_sev = {"error": 0, "warning": 1, "info": 2, "hint": 3}.get(
-        (severity_filter or "").lower(), 99
-    )
-
-    total_diags = 0
-    fixable_files: List[Dict[str, Any]] = []
-
-    for f in files:
-        uri = f["uri"]
-        diags = f.get("diagnostics", [])
-        filtered = [d for d in diags if d.get("severity", 0) <= min_sev]
-        if not filtered:
-            continue
-        total_diags += len(filtered)
-        fixable_files.append({"uri": uri, "diagnostics": filtered})
-        print(f"\n   📄 {short_uri(uri)}")
-        for d in filtered:
-            print(fmt_diagnostic(d))
-
-    print(f"\n   📊 Found {total_diags} diagnostic(s) across {len(fixable_files)} file(s).\n")
-
-    if total_diags == 0:
-        print("   ✨  Nothing to fix (all filtered out).")
-        return
-
-    # ── Step 2: Decide + Act — preview & apply code-action fixes ───────
-    fixed_count = 0
-    skipped_count = 0
-
-    for f_entry in fixable_files:
-        uri = f_entry["uri"]
-        diags = f_entry["diagnostics"]
-
-        for diag in diags:
-            # Ask the bridge for available code-action fixes
+# ---------------------------------------------------------------------------
+# Agent core
+# ---------------------------------------------------------------------------
+async def fix_file(
+    client: BridgeClient,
+    watcher: DiagnosticsWatcher,
+    limit: asyncio.Semaphore,
+    uri: str,
+    rounds: int,
+    dry_run: bool,
+    settle_timeout: float,
+) -> Tuple[int, int]:
+    """
+    Apply quick fixes to one file until none are left (at most `rounds`).
+
+    The extension stages the first quick fix for the whole document, so each
+    round is preview → commit → wait for fresh diagnostics. Rounds within a
+    file are strictly ordered (every commit shifts ranges); only the preview
+    step holds a slot of the shared concurrency `limit`.
+    Returns `(fixes applied, skipped)`, where `skipped` is 1 if the file had
+    no quick fix at all or its fix was rejected on commit, else 0.
+    """
+    fixed = 0
+    skipped = 0
+    for _ in range(rounds):
+        async with limit:
+            tx = await client.call("tx.begin")
+            tx_id = tx["txId"]
             try:
                 preview = await client.call(
                     "diagnostics.fix.preview",
-                    {
-                        "uri": uri,
-                        "diagnosticRange": diag.get("range"),
-                    },
+                    {"txId": tx_id, "uri": uri, "kind": "quickfix"},
                 )
             except Exception as exc:
+                await client.call("tx.rollback", {"txId": tx_id})
                 print(f"   ⚠️  Could not preview fix for {short_uri(uri)}: {exc}")
-                skipped_count += 1
-                continue
-
-            actions = preview.get("actions", [])
-            if not actions:
-                skipped_count += 1
-                continue
+                break
+
+        title = preview.get("title", "(untitled)")
+        if not preview.get("staged") or dry_run:
+            await client.call("tx.rollback", {"txId": tx_id})
+            if preview.get("staged"):
+                print(f"   🔸 [DRY-RUN] Would apply: {title}  ({short_uri(uri)})")
+                fixed += 1
+            elif fixed == 0:
+                skipped = 1  # no quick fix offered for this file
+            break
+
+        changed = watcher.expect(uri)
+        try:
+            await client.call("diagnostics.fix.commit", {"txId": tx_id})
+        except Exception as exc:
+            await client.call("tx.rollback", {"txId": tx_id})
+            print(f"   ❌ Error applying fix: {exc}")
+            skipped = 1
+            break
+        print(f"   ✅ Fixed: {title}  ({short_uri(uri)})")
+        fixed += 1
+        if not await watcher.wait(changed, settle_timeout):
+            print(f"   ⏱️  No diagnostics update for {short_uri(uri)}; continuing")
+    return fixed, skipped
+
+
+async def fix_bulk(
+    client: BridgeClient,
+    watcher: DiagnosticsWatcher,
+    limit: asyncio.Semaphore,
+    uris: List[str],
+    dry_run: bool,
+    show_diff: bool,
+    settle_timeout: float,
+) -> Tuple[int, int]:
+    """
+    Stage a fix for every file in one transaction and commit it once.
+
+    Each file gets its `source.fixAll` action (or, failing that, its first
+    quick fix) staged into the shared tx, so VS Code applies edits and
+    recomputes diagnostics once instead of once per fix. The combined diff
+    comes from `tx.preview`. If `tx.commit` fails — typically the version
+    check, because a file changed after it was staged — or anything else goes
+    wrong before the commit, the tx is rolled back. Returns `(files fixed,
+    files skipped)`.
+    """
+    tx_id = (await client.call("tx.begin"))["txId"]
+    committed = False
+    failure: str | None = None  # printed once the rollback has run
+    try:
+
+        async def stage(uri: str) -> bool:
+            async with limit:
+                for kind in ("source.fixAll", "quickfix"):
+                    preview = await client.call(
+                        "diagnostics.fix.preview",
+                        {"txId": tx_id, "uri": uri, "kind": kind},
+                    )
+                    if preview.get("staged"):
+                        print(f"   🔸 Staged: {preview.get('title', '(untitled)')}  ({short_uri(uri)})")
+                        return True
+            return False
+
+        staged = await asyncio.gather(*(stage(uri) for uri in uris), return_exceptions=True)
+        for uri, outcome in zip(uris, staged):
+            if isinstance(outcome, Exception):
+                print(f"   ⚠️  Could not preview fix for {short_uri(uri)}: {outcome}")
+        fixed = sum(1 for outcome in staged if outcome is True)
+        if fixed == 0:
+            return 0, len(uris)
+
+        preview = await client.call("tx.preview", {"txId": tx_id})
+        if show_diff or dry_run:
+            print(f"\n{preview.get('unifiedDiff', '')}")
+        if dry_run:
+            print(f"   🔸 [DRY-RUN] Would commit {preview.get('fileCount', fixed)} file(s)")
+            return fixed, len(uris) - fixed
+
+        touched = [f["uri"] for f in preview.get("files", [])]
+        changed = [watcher.expect(uri) for uri in touched]
+        try:
+            await client.call("tx.commit", {"txId": tx_id})
+        except BridgeError as exc:
+            if (exc.data or {}).get("expectedVersion") is not None:
+                failure = (
+                    f"{short_uri(exc.data.get('uri', ''))} changed after staging "
+                    f"(v{exc.data['expectedVersion']} → v{exc.data.get('actualVersion')})"
+                )
+            else:
+                failure = f"Transaction failed: {exc}"
+            return 0, len(uris)
+        committed = True
+        print(f"   ✅ Committed {len(touched)} file(s) in one transaction")
+        await asyncio.gather(*(watcher.wait(fut, settle_timeout) for fut in changed))
+        return fixed, len(uris) - fixed
+    finally:
+        if not committed:
+            outcome = "rolled back"
+            try:
+                await client.call("tx.rollback", {"txId": tx_id})
+            except (BridgeError, OSError) as exc:
+                outcome = "rollback failed"
+                print(f"   ⚠️  Could not roll back transaction {tx_id}: {exc}")
+            if failure is not None:
+                print(f"   ❌ {failure}; {outcome}")
+
+
+async def run_agent(
+    port: int,
+    severity_filter: str | None,
+    dry_run: bool,
+    concurrency: int = 8,
+    settle_timeout: float = 5.0,
+    bulk: bool = False,
+    show_diff: bool = False,
+) -> None:
+    # ── Step 0: Health check ───────────────────────────────────────────
+    print("🔌 Connecting to VS Code Bridge …")
+    async with BridgeClient.from_workspace(port=port) as client, \
+            BridgeEventStream.from_workspace(
+                port=port, events=["diagnostics.changed"], overflow="coalesce"
+            ) as stream:
+        pong = await client.call("bridge.ping")
+        print(f"   ✅  Connected (protocol: {pong.get('protocol', '?')})\n")
+
+        # ── Step 1: Observe — list all diagnostics ─────────────────────
+        # One full snapshot; afterwards only files named by events are re-fetched.
+        print("🔍 Fetching workspace diagnostics …")
+        index = DiagnosticsIndex(client)
+        await index.load()
+        files = [{"uri": uri, "diagnostics": index.diagnostics(uri)} for uri in index.uris()]
+
+        if not files:
+            print("   🎉  No diagnostics — workspace is clean!")
+            return
+
+        # Optionally filter by severity
+        min_sev = {"error": 0, "warning": 1, "info": 2, "hint": 3}.get(
+            (severity_filter or "").lower(), 99
+        )
 
-            # Pick the first (preferred / highest-priority) action
-            action = actions[0]
-            action_title = action.get("title", "(untitled)")
+        total_diags = 0
+        fixable_files: List[Dict[str, Any]] = []
 
-            if dry_run:
-                print(f"   🔸 [DRY-RUN] Would apply: {action_title}  ({short_uri(uri)})")
-                fixed_count += 1
+        for f in files:
+            uri = f["uri"]
+            diags = f.get("diagnostics", [])
+            filtered = [d for d in diags if d.get("severity", 0) <= min_sev]
+            if not filtered:
                 continue
-
-            # Apply the fix
-            try:
-                commit_result = await client.call(
-                    "diagnostics.fix.commit",
-                    {
-                        "uri": uri,
-                        "diagnosticRange": diag.get("range"),
-                        "actionIndex": action.get("index", 0),
-                    },
+            total_diags += len(filtered)
+            fixable_files.append({"uri": uri, "diagnostics": filtered})
+            print(f"\n   📄 {short_uri(uri)}")
+            for d in filtered:
+                print(fmt_diagnostic(d))
+
+        print(f"\n   📊 Found {total_diags} diagnostic(s) across {len(fixable_files)} file(s).\n")
+
+        if total_diags == 0:
+            print("   ✨  Nothing to fix (all filtered out).")
+            return
+
+        # ── Step 2: Decide + Act — previews in parallel, commits per file ─
+        watcher = DiagnosticsWatcher(stream, index)
+        watch_task = asyncio.create_task(watcher.run())
+        limit = asyncio.Semaphore(max(1, concurrency))
+        started = time.perf_counter()
+        failed_count = 0
+        try:
+            if bulk:
+                outcomes = [
+                    await fix_bulk(
+                        client, watcher, limit, [f["uri"] for f in fixable_files],
+                        dry_run, show_diff, settle_timeout,
+                    )
+                ]
+            else:
+                # One file failing (a dropped socket, a tx.begin error) must
+                # not abort the fixes running for the others.
+                results = await asyncio.gather(
+                    *(
+                        fix_file(
+                            client, watcher, limit, f["uri"], len(f["diagnostics"]),
+                            dry_run, settle_timeout,
+                        )
+                        for f in fixable_files
+                    ),
+                    return_exceptions=True,
                 )
-                ok = commit_result.get("applied", False)
-                if ok:
-                    print(f"   ✅ Fixed: {action_title}  ({short_uri(uri)})")
-                    fixed_count += 1
-                else:
-                    print(f"   ❌ Failed to apply: {action_title}")
-                    skipped_count += 1
-            except Exception as exc:
-                print(f"   ❌ Error applying fix: {exc}")
-                skipped_count += 1
-
-    # ── Step 3: Verify — re-fetch diagnostics ──────────────────────────
-    print("\n─── Summary ───")
-    mode_label = "(dry-run)" if dry_run else ""
-    print(f"   ✅ Fixed: {fixed_count}  {mode_label}")
-    print(f"   ⏭️  Skipped (no fix available): {skipped_count}")
-
-    if not dry_run and fixed_count > 0:
-        # Give VS Code a moment to recompute diagnostics
-        await asyncio.sleep(1.5)
-        result2 = await client.call("diagnostics.list")
-        remaining = sum(
-            len(f.get("diagnostics", [])) for f in result2.get("files", [])
-        )
-        print(f"   📊 Remaining diagnostics: {remaining}")
+                outcomes = []
+                for f, result in zip(fixable_files, results):
+                    if isinstance(result, BaseException):
+                        if not isinstance(result, Exception):
+                            raise result  # cancellation, KeyboardInterrupt
+                        print(f"   ❌ Could not fix {short_uri(f['uri'])}: {result}")
+                        failed_count += 1
+                    else:
+                        outcomes.append(result)
+        finally:
+            watch_task.cancel()
+        elapsed = time.perf_counter() - started
+        fixed_count = sum(fixed for fixed, _ in outcomes)
+        skipped_count = sum(skipped for _, skipped in outcomes)
+
+        # ── Step 3: Verify — re-fetch diagnostics ──────────────────────
+        print("\n─── Summary ───")
+        mode_label = "(dry-run)" if dry_run else ""
+        unit = " file(s)" if bulk else ""
+        print(f"   ✅ Fixed: {fixed_count}{unit}  {mode_label}")
+        print(f"   ⏭️  Skipped (no fix available or fix rejected): {skipped_count} file(s)")
+        if failed_count:
+            print(f"   ❌ Failed: {failed_count} file(s)")
+        if not bulk:
+            rate = fixed_count / elapsed if elapsed > 0 else 0.0
+            print(f"   ⚡ {rate:.1f} fixes/s ({elapsed:.2f}s, concurrency {concurrency})")
+        else:
+            print(f"   ⏱️  {elapsed:.2f}s")
+
+        if not dry_run and fixed_count > 0:
+            # Each commit already waited for its diagnostics.changed event(s);
+            # the index re-fetched just those files.
+            await index.flush()
+            print(f"   📊 Remaining diagnostics: {index.count()}")
 
 
 # ---------------------------------------------------------------------------
@@ -201,8 +388,30 @@ def main() -> None:
         "--dry-run", action="store_true",
         help="Preview fixes without applying them"
     )
+    parser.add_argument(
+        "--concurrency", type=int, default=8,
+        help="Files previewed in parallel (default: 8; 1 = one file at a time)"
+    )
+    parser.add_argument(
+        "--bulk", action="store_true",
+        help="Stage one fix-all per file in a single transaction and commit once"
+    )
+    parser.add_argument(
+        "--show-diff", action="store_true",
+        help="With --bulk, print the combined diff before committing"
+    )
+    parser.add_argument(
+        "--settle-timeout", type=float, default=5.0,
+        help="Seconds to wait for a diagnostics update after each fix (default: 5)"
+    )
     args = parser.parse_args()
-    asyncio.run(run_agent(args.port, args.severity, args.dry_run))
+    asyncio.run(
+        run_agent(
+            args.port, args.severity, args.dry_run,
+            concurrency=args.concurrency, settle_timeout=args.settle_timeout,
+            bulk=args.bulk, show_diff=args.show_diff,
+        )
+    )
 
 
 if __name__ == "__main__":
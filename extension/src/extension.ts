@@ -324,6 +324,8 @@ export async function activate(context: vscode.ExtensionContext) {
   const eventBuffer: Array<{ seq: number; ts: number; name: string; params: unknown }> = [];
   let eventSeq = 0;
   const EVENT_BUFFER_MAX = 200;
+  // Identifies this activation; seq restarts at 1 whenever the extension does.
+  const eventEpoch = randomBytes(8).toString("hex");
 
   const emitEvent = (name: string, params: unknown) => {
     const ev = { seq: ++eventSeq, ts: Date.now(), name, params };
@@ -457,9 +459,23 @@ export async function activate(context: vscode.ExtensionContext) {
   }
 
   const startServer = async (): Promise<BridgeServer> => {
-    const port = getConfig().get<number>("bridge.port", 57110);
-
-    const wss = new WebSocketServer({ port, host: "127.0.0.1" });
+    const cfg = getConfig();
+    const port = cfg.get<number>("bridge.port", 57110);
+    const compression = cfg.get<boolean>("bridge.compression.enabled", true);
+
+    const wss = new WebSocketServer({
+      port,
+      host: "127.0.0.1",
+      // Negotiated per client; messages under `threshold` bytes (pings,
+      // small results) are sent uncompressed.
+      perMessageDeflate: compression
+        ? {
+            threshold: cfg.get<number>("bridge.compression.threshold", 1024),
+            zlibDeflateOptions: { level: cfg.get<number>("bridge.compression.level", 1) },
+          }
+        : false,
+      maxPayload: cfg.get<number>("bridge.maxMessageBytes", 100 * 1024 * 1024),
+    });
     wss.on("listening", () => {
       const addr = wss.address();
       output.appendLine(
@@ -476,34 +492,47 @@ export async function activate(context: vscode.ExtensionContext) {
     wss.on("connection", (socket) => {
       output.appendLine("[bridge] client connected");
       connected.add(socket);
-
-      socket.on("message", async (raw) => {
-        let msg: unknown;
-        try {
-          msg = JSON.parse(raw.toString("utf8"));
-        } catch {
-          socket.send(
-            JSON.stringify(err(null, "E_INVALID_PARAMS", "Invalid JSON"))
-          );
-          return;
-        }
-
+      // Requests still running for this socket, by id (see bridge.cancel).
+      const inflight = new Map<string | number, vscode.CancellationTokenSource>();
+
+      // Handles one request; `send` is called exactly once with its response.
+      const handleRequest = async (
+        msg: unknown,
+        send: (r: JsonRpcResponse) => void
+      ): Promise<void> => {
         if (!isJsonRpcRequest(msg)) {
-          socket.send(
-            JSON.stringify(err(null, "E_INVALID_PARAMS", "Not a JSON-RPC request"))
-          );
+          send(err(null, "E_INVALID_PARAMS", "Not a JSON-RPC request"));
           return;
         }
 
         const authToken = (msg.params as any)?.auth?.token;
         if (authToken !== token) {
           output.appendLine(`[bridge] E_AUTH for method=${msg.method}`);
-          socket.send(
-            JSON.stringify(err(msg.id, "E_AUTH", "Invalid or missing token"))
-          );
+          send(err(msg.id, "E_AUTH", "Invalid or missing token"));
           return;
         }
 
+        // Cancelled by bridge.cancel, by the caller's meta.timeoutMs running
+        // out, or by the socket closing. Long waits stop early and the late
+        // result is replaced by a short error nobody will read.
+        const reqId = msg.id;
+        const cts = new vscode.CancellationTokenSource();
+        const cancelToken = cts.token;
+        const budgetMs = (msg.params as any)?.meta?.timeoutMs;
+        const budgetTimer =
+          typeof budgetMs === "number" && budgetMs > 0
+            ? setTimeout(() => cts.cancel(), budgetMs)
+            : undefined;
+        if (reqId != null) inflight.set(reqId, cts);
+        const reply = send;
+        send = (r) => {
+          if (budgetTimer) clearTimeout(budgetTimer);
+          if (reqId != null && inflight.get(reqId) === cts) inflight.delete(reqId);
+          const cancelled = cancelToken.isCancellationRequested && "result" in r;
+          cts.dispose();
+          reply(cancelled ? err(reqId, "E_FAILED", "Cancelled", { cancelled: true }) : r);
+        };
+
         const paramsForLog =
           msg.params && typeof msg.params === "object"
             ? { ...(msg.params as any), auth: { token: "***" } }
@@ -521,14 +550,28 @@ export async function activate(context: vscode.ExtensionContext) {
           });
         }
 
-        const send = (r: JsonRpcResponse) =>
-          socket.send(JSON.stringify(r));
-
         try {
           switch (msg.method) {
             case "bridge.ping":
               send(ok(msg.id, { ok: true, protocol: PROTOCOL_VERSION }));
               return;
+            case "bridge.cancel": {
+              const ids = (msg.params as any)?.ids;
+              if (!Array.isArray(ids)) {
+                send(err(msg.id, "E_INVALID_PARAMS", "Missing/invalid ids"));
+                return;
+              }
+              let cancelled = 0;
+              for (const id of ids) {
+                const running = inflight.get(id);
+                if (running && !running.token.isCancellationRequested) {
+                  running.cancel();
+                  cancelled++;
+                }
+              }
+              send(ok(msg.id, { cancelled }));
+              return;
+            }
             case "bridge.capabilities":
               send(
                 ok(msg.id, {
@@ -538,17 +581,22 @@ export async function activate(context: vscode.ExtensionContext) {
                     "tasks.exit",
                     "debug.sessionStarted",
                     "debug.sessionTerminated",
+                    "doc.changed",
+                    "doc.saved",
                     "events.notification"
                   ],
                   limitations: [
                     "tasks.output not implemented yet (VS Code task output capture is limited)"
-                  ]
+                  ],
+                  features: ["batch", "cancel"]
                 })
               );
               return;
             case "events.subscribe": {
               const events = (msg.params as any)?.events;
               const replay = (msg.params as any)?.replay ?? 0;
+              const sinceSeq = (msg.params as any)?.sinceSeq;
+              const epoch = (msg.params as any)?.epoch;
               if (events != null && !Array.isArray(events)) {
                 send(err(msg.id, "E_INVALID_PARAMS", "Invalid events filter"));
                 return;
@@ -557,6 +605,14 @@ export async function activate(context: vscode.ExtensionContext) {
                 send(err(msg.id, "E_INVALID_PARAMS", "Invalid replay value"));
                 return;
               }
+              if (sinceSeq != null && (typeof sinceSeq !== "number" || sinceSeq < 0)) {
+                send(err(msg.id, "E_INVALID_PARAMS", "Invalid sinceSeq value"));
+                return;
+              }
+              if (epoch != null && typeof epoch !== "string") {
+                send(err(msg.id, "E_INVALID_PARAMS", "Invalid epoch value"));
+                return;
+              }
               const subId = randomBytes(8).toString("hex");
               const filter =
                 Array.isArray(events) && events.length > 0
@@ -567,22 +623,36 @@ export async function activate(context: vscode.ExtensionContext) {
               if (!eventSubsBySocket.has(socket)) eventSubsBySocket.set(socket, new Set());
               eventSubsBySocket.get(socket)!.add(subId);
 
-              // Replay last N matching events as notifications.
-              if (replay > 0) {
-                const slice = eventBuffer.slice(-replay);
-                for (const ev of slice) {
-                  if (filter && !filter.has(ev.name)) continue;
-                  socket.send(JSON.stringify(notify("events.notification", ev)));
-                }
-              }
-
+              // Resume: everything after sinceSeq. If the extension restarted (epoch or
+              // seq went backwards) or the buffer already evicted sinceSeq + 1, replay
+              // what is left and report a gap so the client can resync.
+              let slice: typeof eventBuffer = [];
+              let gap = false;
+              if (typeof sinceSeq === "number") {
+                const oldest = eventBuffer.length > 0 ? eventBuffer[0].seq : eventSeq + 1;
+                const restarted = (epoch != null && epoch !== eventEpoch) || sinceSeq > eventSeq;
+                gap = restarted || sinceSeq + 1 < oldest;
+                slice = restarted ? eventBuffer : eventBuffer.filter((ev) => ev.seq > sinceSeq);
+              } else if (replay > 0) {
+                slice = eventBuffer.slice(-replay);
+              }
+              const matching = filter ? slice.filter((ev) => filter.has(ev.name)) : slice;
+
+              // The result goes first so clients learn the epoch/gap before the replay.
               send(
                 ok(msg.id, {
                   subscriptionId: subId,
                   filter: filter ? [...filter] : null,
-                  replayed: replay
+                  replayed: matching.length,
+                  epoch: eventEpoch,
+                  latestSeq: eventSeq,
+                  oldestSeq: eventBuffer.length > 0 ? eventBuffer[0].seq : null,
+                  gap
                 })
               );
+              for (const ev of matching) {
+                socket.send(JSON.stringify(notify("events.notification", ev)));
+              }
               return;
             }
             case "events.unsubscribe": {
@@ -1028,6 +1098,35 @@ export async function activate(context: vscode.ExtensionContext) {
               );
               return;
             }
+            case "workspace.findFiles": {
+              const p = (msg.params as any) ?? {};
+              const include = p.include ?? "**/*";
+              const maxResults = p.maxResults ?? 10000;
+              if (
+                typeof include !== "string" ||
+                (p.exclude !== undefined && p.exclude !== null && typeof p.exclude !== "string") ||
+                !Number.isInteger(maxResults) ||
+                maxResults < 1
+              ) {
+                send(err(msg.id, "E_INVALID_PARAMS", "Invalid include, exclude or maxResults"));
+                return;
+              }
+              // undefined applies files.exclude/search.exclude; null disables excludes.
+              // One extra result tells us whether the list was cut off.
+              const uris = await vscode.workspace.findFiles(
+                include,
+                p.exclude,
+                maxResults + 1,
+                cancelToken
+              );
+              send(
+                ok(msg.id, {
+                  items: uris.slice(0, maxResults).map((u) => u.toString()),
+                  truncated: uris.length > maxResults
+                })
+              );
+              return;
+            }
             case "diagnostics.list": {
               const uri = parseUri((msg.params as any)?.uri);
               if (uri) {
@@ -1138,17 +1237,45 @@ export async function activate(context: vscode.ExtensionContext) {
             }
             case "doc.read": {
               const uri = parseUri((msg.params as any)?.uri);
+              const startLine = (msg.params as any)?.startLine;
+              const endLine = (msg.params as any)?.endLine;
               if (!uri) {
                 send(err(msg.id, "E_INVALID_PARAMS", "Missing/invalid uri"));
                 return;
               }
+              if (
+                (startLine != null && (typeof startLine !== "number" || startLine < 0)) ||
+                (endLine != null && (typeof endLine !== "number" || endLine < 0))
+              ) {
+                send(err(msg.id, "E_INVALID_PARAMS", "Invalid startLine or endLine"));
+                return;
+              }
               const doc = await vscode.workspace.openTextDocument(uri);
+              if (startLine == null && endLine == null) {
+                send(
+                  ok(msg.id, {
+                    uri: uri.toString(),
+                    version: doc.version,
+                    languageId: doc.languageId,
+                    text: doc.getText()
+                  })
+                );
+                return;
+              }
+
+              // Windowed read: lines [from, to) including their line breaks, so
+              // consecutive windows concatenate back to the full text.
+              const from = Math.min(startLine ?? 0, doc.lineCount);
+              const to = Math.min(Math.max(endLine ?? doc.lineCount, from), doc.lineCount);
               send(
                 ok(msg.id, {
                   uri: uri.toString(),
                   version: doc.version,
                   languageId: doc.languageId,
-                  text: doc.getText()
+                  text: from < to ? doc.getText(new vscode.Range(from, 0, to, 0)) : "",
+                  startLine: from,
+                  endLine: to,
+                  totalLines: doc.lineCount
                 })
               );
               return;
@@ -1400,10 +1527,18 @@ export async function activate(context: vscode.ExtensionContext) {
 
               const exitCode = await new Promise<number | null>((resolve) => {
                 const timer = setTimeout(() => resolve(null), timeoutMs);
-                taskCaptureWaiter.set(taskId, (code) => {
+                // The caller gave up: stop the task instead of leaving it running.
+                const onCancel = cancelToken.onCancellationRequested(() => {
+                  execution.terminate();
+                  done(null);
+                });
+                const done = (code: number | null) => {
                   clearTimeout(timer);
+                  onCancel.dispose();
+                  taskCaptureWaiter.delete(taskId);
                   resolve(code);
-                });
+                };
+                taskCaptureWaiter.set(taskId, done);
               });
 
               send(
@@ -1498,24 +1633,34 @@ export async function activate(context: vscode.ExtensionContext) {
                   (vscode.DocumentSymbol | vscode.SymbolInformation)[]
                 >("vscode.executeDocumentSymbolProvider", uri)) ?? [];
 
-              const items = res.map((s: any) => {
+              const flatten = (msg.params as any)?.flatten === true;
+              const items: any[] = [];
+              const add = (s: any, containerName: string | null) => {
                 if (s.location) {
-                  return {
+                  items.push({
                     name: s.name,
                     kind: s.kind,
                     containerName: s.containerName ?? null,
                     location: serializeLocation(s.location)
-                  };
+                  });
+                  return;
                 }
-                return {
+                const children = Array.isArray(s.children) ? s.children : [];
+                items.push({
                   name: s.name,
                   kind: s.kind,
                   detail: s.detail ?? null,
                   range: serializeRange(s.range),
                   selectionRange: serializeRange(s.selectionRange),
-                  children: Array.isArray(s.children) ? s.children.length : 0
-                };
-              });
+                  children: children.length,
+                  ...(flatten ? { containerName } : {})
+                });
+                // Parents first, so a flat list still reads as an outline.
+                if (flatten) {
+                  for (const child of children) add(child, s.name);
+                }
+              };
+              for (const s of res) add(s, null);
 
               send(ok(msg.id, { items }));
               return;
@@ -2234,16 +2379,26 @@ export async function activate(context: vscode.ExtensionContext) {
               }
 
               // Wait for debug session to terminate
+              const session = vscode.debug.activeDebugSession;
               const exitedCleanly = await new Promise<boolean>((resolve) => {
                 const timer = setTimeout(() => resolve(false), timeoutMs);
                 const disposable = vscode.debug.onDidTerminateDebugSession(
                   () => {
                     clearTimeout(timer);
                     disposable.dispose();
+                    onCancel.dispose();
                     resolve(true);
                   }
                 );
+                // The caller gave up: stop the session we started.
+                const onCancel = cancelToken.onCancellationRequested(() => {
+                  if (session) void vscode.debug.stopDebugging(session);
+                });
               });
+              if (cancelToken.isCancellationRequested) {
+                send(ok(msg.id, { started: true, exitedCleanly: false, diagnosticsAfter: [], failures: [] }));
+                return;
+              }
 
               // Small delay for diagnostics to settle
               // A 1-second delay is used here because VS Code diagnostics updates are eventual 
@@ -2287,10 +2442,46 @@ export async function activate(context: vscode.ExtensionContext) {
           send(err(msg.id, "E_FAILED", String(e)));
           return;
         }
+      };
+
+      socket.on("message", async (raw) => {
+        let msg: unknown;
+        try {
+          msg = JSON.parse(raw.toString("utf8"));
+        } catch {
+          socket.send(
+            JSON.stringify(err(null, "E_INVALID_PARAMS", "Invalid JSON"))
+          );
+          return;
+        }
+
+        // JSON-RPC 2.0 batch: run every request, reply with one array.
+        if (Array.isArray(msg)) {
+          if (msg.length === 0) {
+            socket.send(
+              JSON.stringify(err(null, "E_INVALID_PARAMS", "Empty batch"))
+            );
+            return;
+          }
+          const responses = await Promise.all(
+            msg.map(
+              (m) =>
+                new Promise<JsonRpcResponse>((resolve) => {
+                  void handleRequest(m, resolve);
+                })
+            )
+          );
+          socket.send(JSON.stringify(responses));
+          return;
+        }
+
+        await handleRequest(msg, (r) => socket.send(JSON.stringify(r)));
       });
 
       socket.on("close", () => {
         connected.delete(socket);
+        for (const running of inflight.values()) running.cancel();
+        inflight.clear();
         diagSubscribers.delete(socket);
         debugSubscribers.delete(socket);
         const subs = eventSubsBySocket.get(socket);
@@ -2343,6 +2534,28 @@ export async function activate(context: vscode.ExtensionContext) {
     })
   );
 
+  // Only workspace documents: output channels and other virtual documents
+  // change constantly (including from our own logging).
+  const isWorkspaceDoc = (doc: vscode.TextDocument) =>
+    doc.uri.scheme === "file" || doc.uri.scheme === "untitled";
+
+  context.subscriptions.push(
+    vscode.workspace.onDidChangeTextDocument((e) => {
+      if (!isWorkspaceDoc(e.document) || e.contentChanges.length === 0) return;
+      emitEvent("doc.changed", {
+        uri: e.document.uri.toString(),
+        version: e.document.version
+      });
+    })
+  );
+
+  context.subscriptions.push(
+    vscode.workspace.onDidSaveTextDocument((doc) => {
+      if (!isWorkspaceDoc(doc)) return;
+      emitEvent("doc.saved", { uri: doc.uri.toString(), version: doc.version });
+    })
+  );
+
   context.subscriptions.push(
     vscode.tasks.onDidEndTaskProcess((e) => {
       const taskId = executionToId.get(e.execution);
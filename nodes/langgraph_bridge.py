@@ -1,28 +1,167 @@
 """
-LangGraph starter node wrappers (minimal, no external deps).
+LangGraph node wrappers (minimal, no external deps).
+
+Nodes take `(state, config)` and return only the keys they write, which
+LangGraph merges into the graph state, so the state is never copied.
+Every node shares one bridge connection pool:
+
+- `config["configurable"]["bridge"]`, if set, is used as is (any object with
+  an async `call(method, params)`: a `BridgeConnectionPool`, a connected
+  `BridgeClient`, ...);
+- otherwise one `BridgeConnectionPool.from_workspace(port=...)` per event
+  loop and port is created and opened on first use and reused by every
+  later node. Call `close_shared_bridges()` before the loop ends (e.g. at
+  the end of the `asyncio.run()` main) to close its sockets.
 
 Usage idea (pseudo):
-  from nodes.langgraph_bridge import bridge_call
-  state = await bridge_call(state, method="bridge.capabilities", params={})
+  from nodes.langgraph_bridge import bridge_fanout_node, bridge_node
+
+  graph.add_node("caps", bridge_node("bridge.capabilities"))
+  graph.add_node("refs", bridge_fanout_node(lambda s: [
+      ("code.references", {"uri": u, "position": p}) for u, p in s["targets"]
+  ]))
+
+  async with BridgeConnectionPool.from_workspace(max_size=8) as pool:
+      await app.ainvoke(state, {"configurable": {"bridge": pool}})
+
+For `bridge_fanout` results to accumulate across nodes, declare the key with
+a list reducer, e.g. `Annotated[list, operator.add]`.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import asyncio
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple, Union
+
+from ai_native_vscode_bridge import BridgeConnectionPool, BridgeError
+
+Params = Optional[Dict[str, Any]]
+Call = Tuple[str, Params]
+ParamsFrom = Union[Params, Callable[[Mapping[str, Any]], Params]]
+CallsFrom = Union[Sequence[Call], Callable[[Mapping[str, Any]], Sequence[Call]]]
+
+CONFIG_KEY = "bridge"
+
+# event loop -> {port: pool being opened}; pools hold sockets bound to their
+# loop. A plain dict: the pools reference their loop, so weak keys would
+# never be collected. Entries of loops that have since closed are evicted on
+# the next lookup.
+_shared: Dict[asyncio.AbstractEventLoop, Dict[int, "asyncio.Future[BridgeConnectionPool]"]] = {}
+
+
+def _evict_closed_loops() -> None:
+    for loop in [loop for loop in _shared if loop.is_closed()]:
+        del _shared[loop]
+
+
+async def get_bridge(config: Optional[Mapping[str, Any]] = None, *, port: int = 57110, **pool_kwargs: Any) -> Any:
+    """
+    The bridge client for a node: `config["configurable"]["bridge"]` if
+    present, else the shared pool for this event loop and `port` (created
+    and opened on first use, so its health checks run; `pool_kwargs` only
+    apply then).
+    """
+    configured = ((config or {}).get("configurable") or {}).get(CONFIG_KEY)
+    if configured is not None:
+        return configured
+    _evict_closed_loops()
+    pools = _shared.setdefault(asyncio.get_running_loop(), {})
+    opening = pools.get(port)
+    if opening is None:
+        # Stored before it is opened, so concurrent first nodes share it
+        # instead of racing to create their own.
+        pool = BridgeConnectionPool.from_workspace(port=port, **pool_kwargs)
+        opening = pools[port] = asyncio.ensure_future(pool.open())
+    try:
+        return await asyncio.shield(opening)
+    except (BridgeError, OSError):
+        if pools.get(port) is opening:
+            del pools[port]  # the next node tries again
+        raise
+
+
+async def close_shared_bridges() -> None:
+    """Close the shared pools created for the running event loop."""
+    _evict_closed_loops()
+    pools = _shared.pop(asyncio.get_running_loop(), {})
+    opened = await asyncio.gather(*pools.values(), return_exceptions=True)
+    await asyncio.gather(
+        *(p.close() for p in opened if isinstance(p, BridgeConnectionPool)), return_exceptions=True
+    )
+
 
-from ai_native_vscode_bridge import BridgeClient
+def _params(params: ParamsFrom, state: Mapping[str, Any]) -> Params:
+    return params(state) if callable(params) else params
 
 
 async def bridge_call(
-    state: Dict[str, Any],
+    state: Mapping[str, Any],
+    config: Optional[Mapping[str, Any]] = None,
     *,
     method: str,
-    params: Optional[Dict[str, Any]] = None,
+    params: ParamsFrom = None,
     port: int = 57110,
+    key: str = "bridge:last",
 ) -> Dict[str, Any]:
-    client = BridgeClient.from_workspace(port=port)
-    result = await client.call(method, params)
-    state = dict(state)
-    state["bridge:last"] = {"method": method, "params": params or {}, "result": result}
-    return state
+    """
+    Call one bridge method and return `{key: {"method", "params", "result"}}`.
+
+    `params` may be a dict or `fn(state) -> dict`.
+    """
+    p = _params(params, state)
+    result = await (await get_bridge(config, port=port)).call(method, p)
+    return {key: {"method": method, "params": p or {}, "result": result}}
+
+
+async def bridge_fanout(
+    state: Mapping[str, Any],
+    config: Optional[Mapping[str, Any]] = None,
+    *,
+    calls: CallsFrom,
+    port: int = 57110,
+    key: str = "bridge:results",
+    concurrency: int = 16,
+) -> Dict[str, Any]:
+    """
+    Send many bridge calls concurrently and return `{key: [entry, ...]}`.
+
+    `calls` is a list of `(method, params)` or `fn(state) -> list`. Entries
+    keep the order of `calls`; each has `method`, `params` and either
+    `result` or `error` (`{"code", "message"}`), so one failed call does not
+    fail the node. At most `concurrency` calls are in flight; the shared
+    pool spreads them over its sockets.
+    """
+    todo = list(calls(state) if callable(calls) else calls)
+    bridge = await get_bridge(config, port=port)
+    gate = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(method: str, params: Params) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"method": method, "params": params or {}}
+        async with gate:
+            try:
+                entry["result"] = await bridge.call(method, params)
+            except BridgeError as e:
+                entry["error"] = {"code": e.code, "message": e.message}
+        return entry
+
+    return {key: list(await asyncio.gather(*(one(m, p) for m, p in todo)))}
+
+
+def bridge_node(method: str, params: ParamsFrom = None, *, key: str = "bridge:last", port: int = 57110):
+    """A ready-made LangGraph node for `bridge_call(method, params)`."""
+
+    async def node(state: Mapping[str, Any], config: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+        return await bridge_call(state, config, method=method, params=params, port=port, key=key)
+
+    node.__name__ = f"bridge_node[{method}]"
+    return node
+
+
+def bridge_fanout_node(calls: CallsFrom, *, key: str = "bridge:results", port: int = 57110, concurrency: int = 16):
+    """A ready-made LangGraph node for `bridge_fanout(calls)`."""
+
+    async def node(state: Mapping[str, Any], config: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+        return await bridge_fanout(state, config, calls=calls, port=port, key=key, concurrency=concurrency)
 
+    node.__name__ = "bridge_fanout_node"
+    return node
@@ -41,6 +41,7 @@ export type TextEdit = { range: Range; newText: string };
 
 export const METHODS = [
   "bridge.ping",
+  "bridge.cancel",
   "bridge.capabilities",
   "events.subscribe",
   "events.unsubscribe",
@@ -53,6 +54,7 @@ export const METHODS = [
   "tx.commit",
   "tx.rollback",
   "workspace.info",
+  "workspace.findFiles",
   "diagnostics.list",
   "diagnostics.subscribe",
   "diagnostics.fix.preview",
@@ -29,18 +29,164 @@ lines.push("# Source: docs/protocol-v1.json");
 lines.push("");
 lines.push("from __future__ import annotations");
 lines.push("");
-lines.push("from typing import Any, Dict, Optional");
+lines.push("from typing import Any, Awaitable, Dict, Optional");
 lines.push("");
-lines.push("from .client import BridgeClient");
+lines.push("# Every protocol method, sorted.");
+lines.push("METHODS = (");
+for (const m of methods) lines.push(`    ${JSON.stringify(m)},`);
+lines.push(")");
 lines.push("");
 lines.push("class BridgeMethodsMixin:");
+// Plain `def` returning `self.call(...)`: awaitable on clients, and a future on
+// `BridgeBatch`, whose `call` queues the request instead of sending it.
 for (const m of methods) {
   const py = toPyName(m);
-  lines.push(`    async def ${py}(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:`);
-  lines.push(`        return await self.call(${JSON.stringify(m)}, params)`);
+  lines.push(`    def ${py}(self, params: Optional[Dict[str, Any]] = None) -> Awaitable[Dict[str, Any]]:`);
+  lines.push(`        return self.call(${JSON.stringify(m)}, params)`);
   lines.push("");
 }
 lines.push("");
 
 await fs.writeFile(outPath, lines.join("\n") + "\n");
 console.log(`Wrote ${outPath}`);
+
+// ─── Typed models ───────────────────────────────────────────────────────────
+// Slotted dataclasses for every method's params and result, read straight from
+// the schema (the toolpack drops $defs). msgspec decodes frames directly into
+// them; the other codecs build them from dicts. Field names stay as on the wire.
+
+const schemaPath = path.join(root, "protocol", "schemas", "v1.json");
+const modelsPath = path.join(path.dirname(outPath), "generated_models.py");
+const schema = JSON.parse(await fs.readFile(schemaPath, "utf8"));
+const defs = schema.$defs ?? {};
+const specs = defs.MethodsSpec?.properties ?? {};
+
+const PY_KEYWORDS = new Set([
+  "False", "None", "True", "and", "as", "assert", "async", "await", "break",
+  "class", "continue", "def", "del", "elif", "else", "except", "finally", "for",
+  "from", "global", "if", "import", "in", "is", "lambda", "nonlocal", "not", "or",
+  "pass", "raise", "return", "try", "while", "with", "yield"
+]);
+const SKIP_FIELDS = new Set(["auth"]); // injected by the client
+
+const pascal = (s) =>
+  s
+    .split(/[._-]/)
+    .filter(Boolean)
+    .map((p) => p[0].toUpperCase() + p.slice(1))
+    .join("");
+
+const classes = []; // emitted in dependency order
+const classNames = new Set();
+
+const modelable = (node) =>
+  node?.type === "object" &&
+  node.properties &&
+  Object.keys(node.properties).some((k) => !SKIP_FIELDS.has(k)) &&
+  Object.keys(node.properties).every((k) => /^[A-Za-z_][A-Za-z0-9_]*$/.test(k) && !PY_KEYWORDS.has(k));
+
+function union(types) {
+  const nullable = types.includes("None");
+  const rest = [...new Set(types.filter((t) => t !== "None"))];
+  if (rest.length === 0) return "None";
+  if (rest.includes("Any")) return "Any";
+  const t = rest.length === 1 ? rest[0] : `Union[${rest.join(", ")}]`;
+  return nullable ? `Optional[${t}]` : t;
+}
+
+function pyType(node, ctx) {
+  if (!node || typeof node !== "object") return "Any";
+  if (node.$ref) {
+    const name = node.$ref.split("/").pop();
+    const def = defs[name];
+    if (modelable(def)) return defineClass(name, def);
+    return pyType(def, name);
+  }
+  if (node.const !== undefined) {
+    return { boolean: "bool", string: "str", number: Number.isInteger(node.const) ? "int" : "float" }[
+      typeof node.const
+    ] ?? "Any";
+  }
+  if (node.oneOf || node.anyOf) {
+    return union((node.oneOf ?? node.anyOf).map((v) => pyType(v, ctx)));
+  }
+  if (Array.isArray(node.type)) {
+    return union(node.type.map((t) => pyType({ ...node, type: t }, ctx)));
+  }
+  switch (node.type) {
+    case "string":
+      return "str";
+    case "integer":
+      return "int";
+    case "number":
+      return "float";
+    case "boolean":
+      return "bool";
+    case "null":
+      return "None";
+    case "array":
+      return `List[${node.items ? pyType(node.items, ctx.replace(/s$/, "")) : "Any"}]`;
+    case "object":
+      return modelable(node) ? defineClass(ctx, node) : "Dict[str, Any]";
+    default:
+      return "Any";
+  }
+}
+
+function defineClass(name, node) {
+  if (classNames.has(name)) return name;
+  classNames.add(name);
+  const required = new Set(node.required ?? []);
+  const fields = Object.entries(node.properties)
+    .filter(([key]) => !SKIP_FIELDS.has(key))
+    .map(([key, val]) => {
+      const t = pyType(val, name + pascal(key));
+      const req = required.has(key);
+      return { key, type: req || t.startsWith("Optional[") || t === "Any" ? t : `Optional[${t}]`, req };
+    });
+  // Required fields first: dataclass fields without defaults can't follow defaulted ones.
+  fields.sort((a, b) => Number(b.req) - Number(a.req));
+  classes.push({ name, fields });
+  return name;
+}
+
+const typed = [];
+for (const m of Object.keys(specs).sort()) {
+  const props = specs[m]?.properties ?? {};
+  const base = pascal(m);
+  const params = modelable(props.params) ? defineClass(`${base}Params`, props.params) : null;
+  const result = modelable(props.result) ? defineClass(`${base}Result`, props.result) : null;
+  typed.push({ m, params, result });
+}
+
+const out = [];
+out.push("# Generated file. Do not edit by hand.");
+out.push("# Source: protocol/schemas/v1.json");
+out.push("");
+out.push("from __future__ import annotations");
+out.push("");
+out.push("from dataclasses import dataclass");
+out.push("from typing import Any, Awaitable, Dict, List, Optional, Union");
+out.push("");
+for (const c of classes) {
+  out.push("");
+  out.push("@dataclass(slots=True)");
+  out.push(`class ${c.name}:`);
+  for (const f of c.fields) {
+    out.push(f.req ? `    ${f.key}: ${f.type}` : `    ${f.key}: ${f.type} = None`);
+  }
+  out.push("");
+}
+out.push("");
+out.push("class TypedBridgeMethodsMixin:");
+out.push("    # Same names as BridgeMethodsMixin; results are decoded into the models above.");
+for (const { m, params, result } of typed) {
+  const p = params ? `Union[${params}, Dict[str, Any], None]` : "Optional[Dict[str, Any]]";
+  const r = result ?? "Dict[str, Any]";
+  out.push(`    def ${toPyName(m)}(self, params: ${p} = None) -> Awaitable[${r}]:`);
+  out.push(`        return self.call_as(${JSON.stringify(m)}, params, ${result ?? "None"})`);
+  out.push("");
+}
+
+await fs.writeFile(modelsPath, out.join("\n") + "\n");
+console.log(`Wrote ${modelsPath} (${classes.length} models)`);
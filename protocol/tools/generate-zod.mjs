@@ -112,6 +112,19 @@ lines.push('});');
 lines.push('');
 lines.push('export const UriSchema = z.string().min(1);');
 lines.push('');
+lines.push('export const LocationSchema = z.object({');
+lines.push('  uri: UriSchema,');
+lines.push('  range: RangeSchema');
+lines.push('});');
+lines.push('');
+lines.push('export const DiagnosticSchema = z.object({');
+lines.push('  range: RangeSchema,');
+lines.push('  message: z.string(),');
+lines.push('  severity: z.number().int().min(0).max(3),');
+lines.push('  source: z.string().nullable().optional(),');
+lines.push('  code: z.union([z.null(), z.string(), z.number().int()]).optional()');
+lines.push('});');
+lines.push('');
 
 // Method-specific schemas
 lines.push('// ─── Method schemas ───');
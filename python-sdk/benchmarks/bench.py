@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+bench.py — SDK load tests against the in-process MockBridgeServer.
+
+No VS Code needed: every benchmark starts a `MockBridgeServer` on a free
+port and drives it through the public SDK. Results are written as JSON so
+runs can be compared between releases.
+
+Usage:
+    python benchmarks/bench.py                          # all benchmarks
+    python benchmarks/bench.py oneshot events -n 2000   # a subset
+    python benchmarks/bench.py --latency 0.001 --output results.json
+    python benchmarks/bench.py --baseline old.json      # show % change
+    python benchmarks/bench.py doc_read --bandwidth 100 # over a 100 Mbit/s link
+    python benchmarks/bench.py doc_read --bandwidth 100 --compression off
+
+Timings and memory come from separate passes: memory is the tracemalloc
+peak of a shorter run, so tracing overhead never skews latency. Server and
+client share the process and event loop, so absolute numbers include the
+mock's own cost; compare runs from the same machine. `--bandwidth` puts a
+throttling TCP proxy between client and mock to model a remote agent;
+every result reports payload vs wire bytes (see `BridgeTransport`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from ai_native_vscode_bridge import (
+    BridgeClient,
+    BridgeEventStream,
+    BridgeTransport,
+    GeneratedBridgeClient,
+)
+from ai_native_vscode_bridge.codec import get_codec
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+TOKEN = "bench-token"
+
+
+@dataclass
+class Target:
+    """Where a benchmark's clients connect: the mock, or a throttled link to it."""
+
+    server: MockBridgeServer
+    port: int
+    transport: BridgeTransport
+
+    def options(self) -> Dict[str, Any]:
+        return {"port": self.port, "token": TOKEN, "transport": self.transport}
+
+
+# A benchmark is `fn(target, n) -> per-operation latencies in seconds`.
+Bench = Callable[[Target, int], Awaitable[List[float]]]
+
+
+class ThrottledLink:
+    """
+    TCP proxy that forwards each direction at most `rate` bytes/s, so payload
+    size costs transfer time as it would between containers or hosts.
+    """
+
+    def __init__(self, upstream_port: int, rate: float):
+        self.upstream_port = upstream_port
+        self.rate = rate
+        self.port = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def __aenter__(self) -> "ThrottledLink":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _pipe(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while chunk := await reader.read(64 * 1024):
+                await asyncio.sleep(len(chunk) / self.rate)
+                writer.write(chunk)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        up_reader, up_writer = await asyncio.open_connection("127.0.0.1", self.upstream_port)
+        await asyncio.gather(self._pipe(reader, up_writer), self._pipe(up_reader, writer))
+
+
+def percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _timed(op: Callable[[], Awaitable[Any]], n: int, concurrency: int = 1) -> List[float]:
+    samples: List[float] = []
+
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            t0 = time.perf_counter()
+            await op()
+            samples.append(time.perf_counter() - t0)
+
+    share, extra = divmod(n, concurrency)
+    await asyncio.gather(*(worker(share + (i < extra)) for i in range(concurrency)))
+    return samples
+
+
+async def bench_oneshot(target: Target, n: int) -> List[float]:
+    """`BridgeClient.call` without `async with`: one connection per call."""
+    client = BridgeClient(**target.options())
+    return await _timed(lambda: client.call("bridge.ping"), n)
+
+
+async def bench_persistent(target: Target, n: int) -> List[float]:
+    """Sequential calls over one persistent socket."""
+    async with BridgeClient(**target.options()) as client:
+        return await _timed(lambda: client.call("bridge.ping"), n)
+
+
+async def bench_generated(target: Target, n: int) -> List[float]:
+    """`GeneratedBridgeClient` wrappers, 16 concurrent callers on one socket."""
+    params = {"uri": "file:///mock/a.py", "position": {"line": 1, "character": 2}}
+    async with GeneratedBridgeClient(**target.options()) as client:
+        return await _timed(lambda: client.code_references(params), n, concurrency=16)
+
+
+async def bench_events(target: Target, n: int) -> List[float]:
+    """`BridgeEventStream` delivery: emit `n` events, time each until consumed."""
+    samples: List[float] = []
+    async with BridgeEventStream(**target.options(), events=["doc.changed"]) as stream:
+
+        async def consume() -> None:
+            async for event in stream:
+                samples.append(time.perf_counter() - event["params"]["sentAt"])
+                if len(samples) == n:
+                    return
+
+        consumer = asyncio.create_task(consume())
+        for i in range(n):
+            params = {"uri": f"file:///mock/{i % 50}.py", "version": i}
+            await target.server.emit("doc.changed", {**params, "sentAt": time.perf_counter()})
+            if i % 100 == 99:
+                await asyncio.sleep(0)  # let the reader keep up, as a real server would
+        await consumer
+    return samples
+
+
+async def bench_doc_read(target: Target, n: int) -> List[float]:
+    """Whole-document `doc.read` of a large file (see --doc-lines)."""
+    async with BridgeClient(**target.options()) as client:
+        return await _timed(lambda: client.call("doc.read", {"uri": "file:///mock/big.py"}), n)
+
+
+async def bench_doc_stream(target: Target, n: int) -> List[float]:
+    """The same document through ranged `read_stream` windows."""
+
+    async def read_all() -> None:
+        async for _ in client.read_stream("file:///mock/big.py"):
+            pass
+
+    async with BridgeClient(**target.options()) as client:
+        return await _timed(read_all, n)
+
+
+BENCHMARKS: Dict[str, Bench] = {
+    "oneshot": bench_oneshot,
+    "persistent": bench_persistent,
+    "generated": bench_generated,
+    "events": bench_events,
+    "doc_read": bench_doc_read,
+    "doc_stream": bench_doc_stream,
+}
+
+# Large-payload benchmarks are much slower per operation.
+SCALE = {"doc_read": 0.1, "doc_stream": 0.1}
+
+
+async def run_one(name: str, n: int, args: argparse.Namespace) -> Dict[str, Any]:
+    n = max(1, int(n * SCALE.get(name, 1.0)))
+    large = name.startswith("doc_")
+
+    # "auto": what the SDK would pick for a remote host (--bandwidth) or localhost.
+    compression = {"on": True, "off": False}.get(args.compression, bool(args.bandwidth))
+
+    @contextlib.asynccontextmanager
+    async def target() -> AsyncIterator[Target]:
+        async with MockBridgeServer(
+            token=TOKEN,
+            latency=args.latency,
+            doc_lines=args.doc_lines if large else 200,
+            result_items=args.result_items,
+            transport=BridgeTransport(compression=compression),
+        ) as srv:
+            transport = BridgeTransport(compression=compression)
+            if not args.bandwidth:
+                yield Target(srv, srv.port, transport)
+                return
+            async with ThrottledLink(srv.port, args.bandwidth * 125_000) as link:
+                yield Target(srv, link.port, transport)
+
+    async with target() as t:
+        started = time.perf_counter()
+        samples = await BENCHMARKS[name](t, n)
+        elapsed = time.perf_counter() - started
+        transfer = t.transport.stats
+
+    tracemalloc.start()
+    try:
+        async with target() as t:
+            await BENCHMARKS[name](t, max(1, min(n, args.memory_ops)))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    payload = transfer.payload_bytes_sent + transfer.payload_bytes_received
+    wire = transfer.wire_bytes_sent + transfer.wire_bytes_received
+
+    return {
+        "ops": len(samples),
+        "seconds": round(elapsed, 4),
+        "opsPerSec": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        "p50Ms": round(percentile(samples, 0.50) * 1000, 3),
+        "p99Ms": round(percentile(samples, 0.99) * 1000, 3),
+        "maxMs": round(max(samples, default=0.0) * 1000, 3),
+        "peakMemoryKiB": round(peak / 1024, 1),
+        "payloadKiB": round(payload / 1024, 1),
+        "wireKiB": round(wire / 1024, 1),
+    }
+
+
+def _percent(part: float, whole: float) -> str:
+    return f"{part / whole:.0%}" if whole else "-"
+
+
+def _sdk_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("ai-native-bridge")
+    except Exception:
+        return "unknown"
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    print("\nvs baseline:")
+    for name, res in current["results"].items():
+        old = baseline.get("results", {}).get(name)
+        if not old:
+            continue
+        rate = (res["opsPerSec"] / old["opsPerSec"] - 1) * 100 if old["opsPerSec"] else 0.0
+        p99 = (res["p99Ms"] / old["p99Ms"] - 1) * 100 if old["p99Ms"] else 0.0
+        print(f"  {name:<11} ops/s {rate:+6.1f}%   p99 {p99:+6.1f}%")
+
+
+async def main_async(args: argparse.Namespace) -> Dict[str, Any]:
+    names = args.benchmarks or list(BENCHMARKS)
+    report: Dict[str, Any] = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "sdkVersion": _sdk_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "codec": get_codec().name,
+        "config": {
+            "n": args.n,
+            "latency": args.latency,
+            "docLines": args.doc_lines,
+            "resultItems": args.result_items,
+            "compression": args.compression,
+            "bandwidthMbit": args.bandwidth,
+        },
+        "results": {},
+    }
+    print(
+        f"{'benchmark':<12}{'ops':>8}{'ops/s':>12}{'p50 ms':>10}{'p99 ms':>10}"
+        f"{'peak KiB':>11}{'wire KiB':>11}{'wire %':>8}"
+    )
+    for name in names:
+        res = report["results"][name] = await run_one(name, args.n, args)
+        print(
+            f"{name:<12}{res['ops']:>8}{res['opsPerSec']:>12.1f}"
+            f"{res['p50Ms']:>10.3f}{res['p99Ms']:>10.3f}{res['peakMemoryKiB']:>11.1f}"
+            f"{res['wireKiB']:>11.1f}{_percent(res['wireKiB'], res['payloadKiB']):>8}"
+        )
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the Python SDK against a mock bridge.")
+    parser.add_argument(
+        "benchmarks", nargs="*", metavar="BENCHMARK",
+        help=f"Benchmarks to run: {', '.join(BENCHMARKS)} (default: all)",
+    )
+    parser.add_argument("-n", type=int, default=1000, help="Operations per benchmark (default: 1000)")
+    parser.add_argument(
+        "--latency", type=float, default=0.0,
+        help="Synthetic server latency per request, seconds (default: 0)",
+    )
+    parser.add_argument(
+        "--doc-lines", type=int, default=10_000,
+        help="Lines of 80 chars in the doc_* document (default: 10000, ~800 KB; "
+        "whole-document reads must fit the 100 MiB message limit)",
+    )
+    parser.add_argument("--result-items", type=int, default=10, help="Items per list result")
+    parser.add_argument(
+        "--bandwidth", type=float, default=0.0,
+        help="Throttle client<->mock traffic to this many Mbit/s per direction (default: off)",
+    )
+    parser.add_argument(
+        "--compression", choices=["auto", "on", "off"], default="auto",
+        help="permessage-deflate between client and mock (default: auto, i.e. on "
+        "with --bandwidth as for a remote host, off as for localhost)",
+    )
+    parser.add_argument(
+        "--memory-ops", type=int, default=200,
+        help="Operations in the tracemalloc pass (default: 200)",
+    )
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="Earlier JSON report to compare against")
+    args = parser.parse_args(argv)
+    unknown = [b for b in args.benchmarks if b not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    report = asyncio.run(main_async(args))
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            compare(report, json.load(f))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.output}")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
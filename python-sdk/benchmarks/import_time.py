@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+import_time.py — cold import cost of the SDK, measured in fresh interpreters.
+
+Each case runs in a new `python -c` process `-n` times and reports the min
+and median wall time of the import statement alone (interpreter startup is
+excluded). `--profile` also prints the slowest modules for one case from
+`python -X importtime`.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py -n 50 --output imports.json
+    python benchmarks/import_time.py --baseline old.json
+    python benchmarks/import_time.py --profile package
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+CASES: Dict[str, str] = {
+    "package": "import ai_native_vscode_bridge",
+    "client": "from ai_native_vscode_bridge import BridgeClient",
+    "generated": "from ai_native_vscode_bridge import GeneratedBridgeClient",
+    "typed": "from ai_native_vscode_bridge import TypedBridgeClient",
+    "pool": "from ai_native_vscode_bridge import BridgeConnectionPool",
+    "mock": "from ai_native_vscode_bridge.mock import MockBridgeServer",
+}
+
+_TIMER = (
+    "import time as _t; _s = _t.perf_counter(); {stmt}; "
+    "print(_t.perf_counter() - _s)"
+)
+
+
+def _run(stmt: str) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", _TIMER.format(stmt=stmt)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def measure(stmt: str, n: int) -> Dict[str, Any]:
+    samples = [_run(stmt) for _ in range(n)]
+    return {
+        "runs": n,
+        "minMs": round(min(samples) * 1000, 2),
+        "medianMs": round(statistics.median(samples) * 1000, 2),
+    }
+
+
+def profile(stmt: str, top: int) -> List[Tuple[str, int, int]]:
+    """Slowest modules by cumulative µs, from `python -X importtime`."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", stmt],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    rows: List[Tuple[str, int, int]] = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            rows.append((name.rstrip(), int(self_us), int(cumulative)))
+    return sorted(rows, key=lambda r: r[2], reverse=True)[:top]
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    print("\nvs baseline:")
+    for name, res in current["results"].items():
+        old = baseline.get("results", {}).get(name)
+        if not old or not old["medianMs"]:
+            continue
+        change = (res["medianMs"] / old["medianMs"] - 1) * 100
+        print(f"  {name:<10} median {old['medianMs']:>8.2f} -> {res['medianMs']:>8.2f} ms ({change:+6.1f}%)")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure cold import time of the Python SDK.")
+    parser.add_argument(
+        "cases", nargs="*", metavar="CASE",
+        help=f"Cases to run: {', '.join(CASES)} (default: all)",
+    )
+    parser.add_argument("-n", type=int, default=20, help="Fresh interpreters per case (default: 20)")
+    parser.add_argument("--profile", metavar="CASE", help="Print the slowest modules for CASE")
+    parser.add_argument("--top", type=int, default=15, help="Modules shown by --profile (default: 15)")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="Earlier JSON report to compare against")
+    args = parser.parse_args(argv)
+    unknown = [c for c in [*args.cases, *([args.profile] if args.profile else [])] if c not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+
+    if args.profile:
+        print(f"{'module':<60}{'self µs':>10}{'cumul. µs':>12}")
+        for name, self_us, cumulative in profile(CASES[args.profile], args.top):
+            print(f"{name:<60}{self_us:>10}{cumulative:>12}")
+        return
+
+    report: Dict[str, Any] = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {},
+    }
+    print(f"{'case':<12}{'min ms':>10}{'median ms':>12}")
+    for name in args.cases or list(CASES):
+        res = report["results"][name] = measure(CASES[name], args.n)
+        print(f"{name:<12}{res['minMs']:>10.2f}{res['medianMs']:>12.2f}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            compare(report, json.load(f))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,79 @@
-from .client import BridgeClient, BridgeEventStream, BridgeError
+"""
+Python SDK for the AI-Native VS Code bridge.
 
-__all__ = ["BridgeClient", "BridgeEventStream", "BridgeError"]
+Public names are loaded on first access (PEP 562), so `import
+ai_native_vscode_bridge` does not pull in asyncio, websockets or the
+generated models until a client is actually used.
+"""
 
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .cache import BridgeResultCache
+    from .limits import AdaptiveLimiter, RetryPolicy
+    from .client import (
+        BridgeBatch,
+        BridgeClient,
+        BridgeError,
+        BridgeEventStream,
+        BridgeTimeoutError,
+        GeneratedBridgeClient,
+    )
+    from .deadlines import deadline, time_left
+    from .diagnostics import DiagnosticsIndex
+    from .fanout import BridgeFanout, Shard
+    from .pool import BridgeConnectionPool
+    from .replay import RecordingTransport, ReplayTransport
+    from .symbols import SymbolEntry, SymbolIndex
+    from .sync import SyncBridgeClient
+    from .tracing import BridgeTracer, InMemoryExporter, OpenTelemetryExporter
+    from .transport import BridgeTransport, TransferStats
+    from .typed import TypedBridgeClient
+
+# Public name -> submodule that defines it.
+_EXPORTS: Dict[str, str] = {
+    "AdaptiveLimiter": ".limits",
+    "BridgeBatch": ".client",
+    "BridgeClient": ".client",
+    "BridgeConnectionPool": ".pool",
+    "BridgeEventStream": ".client",
+    "BridgeError": ".client",
+    "BridgeFanout": ".fanout",
+    "BridgeResultCache": ".cache",
+    "BridgeTimeoutError": ".client",
+    "BridgeTracer": ".tracing",
+    "BridgeTransport": ".transport",
+    "DiagnosticsIndex": ".diagnostics",
+    "GeneratedBridgeClient": ".client",
+    "InMemoryExporter": ".tracing",
+    "OpenTelemetryExporter": ".tracing",
+    "RecordingTransport": ".replay",
+    "ReplayTransport": ".replay",
+    "RetryPolicy": ".limits",
+    "Shard": ".fanout",
+    "SymbolEntry": ".symbols",
+    "SymbolIndex": ".symbols",
+    "SyncBridgeClient": ".sync",
+    "TransferStats": ".transport",
+    "TypedBridgeClient": ".typed",
+    "deadline": ".deadlines",
+    "time_left": ".deadlines",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_EXPORTS})
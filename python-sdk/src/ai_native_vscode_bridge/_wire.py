@@ -0,0 +1,149 @@
+"""websockets glue for `BridgeTransport` (imported only when a socket opens)."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+import websockets
+from websockets.asyncio.client import ClientConnection
+from websockets.asyncio.server import ServerConnection
+from websockets.extensions.permessage_deflate import (
+    ClientPerMessageDeflateFactory,
+    PerMessageDeflate,
+    ServerPerMessageDeflateFactory,
+)
+from websockets.frames import CTRL_OPCODES, Frame, Opcode
+
+from .tracing import frame_size
+
+if TYPE_CHECKING:
+    from .transport import BridgeTransport, TransferStats
+
+
+class _Deflate(PerMessageDeflate):
+    """permessage-deflate that sends messages under `threshold` bytes uncompressed."""
+
+    def __init__(self, base: PerMessageDeflate, threshold: int, stats: "TransferStats"):
+        super().__init__(
+            base.remote_no_context_takeover,
+            base.local_no_context_takeover,
+            base.remote_max_window_bits,
+            base.local_max_window_bits,
+            base.compress_settings,
+        )
+        self.threshold = threshold
+        self.stats = stats
+        self._raw = False
+
+    def encode(self, frame: Frame) -> Frame:
+        if frame.opcode in CTRL_OPCODES:
+            return frame
+        if frame.opcode is not Opcode.CONT:
+            # Decided per message: continuation frames follow the first one.
+            # A skipped message has no RSV1 bit, which RFC 7692 allows, and
+            # leaves the shared compression context untouched.
+            self._raw = len(frame.data) < self.threshold
+        if self._raw:
+            out = frame
+        else:
+            out = super().encode(frame)
+            if frame.opcode is not Opcode.CONT:
+                self.stats.compressed_sent += 1
+        self.stats.wire_bytes_sent += len(out.data)
+        return out
+
+    def decode(self, frame: Frame, *, max_size: Optional[int] = None) -> Frame:
+        out = super().decode(frame, max_size=max_size)
+        if frame.opcode not in CTRL_OPCODES:
+            self.stats.wire_bytes_received += len(frame.data)
+            if frame.rsv1:
+                self.stats.compressed_received += 1
+        return out
+
+
+class _ClientDeflateFactory(ClientPerMessageDeflateFactory):
+    def __init__(self, transport: "BridgeTransport"):
+        super().__init__(
+            client_max_window_bits=True,
+            compress_settings=transport._compress_settings(),
+        )
+        self.transport = transport
+
+    def process_response_params(
+        self, params: Sequence[Tuple[str, Optional[str]]], accepted_extensions: Sequence[Any]
+    ) -> PerMessageDeflate:
+        base = super().process_response_params(params, accepted_extensions)
+        return _Deflate(base, self.transport.threshold, self.transport.stats)
+
+
+class _ServerDeflateFactory(ServerPerMessageDeflateFactory):
+    def __init__(self, transport: "BridgeTransport"):
+        super().__init__(compress_settings=transport._compress_settings())
+        self.transport = transport
+
+    def process_request_params(
+        self, params: Sequence[Tuple[str, Optional[str]]], accepted_extensions: Sequence[Any]
+    ) -> Tuple[List[Tuple[str, Optional[str]]], PerMessageDeflate]:
+        response, base = super().process_request_params(params, accepted_extensions)
+        return response, _Deflate(base, self.transport.threshold, self.transport.stats)
+
+
+class _Metered:
+    """Counts messages and payload bytes; wire bytes too when nothing is negotiated."""
+
+    stats: "TransferStats"
+
+    def _deflated(self) -> bool:
+        return any(isinstance(ext, _Deflate) for ext in self.protocol.extensions)  # type: ignore[attr-defined]
+
+    async def send(self, message: Any, text: Optional[bool] = None) -> None:
+        await super().send(message, text=text)  # type: ignore[misc]
+        size = frame_size(message)
+        stats = self.stats
+        stats.messages_sent += 1
+        stats.payload_bytes_sent += size
+        if not self._deflated():
+            stats.wire_bytes_sent += size
+
+    async def recv(self, decode: Optional[bool] = None) -> Any:
+        message = await super().recv(decode)  # type: ignore[misc]
+        size = frame_size(message)
+        stats = self.stats
+        stats.messages_received += 1
+        stats.payload_bytes_received += size
+        if not self._deflated():
+            stats.wire_bytes_received += size
+        return message
+
+
+class _ClientConnection(_Metered, ClientConnection):
+    def __init__(self, *args: Any, stats: "TransferStats", **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.stats = stats
+
+
+class _ServerConnection(_Metered, ServerConnection):
+    def __init__(self, *args: Any, stats: "TransferStats", **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.stats = stats
+
+
+def connect(url: str, transport: "BridgeTransport") -> Any:
+    return websockets.connect(
+        url,
+        compression=None,
+        extensions=[_ClientDeflateFactory(transport)] if transport.compresses(url) else None,
+        max_size=transport.max_message_size,
+        create_connection=functools.partial(_ClientConnection, stats=transport.stats),  # type: ignore[arg-type]
+    )
+
+
+def server_options(transport: "BridgeTransport") -> Dict[str, Any]:
+    # The server cannot tell where clients are; "auto" leaves it to them.
+    return {
+        "compression": None,
+        "extensions": [_ServerDeflateFactory(transport)] if transport.compression else None,
+        "max_size": transport.max_message_size,
+        "create_connection": functools.partial(_ServerConnection, stats=transport.stats),
+    }
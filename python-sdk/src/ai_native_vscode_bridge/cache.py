@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterable, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+# Pure reads whose result only changes when a document changes.
+CACHEABLE_METHODS: FrozenSet[str] = frozenset(
+    {
+        "code.definitions",
+        "code.references",
+        "code.hover",
+        "code.symbols.document",
+        "doc.read",
+    }
+)
+
+# Event names (see `bridge.capabilities` → `events`) that mean a document changed.
+INVALIDATING_EVENTS: FrozenSet[str] = frozenset({"doc.changed", "doc.saved"})
+
+_Key = Tuple[str, str]
+
+
+def _normalize(params: Optional[Dict[str, Any]]) -> str:
+    # auth/meta never affect the result.
+    p = {k: v for k, v in (params or {}).items() if k not in ("auth", "meta")}
+    return json.dumps(p, sort_keys=True, separators=(",", ":"))
+
+
+def _uris(params: Optional[Dict[str, Any]], result: Any) -> Set[str]:
+    """URIs a cached result depends on: the requested one plus any it points at."""
+    out: Set[str] = set()
+    uri = (params or {}).get("uri")
+    if isinstance(uri, str):
+        out.add(uri)
+    items = result.get("items") if isinstance(result, dict) else None
+    for item in items if isinstance(items, list) else ():
+        if not isinstance(item, dict):
+            continue
+        for k in ("uri", "targetUri"):
+            if isinstance(item.get(k), str):
+                out.add(item[k])
+        loc = item.get("location")
+        if isinstance(loc, dict) and isinstance(loc.get("uri"), str):
+            out.add(loc["uri"])
+    return out
+
+
+class BridgeResultCache:
+    """
+    Opt-in LRU cache for read-only navigation RPCs.
+
+    Entries are keyed on method + params (minus `auth`/`meta`) and dropped
+    when any document they depend on changes, when `ttl` seconds pass, or
+    when the cache grows past `max_entries`. Feed it document events with
+    `handle_event()` or `follow(stream)`; an `events.gap` event (missed
+    events, see `BridgeEventStream(resume=True)`) clears the whole cache.
+    TTL is still the safety net for edits elsewhere that add new references
+    to a symbol.
+
+    Cached results are shared between callers; treat them as read-only.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        ttl: Optional[float] = 60.0,
+        methods: Iterable[str] = CACHEABLE_METHODS,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.methods = frozenset(methods)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # Bumped on every invalidation so in-flight reads can't cache stale data.
+        self.generation = 0
+        self._entries: "OrderedDict[_Key, Tuple[float, Any, Set[str]]]" = OrderedDict()
+        self._by_uri: Dict[str, Set[_Key]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def cacheable(self, method: str) -> bool:
+        return method in self.methods
+
+    def get(self, method: str, params: Optional[Dict[str, Any]]) -> Tuple[bool, Any]:
+        key = (method, _normalize(params))
+        entry = self._entries.get(key)
+        if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+            self._drop(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[1]
+
+    def put(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        result: Any,
+        *,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Store `result`; skipped if `generation` (read before the call) is stale."""
+        if generation is not None and generation != self.generation:
+            return
+        key = (method, _normalize(params))
+        self._drop(key)
+        uris = _uris(params, result)
+        self._entries[key] = (time.monotonic(), result, uris)
+        for uri in uris:
+            self._by_uri.setdefault(uri, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, uri: Optional[str] = None) -> int:
+        """Drop entries that depend on `uri` (or everything). Returns the count."""
+        self.generation += 1
+        if uri is None:
+            n = len(self._entries)
+            self._entries.clear()
+            self._by_uri.clear()
+        else:
+            keys = list(self._by_uri.get(uri, ()))
+            for key in keys:
+                self._drop(key)
+            n = len(keys)
+        self.invalidations += n
+        return n
+
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """Apply one `events.notification` payload ({seq, ts, name, params})."""
+        name = event.get("name")
+        if name == "events.gap":
+            self.invalidate()  # invalidations may have been missed
+            return
+        if name not in INVALIDATING_EVENTS:
+            return
+        uri = (event.get("params") or {}).get("uri")
+        if isinstance(uri, str):
+            self.invalidate(uri)
+
+    async def follow(self, events: AsyncIterable[Dict[str, Any]]) -> None:
+        """Invalidate from an event source (e.g. a `BridgeEventStream`) until it ends."""
+        async for event in events:
+            self.handle_event(event)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _drop(self, key: _Key) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for uri in entry[2]:
+            keys = self._by_uri.get(uri)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_uri[uri]
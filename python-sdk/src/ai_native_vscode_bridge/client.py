@@ -1,12 +1,40 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
+import itertools
 import os
-from dataclasses import dataclass
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
-import websockets
+from .codec import BridgeCodec, Frame, _to_wire, get_codec
+from .deadlines import _until
+from .tracing import frame_size
+from .transport import BridgeTransport
+
+if TYPE_CHECKING:
+    import websockets
+
+    from .cache import BridgeResultCache
+    from .limits import AdaptiveLimiter, RetryPolicy
+    from .tracing import BridgeTracer, CallRecord
 
 
 class BridgeError(Exception):
@@ -17,6 +45,68 @@ class BridgeError(Exception):
         self.data = data
 
 
+class BridgeTimeoutError(BridgeError):
+    """A call ran past its `timeout` or the enclosing `deadline()`; it was cancelled."""
+
+    def __init__(self, message: str, timeout: float):
+        super().__init__("E_FAILED", message, {"timeout": timeout})
+        self.timeout = timeout
+
+
+def _ws_connect(url: str, transport: BridgeTransport) -> Any:
+    # websockets is imported by the transport on first use, so
+    # `import ai_native_vscode_bridge` stays cheap for short-lived processes
+    # that never open a socket.
+    return transport.connect(url)
+
+
+def _closed_error(exc: BaseException, transport: BridgeTransport) -> BridgeError:
+    """The error for calls pending on a socket that died with `exc`."""
+    sent = getattr(exc, "sent", None)
+    if sent is not None and sent.code == 1009:  # we refused an oversized message
+        limit = transport.max_message_size
+        return BridgeError(
+            "E_FAILED",
+            f"Connection closed: response larger than max_message_size ({limit} bytes)",
+            {"maxMessageSize": limit},
+        )
+    return BridgeError("E_FAILED", "Connection closed")
+
+
+@contextlib.contextmanager
+def _connection_lost(transport: BridgeTransport) -> Iterator[None]:
+    """Raise a socket dropped mid-call as `BridgeError("E_FAILED")`, which `RetryPolicy` retries."""
+    from websockets.exceptions import ConnectionClosed  # loaded: a socket is (being) opened
+
+    try:
+        yield
+    except ConnectionClosed as e:
+        raise _closed_error(e, transport) from e
+
+
+# Token file path -> (mtime_ns, size, token); re-read only when the file changes.
+_token_cache: Dict[str, Tuple[int, int, str]] = {}
+
+
+def _read_token_file(path: Path) -> str:
+    key = os.path.abspath(path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        _token_cache.pop(key, None)
+        return ""
+    hit = _token_cache.get(key)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+    try:
+        with open(key, encoding="utf-8") as f:
+            tok = f.read().strip()
+    except OSError:
+        return ""
+    _token_cache[key] = (st.st_mtime_ns, st.st_size, tok)
+    return tok
+
+
 def _resolve_token(
     token: Optional[str],
     token_file: Optional[str],
@@ -29,17 +119,53 @@ def _resolve_token(
         return env
 
     base = Path(workspace_dir) if workspace_dir else Path.cwd()
-    p = Path(token_file) if token_file else (base / ".vscode" / "bridge.token")
-    try:
-        return p.read_text(encoding="utf-8").strip()
-    except OSError:
-        return ""
+    return _read_token_file(Path(token_file) if token_file else (base / ".vscode" / "bridge.token"))
+
+
+def _bridge_error(e: Dict[str, Any]) -> BridgeError:
+    return BridgeError(str(e.get("code")), str(e.get("message")), e.get("data"))
+
+
+def _result_or_raise(resp: Dict[str, Any]) -> Dict[str, Any]:
+    if "error" in resp and resp["error"]:
+        raise _bridge_error(resp["error"])
+    return resp["result"]
 
 
-@dataclass(frozen=True)
+# A response as delivered to a waiting call: the raw frame and/or the decoded
+# message (codecs may defer decoding; batch items only have the message).
+_Reply = Tuple[Optional[Frame], Any]
+
+
+# Mutable (socket, pending calls), so compared and hashed by identity.
+@dataclass(eq=False)
 class BridgeClient:
     """
-    One-shot async client: opens a new WebSocket per call (simple + robust).
+    Async JSON-RPC client.
+
+    Used directly, every `call()` opens a new WebSocket (simple + robust).
+    Used as `async with client:`, one WebSocket stays open: each request gets
+    its own id and a background reader resolves responses onto their futures,
+    so concurrent calls are pipelined over the same socket. If that socket
+    drops, calls waiting on it fail with `BridgeError("E_FAILED")` and the
+    next call reopens it (counted in `stats()["reconnects"]`); a call never
+    falls back to a one-shot socket until `close()`.
+
+    Pass `cache=BridgeResultCache()` to serve repeated read-only navigation
+    calls locally, `tracer=BridgeTracer()` to record per-method latency,
+    bytes and errors, `limiter=AdaptiveLimiter()` to cap concurrent calls
+    per method family as the extension's load allows, and
+    `retry=RetryPolicy()` to retry idempotent reads after transient errors.
+    Frames are encoded with `codec` (default: the fastest installed of
+    msgspec, orjson, stdlib json; see `stats()`). Sockets are opened through
+    `transport` (default: `BridgeTransport()`: permessage-deflate for
+    messages of 1 KiB or more on non-loopback hosts, 100 MiB message limit);
+    `stats()["transfer"]` reports bytes before and after compression.
+
+    `timeout` (seconds, default none) bounds every call; `call(...,
+    timeout=)` overrides it per call and `deadline()` bounds a whole block of
+    calls. A call that runs out of time raises `BridgeTimeoutError` and is
+    cancelled on the server with `bridge.cancel`.
     """
 
     port: int = 57110
@@ -47,14 +173,63 @@ class BridgeClient:
     token: str = ""
     token_file: Optional[str] = None
     workspace_dir: Optional[str] = None
+    cache: Optional["BridgeResultCache"] = field(default=None, repr=False, compare=False)
+    codec: Optional[BridgeCodec] = field(default=None, repr=False, compare=False)
+    tracer: Optional["BridgeTracer"] = field(default=None, repr=False, compare=False)
+    transport: Optional[BridgeTransport] = field(default=None, repr=False, compare=False)
+    limiter: Optional["AdaptiveLimiter"] = field(default=None, repr=False, compare=False)
+    retry: Optional["RetryPolicy"] = field(default=None, repr=False, compare=False)
+    timeout: Optional[float] = None
 
-    @staticmethod
+    _ws: Any = field(default=None, init=False, repr=False, compare=False)
+    _reader: Optional["asyncio.Task[None]"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _pending: Dict[int, "asyncio.Future[_Reply]"] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _ids: Iterator[int] = field(
+        default_factory=lambda: itertools.count(1), init=False, repr=False, compare=False
+    )
+    _batch: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+    _auth_params: Dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Fire-and-forget `bridge.cancel` sends, referenced until they finish.
+    _cancels: Set["asyncio.Task[None]"] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    # Set by connect(), cleared by close(): calls made while it is set go
+    # over the persistent socket, reopened if it dropped.
+    _persistent: bool = field(default=False, init=False, repr=False, compare=False)
+    _connect_lock: asyncio.Lock = field(
+        default_factory=asyncio.Lock, init=False, repr=False, compare=False
+    )
+    reconnects: int = field(default=0, init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.codec is None:
+            self.codec = get_codec()
+        if self.transport is None:
+            self.transport = BridgeTransport()
+        # Reused as-is for calls without params; never mutated.
+        self._auth_params = {"auth": {"token": self.token}}
+
+    @classmethod
     def from_workspace(
+        cls,
         *,
         port: int = 57110,
         token: Optional[str] = None,
         token_file: Optional[str] = None,
         workspace_dir: Optional[str] = None,
+        cache: Optional["BridgeResultCache"] = None,
+        codec: Optional[BridgeCodec] = None,
+        tracer: Optional["BridgeTracer"] = None,
+        transport: Optional[BridgeTransport] = None,
+        limiter: Optional["AdaptiveLimiter"] = None,
+        retry: Optional["RetryPolicy"] = None,
+        timeout: Optional[float] = None,
     ) -> "BridgeClient":
         tok = _resolve_token(token, token_file, workspace_dir)
         if not tok:
@@ -62,32 +237,531 @@ class BridgeClient:
                 "E_AUTH",
                 "Missing token. Provide token, set $BRIDGE_TOKEN, or create .vscode/bridge.token.",
             )
-        return BridgeClient(
-            port=port, token=tok, token_file=token_file, workspace_dir=workspace_dir
+        return cls(
+            port=port,
+            token=tok,
+            token_file=token_file,
+            workspace_dir=workspace_dir,
+            cache=cache,
+            codec=codec,
+            tracer=tracer,
+            transport=transport,
+            limiter=limiter,
+            retry=retry,
+            timeout=timeout,
         )
 
-    async def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        url = f"ws://{self.host}:{self.port}"
-        req_id = 1
-        payload = {
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests sent on the persistent socket and not yet answered."""
+        return len(self._pending)
+
+    def stats(self) -> Dict[str, Any]:
+        out = {
+            "codec": self.codec.name,
+            "connected": self.connected,
+            "inFlight": self.in_flight,
+            "reconnects": self.reconnects,
+            "transfer": self.transport.stats.to_dict(),
+        }
+        if self.limiter is not None:
+            out["limits"] = self.limiter.stats()
+        if self.retry is not None:
+            out["retry"] = self.retry.stats()
+        return out
+
+    def _payload(
+        self, req_id: int, method: str, params: Any, until: Optional[float] = None
+    ) -> Dict[str, Any]:
+        if params is not None and not isinstance(params, dict):
+            params = _to_wire(params)  # a generated *Params dataclass
+        if until is not None:
+            # The remaining budget, so the extension gives up on its own too.
+            left = max(1, int((until - time.monotonic()) * 1000))
+            meta = {**(params or {}).get("meta", {}), "timeoutMs": left}
+            params = {**(params or {}), "meta": meta}
+        auth = self._auth_params
+        return {
             "jsonrpc": "2.0",
             "id": req_id,
             "method": method,
-            "params": {**(params or {}), "auth": {"token": self.token}},
+            "params": {**params, "auth": auth["auth"]} if params else auth,
         }
-        async with websockets.connect(url) as ws:
-            await ws.send(json.dumps(payload))
-            raw = await ws.recv()
-        resp = json.loads(raw)
-        if "error" in resp and resp["error"]:
-            e = resp["error"]
-            raise BridgeError(str(e.get("code")), str(e.get("message")), e.get("data"))
-        return resp["result"]
+
+    async def connect(self) -> "BridgeClient":
+        """Open the persistent socket (no-op if already open)."""
+        if self._ws is None:
+            async with self._connect_lock:
+                if self._ws is None:
+                    self._ws = await _ws_connect(self.url, self.transport)
+                    self._reader = asyncio.create_task(self._read_loop(self._ws))
+        # Only once connected: a failed connect() leaves a one-shot client.
+        self._persistent = True
+        return self
+
+    async def _socket(self) -> Any:
+        """
+        The persistent socket, reopened once (under a lock, so concurrent
+        calls share the attempt) if it dropped since `connect()`; None for a
+        one-shot client. A failed reopen raises instead of falling back to
+        a socket per call.
+        """
+        if self._ws is None and self._persistent:
+            async with self._connect_lock:
+                if self._ws is None and self._persistent:
+                    try:
+                        self._ws = await _ws_connect(self.url, self.transport)
+                    except Exception as e:  # OSError or a websockets handshake error
+                        raise BridgeError(
+                            "E_FAILED",
+                            f"Connection to {self.url} lost and could not be reopened: {e}",
+                        ) from e
+                    self._reader = asyncio.create_task(self._read_loop(self._ws))
+                    self.reconnects += 1
+        return self._ws
+
+    async def close(self) -> None:
+        """Close the persistent socket and fail any calls still waiting on it."""
+        self._persistent = False
+        ws, reader = self._ws, self._reader
+        self._ws = None
+        self._reader = None
+        if reader is not None:
+            reader.cancel()
+            try:
+                await reader
+            except (asyncio.CancelledError, Exception):
+                pass
+        if ws is not None:
+            await ws.close()
+        self._fail_pending(BridgeError("E_FAILED", "Connection closed"))
+
+    async def __aenter__(self) -> "BridgeClient":
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _fail_pending(self, error: BaseException) -> None:
+        pending, self._pending = self._pending, {}
+        for fut in pending.values():
+            if not fut.done():
+                fut.set_exception(error)
+
+    async def _read_loop(self, ws: Any) -> None:
+        try:
+            async for raw in ws:
+                req_id, msg = self.codec.peek(raw)
+                if isinstance(msg, list):
+                    # Batch replies arrive as one array of responses.
+                    for resp in msg:
+                        self._resolve(resp.get("id"), None, resp)
+                elif req_id is not None:
+                    # Responses carry the request id; anything else is a notification.
+                    self._resolve(req_id, raw, msg)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = _closed_error(e, self.transport)
+        else:
+            error = BridgeError("E_FAILED", "Connection closed")
+        if self._ws is ws:
+            self._ws = None
+            self._reader = None
+        self._fail_pending(error)
+        # A frame we could not route leaves the socket open: close it. (No-op
+        # if the server closed it.)
+        try:
+            await ws.close()
+        except Exception:
+            pass
+
+    def _resolve(self, req_id: Any, raw: Optional[Frame], msg: Any) -> None:
+        fut = self._pending.pop(req_id, None)
+        if fut is not None and not fut.done():
+            fut.set_result((raw, msg))
+
+    def _decode(self, reply: _Reply) -> Dict[str, Any]:
+        raw, msg = reply
+        return _result_or_raise(msg if msg is not None else self.codec.loads(raw))
+
+    async def call(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Send one request; `timeout` (seconds) overrides the client's default."""
+        if self.tracer is None:
+            return await self._cached_call(method, params, None, timeout)
+        return await self._traced(method, self._cached_call, params, timeout=timeout)
+
+    async def _traced(self, method: str, fn: Any, *args: Any, **kwargs: Any) -> Any:
+        tracer = self.tracer
+        record = tracer.start(method)
+        try:
+            result = await fn(method, *args, record, **kwargs)
+        except BaseException as e:
+            tracer.finish(record, e)
+            raise
+        tracer.finish(record)
+        return result
+
+    async def _cached_call(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        record: Optional["CallRecord"],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        cache = self.cache
+        if cache is None or not cache.cacheable(method):
+            return await self._call(method, params, record, timeout)
+        hit, result = cache.get(method, params)
+        if hit:
+            if record is not None:
+                record.cached = True
+            return result
+        generation = cache.generation
+        result = await self._call(method, params, record, timeout)
+        cache.put(method, params, result, generation=generation)
+        return result
+
+    async def call_as(
+        self, method: str, params: Any, type_: Any, *, timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Like `call()`, but decode the result into `type_` (a dataclass or
+        msgspec Struct, e.g. one of `generated_models`). With the msgspec codec
+        the frame is decoded straight into `type_` without building
+        intermediate dicts. `params` may be a dict or a generated `*Params`
+        dataclass. Not cached.
+        """
+        if self.tracer is None:
+            return await self._call_as(method, params, type_, None, timeout)
+        return await self._traced(method, self._call_as, params, type_, timeout=timeout)
+
+    async def _call_as(
+        self,
+        method: str,
+        params: Any,
+        type_: Any,
+        record: Optional["CallRecord"],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        def decode(reply: _Reply) -> Any:
+            raw, msg = reply
+            try:
+                if msg is not None:
+                    return self.codec.convert(_result_or_raise(msg), type_)
+                result, error = self.codec.loads_response(raw, type_)
+            except (TypeError, ValueError) as e:  # the result doesn't fit `type_`
+                name = getattr(type_, "__name__", type_)
+                raise BridgeError("E_FAILED", f"{method} result does not match {name}: {e}") from e
+            if error:
+                raise _bridge_error(error)
+            return result
+
+        return await self._request(method, params, record, decode, timeout)
+
+    async def _call(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        record: Optional["CallRecord"] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        return await self._request(method, params, record, self._decode, timeout)
+
+    async def _request(
+        self,
+        method: str,
+        params: Any,
+        record: Optional["CallRecord"],
+        decode: Callable[[_Reply], Any],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """One request through the limiter, retried per `self.retry`, within its deadline."""
+        retry = self.retry
+        until = _until(self.timeout if timeout is None else timeout)
+        attempt = 0
+        while True:
+            try:
+                if until is None:
+                    return await self._attempt(method, params, record, decode, None)
+                return await self._bounded(
+                    method, until, self._attempt(method, params, record, decode, until)
+                )
+            except BridgeTimeoutError:
+                raise
+            except (BridgeError, OSError) as e:
+                if retry is None or not retry.should_retry(method, e, attempt):
+                    raise
+                delay = retry.delay(attempt)
+                if until is not None and time.monotonic() + delay >= until:
+                    raise
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _attempt(
+        self,
+        method: str,
+        params: Any,
+        record: Optional["CallRecord"],
+        decode: Callable[[_Reply], Any],
+        until: Optional[float],
+    ) -> Any:
+        limiter = self.limiter
+        if limiter is None:
+            return decode(await self._roundtrip(method, params, record, until))
+        async with limiter.slot(method):
+            return decode(await self._roundtrip(method, params, record, until))
+
+    async def _bounded(
+        self, method: str, until: float, attempt: Awaitable[Any], limited: bool = True
+    ) -> Any:
+        """
+        Await `attempt`, cancelling it (and the server's work) at `until`.
+        `limited=False` for work that took no limiter slot (a batch).
+        """
+        started = time.monotonic()
+        left = until - started
+        if left <= 0:
+            attempt.close()  # type: ignore[attr-defined]
+            raise BridgeTimeoutError(f"{method}: deadline already passed", 0.0)
+        try:
+            return await asyncio.wait_for(attempt, left)
+        except asyncio.TimeoutError:
+            if limited and self.limiter is not None:
+                # The slot saw a plain cancellation; a timeout is a load signal.
+                self.limiter.timed_out(method, time.monotonic() - started)
+            raise BridgeTimeoutError(
+                f"{method} timed out after {left:.3g}s", round(left, 3)
+            ) from None
+        except BridgeError as e:
+            if isinstance(e.data, dict) and e.data.get("cancelled"):
+                # The extension's copy of the budget (`meta.timeoutMs`) ran out first.
+                raise BridgeTimeoutError(
+                    f"{method} timed out after {left:.3g}s", round(left, 3)
+                ) from e
+            raise
+
+    async def _roundtrip(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        record: Optional["CallRecord"] = None,
+        until: Optional[float] = None,
+    ) -> _Reply:
+        if await self._socket() is None:
+            # A one-shot socket is closed if we give up, which cancels the
+            # request on the server.
+            frame = self.codec.dumps(self._payload(1, method, params, until))
+            with _connection_lost(self.transport):
+                async with _ws_connect(self.url, self.transport) as ws:
+                    await ws.send(frame)
+                    reply: _Reply = (await ws.recv(), None)
+            if record is not None:
+                record.bytes_sent += frame_size(frame)
+        else:
+            req_id = next(self._ids)
+            (reply,) = await self._exchange(
+                self._payload(req_id, method, params, until), [req_id], record
+            )
+        if record is not None:
+            record.bytes_received += frame_size(reply[0])
+        return reply
+
+    async def _exchange(
+        self, payload: Any, req_ids: List[int], record: Optional["CallRecord"] = None
+    ) -> List[_Reply]:
+        """Send one message on the persistent socket and wait for every listed id."""
+        loop = asyncio.get_running_loop()
+        futs = []
+        for req_id in req_ids:
+            fut: "asyncio.Future[_Reply]" = loop.create_future()
+            self._pending[req_id] = fut
+            futs.append(fut)
+        try:
+            frame = self.codec.dumps(payload)
+            if record is not None:
+                record.bytes_sent += frame_size(frame)
+            ws = self._ws
+            if ws is None:
+                raise BridgeError("E_FAILED", "Connection closed")
+            with _connection_lost(self.transport):
+                await ws.send(frame)
+            return list(await asyncio.gather(*futs))
+        except asyncio.CancelledError:
+            # Timed out or abandoned by the caller: stop the server's work.
+            # (gather() has cancelled the futures of unanswered ids.)
+            self._send_cancel([i for i, f in zip(req_ids, futs) if f.cancelled() or not f.done()])
+            raise
+        finally:
+            for req_id in req_ids:
+                self._pending.pop(req_id, None)
+
+    def _send_cancel(self, req_ids: List[int]) -> None:
+        ws = self._ws
+        if ws is None or not req_ids:
+            return
+        # Not registered in `_pending`: the reply is dropped by the reader.
+        frame = self.codec.dumps(self._payload(next(self._ids), "bridge.cancel", {"ids": req_ids}))
+        task = asyncio.ensure_future(ws.send(frame))
+        self._cancels.add(task)
+        task.add_done_callback(self._cancel_sent)
+
+    def _cancel_sent(self, task: "asyncio.Task[None]") -> None:
+        self._cancels.discard(task)
+        if not task.cancelled():
+            task.exception()  # the socket closed meanwhile: nothing left to cancel
+
+    async def read_stream(
+        self,
+        uri: str,
+        *,
+        chunk_lines: int = 2000,
+        start_line: int = 0,
+        end_line: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield a document as `doc.read` windows of `chunk_lines` lines.
+
+        Each item is a `doc.read` result with `text`, `startLine`, `endLine`
+        and `totalLines`; joining the `text` fields rebuilds the requested
+        lines. The next window is requested while the current one is being
+        consumed, so at most two windows are held at once (windows bypass the
+        result cache). Raises `BridgeError("E_FAILED")` if the document
+        version changes mid-stream.
+        """
+        if chunk_lines < 1:
+            raise ValueError("chunk_lines must be >= 1")
+
+        def fetch(start: int, stop: Optional[int]) -> "asyncio.Future[Dict[str, Any]]":
+            end = start + chunk_lines if stop is None else min(start + chunk_lines, stop)
+            return asyncio.ensure_future(
+                self._call("doc.read", {"uri": uri, "startLine": start, "endLine": end})
+            )
+
+        nxt: Optional["asyncio.Future[Dict[str, Any]]"] = fetch(start_line, end_line)
+        version = None
+        try:
+            while nxt is not None:
+                chunk = await nxt
+                nxt = None
+                if "totalLines" not in chunk:
+                    raise BridgeError(
+                        "E_UNSUPPORTED", "Server does not support ranged doc.read", {"uri": uri}
+                    )
+                if version is None:
+                    version = chunk["version"]
+                elif chunk["version"] != version:
+                    raise BridgeError(
+                        "E_FAILED",
+                        "Document changed while streaming",
+                        {"uri": uri, "expectedVersion": version, "actualVersion": chunk["version"]},
+                    )
+                stop = chunk["totalLines"] if end_line is None else min(end_line, chunk["totalLines"])
+                if chunk["endLine"] < stop:
+                    nxt = fetch(chunk["endLine"], stop)
+                yield chunk
+        finally:
+            if nxt is not None:
+                nxt.cancel()
+
+    def batch(self) -> "BridgeBatch":
+        """
+        Queue calls and send them together when the `async with` block exits.
+
+            async with client.batch() as b:
+                futs = [b.code_hover({"uri": uri, "position": p}) for p in positions]
+            hovers = [f.result() for f in futs]
+        """
+        return BridgeBatch(self)
+
+    async def supports_batch(self) -> bool:
+        """Whether the server advertises JSON-RPC batch arrays (cached)."""
+        if self._batch is None:
+            try:
+                caps = await self.call("bridge.capabilities")
+            except BridgeError:
+                caps = {}
+            self._batch = "batch" in (caps.get("features") or [])
+        return self._batch
+
+    async def _send_batch(self, items: List["_BatchItem"]) -> None:
+        if not items:
+            return
+        if await self._socket() is None:
+            # One-shot client: use a short-lived persistent sibling for the batch.
+            async with replace(self) as conn:
+                conn._batch = self._batch
+                await conn._send_batch(items)
+                self._batch = conn._batch
+            return
+
+        if not await self.supports_batch():
+            results = await asyncio.gather(
+                *(self.call(method, params) for method, params, _ in items),
+                return_exceptions=True,
+            )
+            for (_, _, fut), res in zip(items, results):
+                _settle(fut, res)
+            return
+
+        # One budget for the whole array, sent with every item.
+        until = _until(self.timeout)
+        budget = 0.0 if until is None else round(max(0.0, until - time.monotonic()), 3)
+        req_ids = [next(self._ids) for _ in items]
+        payload = [
+            self._payload(req_id, method, params, until)
+            for req_id, (method, params, _) in zip(req_ids, items)
+        ]
+        tracer = self.tracer
+        records = [tracer.start(method) for method, _, _ in items] if tracer else []
+        for record in records:
+            record.batch_size = len(items)
+        try:
+            exchange = self._exchange(payload, req_ids)
+            if until is None:
+                replies = await exchange
+            else:
+                replies = await self._bounded("batch", until, exchange, limited=False)
+        except BaseException as e:
+            for record in records:
+                tracer.finish(record, e)
+            if not isinstance(e, Exception):
+                raise
+            for _, _, fut in items:
+                _settle(fut, e)
+            return
+        for i, ((method, _, fut), reply) in enumerate(zip(items, replies)):
+            error: Optional[BridgeError] = None
+            try:
+                _settle(fut, self._decode(reply))
+            except BridgeError as e:
+                error = e
+                if until is not None and isinstance(e.data, dict) and e.data.get("cancelled"):
+                    # The extension's copy of the batch budget ran out first.
+                    error = BridgeTimeoutError(f"{method} timed out after {budget:.3g}s", budget)
+                    error.__cause__ = e
+                _settle(fut, error)
+            if records:
+                tracer.finish(records[i], error)
 
 
 try:
     from .generated_methods import BridgeMethodsMixin  # type: ignore
-except Exception:
+except ImportError:  # generated file not built yet
     class BridgeMethodsMixin:  # type: ignore
         pass
 
@@ -100,9 +774,165 @@ class GeneratedBridgeClient(BridgeMethodsMixin, BridgeClient):
     pass
 
 
+_BatchItem = Tuple[str, Optional[Dict[str, Any]], "asyncio.Future[Dict[str, Any]]"]
+
+
+def _settle(fut: "asyncio.Future[Any]", res: Any) -> None:
+    if fut.done():
+        return
+    if isinstance(res, BaseException):
+        fut.set_exception(res)
+    else:
+        fut.set_result(res)
+
+
+class BridgeBatch(BridgeMethodsMixin):
+    """
+    Collects calls and sends them as one JSON-RPC 2.0 batch array on exit.
+
+    `call()` (and every generated method) returns a future immediately. Each
+    future is resolved with its own result or `BridgeError`, so one failing
+    item does not fail the rest. Servers without batch support (per
+    `bridge.capabilities`) get the same requests pipelined individually.
+
+    The client's `timeout` and any enclosing `deadline()` bound the whole
+    batch: when it runs out, every item still in it fails with
+    `BridgeTimeoutError` and is cancelled on the server.
+    """
+
+    def __init__(self, sender: Any):
+        self._sender = sender
+        self._items: List[_BatchItem] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def call(
+        self, method: str, params: Optional[Dict[str, Any]] = None
+    ) -> "asyncio.Future[Dict[str, Any]]":
+        fut: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+        self._items.append((method, params, fut))
+        return fut
+
+    async def flush(self) -> None:
+        items, self._items = self._items, []
+        await self._sender._send_batch(items)
+
+    async def __aenter__(self) -> "BridgeBatch":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.flush()
+            return
+        items, self._items = self._items, []
+        for _, _, fut in items:
+            fut.cancel()
+
+
+OVERFLOW_POLICIES = ("block", "drop-oldest", "coalesce")
+
+
+class _EventQueue:
+    """
+    Bounded FIFO of event payloads with an overflow policy.
+
+    - "block": the socket reader waits for room (backpressure to the server).
+    - "drop-oldest": the oldest queued event is discarded.
+    - "coalesce": a queued event with the same name and `params.uri` is
+      replaced in place by the newer one; if the queue is still full the
+      oldest event is discarded.
+    """
+
+    def __init__(self, maxsize: int, overflow: str):
+        if maxsize < 1:
+            raise ValueError("max_queue must be >= 1")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.dropped = 0
+        self.coalesced = 0
+        self._items: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+        self._seq = itertools.count()
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def put(self, event: Dict[str, Any]) -> None:
+        """Queue `event`; dropped once the queue is closed (a blocked put returns)."""
+        if self._closed:
+            return
+        key: Any = next(self._seq)
+        if self.overflow == "coalesce":
+            uri = (event.get("params") or {}).get("uri")
+            if isinstance(uri, str):
+                key = (event.get("name"), uri)
+                if key in self._items:
+                    self._items[key] = event
+                    self.coalesced += 1
+                    return
+        while len(self._items) >= self.maxsize:
+            if self.overflow == "block":
+                self._writable.clear()
+                await self._writable.wait()
+                if self._closed:
+                    return
+                continue
+            self._items.popitem(last=False)
+            self.dropped += 1
+        self._items[key] = event
+        self._readable.set()
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """Next event; once closed and drained, None or the reader's error."""
+        while not self._items:
+            if self._closed:
+                if self._error is not None:
+                    raise self._error
+                return None
+            self._readable.clear()
+            await self._readable.wait()
+        _, event = self._items.popitem(last=False)
+        self._writable.set()
+        return event
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        if not self._closed:
+            self._closed = True
+            self._error = error
+        self._readable.set()
+        self._writable.set()
+
+
 class BridgeEventStream:
     """
     Persistent stream for events.*: yields `events.notification` payloads.
+
+    A background task reads the socket into a queue of at most `max_queue`
+    events, so a slow consumer never lets frames pile up unbounded. When the
+    queue is full, `overflow` decides: "block" (default; stop reading and let
+    the server buffer), "drop-oldest", or "coalesce" (keep only the latest
+    pending event per name + URI). See `stats()` for drop/coalesce counters.
+
+    With `resume=True` a dropped connection is re-opened with backoff and the
+    subscription picks up after `last_seq`, so nothing is lost or delivered
+    twice. If the extension restarted or its buffer already evicted the next
+    event, a synthetic `{"name": "events.gap", "seq": None, ...}` event is
+    queued first: treat it as "resync from scratch". Persist `last_seq` and
+    `epoch` and pass them back as `since_seq`/`epoch` to resume across runs.
+
+    Bursts of events compress well: the socket is opened through `transport`
+    like `BridgeClient`'s, and `stats()["transfer"]` shows the savings.
     """
 
     def __init__(
@@ -113,12 +943,37 @@ class BridgeEventStream:
         token: str,
         events: Optional[Sequence[str]] = None,
         replay: int = 0,
+        codec: Optional[BridgeCodec] = None,
+        transport: Optional[BridgeTransport] = None,
+        max_queue: int = 1000,
+        overflow: str = "block",
+        resume: bool = False,
+        since_seq: Optional[int] = None,
+        epoch: Optional[str] = None,
+        backoff_initial: float = 0.1,
+        backoff_max: float = 5.0,
     ):
         self.port = port
         self.host = host
         self.token = token
         self.events = list(events) if events else None
         self.replay = replay
+        self.codec = codec or get_codec()
+        self.transport = transport or BridgeTransport()
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.resume = resume
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        # Highest seq received and the server activation it belongs to.
+        self.last_seq = since_seq
+        self.epoch = epoch
+        self.received = 0
+        self.duplicates = 0
+        self.gaps = 0
+        self.reconnects = 0
+        self._queue = _EventQueue(max_queue, overflow)
+        self._reader: Optional["asyncio.Task[None]"] = None
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
         self._sub_id: Optional[str] = None
 
@@ -131,6 +986,12 @@ class BridgeEventStream:
         workspace_dir: Optional[str] = None,
         events: Optional[Sequence[str]] = None,
         replay: int = 0,
+        max_queue: int = 1000,
+        overflow: str = "block",
+        resume: bool = False,
+        since_seq: Optional[int] = None,
+        epoch: Optional[str] = None,
+        transport: Optional[BridgeTransport] = None,
     ) -> "BridgeEventStream":
         tok = _resolve_token(token, token_file, workspace_dir)
         if not tok:
@@ -138,50 +999,135 @@ class BridgeEventStream:
                 "E_AUTH",
                 "Missing token. Provide token, set $BRIDGE_TOKEN, or create .vscode/bridge.token.",
             )
-        return BridgeEventStream(port=port, token=tok, events=events, replay=replay)
+        return BridgeEventStream(
+            port=port,
+            token=tok,
+            events=events,
+            replay=replay,
+            max_queue=max_queue,
+            overflow=overflow,
+            resume=resume,
+            since_seq=since_seq,
+            epoch=epoch,
+            transport=transport,
+        )
 
-    async def __aenter__(self) -> "BridgeEventStream":
-        url = f"ws://{self.host}:{self.port}"
-        self._ws = await websockets.connect(url)
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "received": self.received,
+            "queued": len(self._queue),
+            "maxQueue": self.max_queue,
+            "overflow": self.overflow,
+            "dropped": self._queue.dropped,
+            "coalesced": self._queue.coalesced,
+            "lastSeq": self.last_seq,
+            "epoch": self.epoch,
+            "duplicates": self.duplicates,
+            "gaps": self.gaps,
+            "reconnects": self.reconnects,
+            "transfer": self.transport.stats.to_dict(),
+        }
+
+    async def _deliver(self, event: Dict[str, Any]) -> None:
+        seq = event.get("seq")
+        if isinstance(seq, int):
+            if self.last_seq is not None and seq <= self.last_seq:
+                self.duplicates += 1
+                return
+            self.last_seq = seq
+        self.received += 1
+        await self._queue.put(event)
+
+    async def _request(self, req_id: int, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request and read until its response (only before/after the reader runs)."""
+        assert self._ws is not None
         await self._ws.send(
-            json.dumps(
+            self.codec.dumps(
                 {
                     "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "events.subscribe",
+                    "id": req_id,
+                    "method": method,
+                    "params": {**params, "auth": {"token": self.token}},
+                }
+            )
+        )
+        while True:
+            msg = self.codec.loads(await self._ws.recv())
+            if msg.get("id") == req_id:
+                return _result_or_raise(msg)
+            # Older servers send replayed events before the subscribe response;
+            # once the stream is closing (unsubscribe) nobody reads them.
+            if msg.get("method") == "events.notification" and not self._queue.closed:
+                await self._deliver(msg.get("params", {}))
+
+    async def _subscribe(self) -> None:
+        self._ws = await _ws_connect(self.url, self.transport)
+        since = self.last_seq if self.resume else None
+        params: Dict[str, Any] = {"events": self.events}
+        if since is None:
+            params["replay"] = self.replay
+        else:
+            params["sinceSeq"] = since
+            if self.epoch is not None:
+                params["epoch"] = self.epoch
+        try:
+            result = await self._request(1, "events.subscribe", params)
+        except BaseException:
+            await self._ws.close()
+            raise
+        self._sub_id = result["subscriptionId"]
+        epoch = result.get("epoch")
+        latest = result.get("latestSeq")
+        # A new activation: a different epoch, or (resuming from `since_seq`
+        # alone) a sequence that went backwards.
+        restarted = (self.epoch is not None and epoch != self.epoch) or (
+            since is not None and isinstance(latest, int) and since > latest
+        )
+        if since is not None and (result.get("gap") or restarted or "latestSeq" not in result):
+            self.gaps += 1
+            await self._queue.put(
+                {
+                    "seq": None,
+                    "ts": int(time.time() * 1000),
+                    "name": "events.gap",
                     "params": {
-                        "events": self.events,
-                        "replay": self.replay,
-                        "auth": {"token": self.token},
+                        "sinceSeq": since,
+                        "oldestSeq": result.get("oldestSeq"),
+                        "restarted": restarted,
                     },
                 }
             )
-        )
-        raw = await self._ws.recv()
-        resp = json.loads(raw)
-        if "error" in resp and resp["error"]:
-            e = resp["error"]
-            raise BridgeError(str(e.get("code")), str(e.get("message")), e.get("data"))
-        self._sub_id = resp["result"]["subscriptionId"]
+        if restarted:
+            # A new activation numbers events from 1 again.
+            self.last_seq = None
+        self.epoch = epoch
+
+    async def __aenter__(self) -> "BridgeEventStream":
+        self._queue = _EventQueue(self.max_queue, self.overflow)
+        await self._subscribe()
+        self._reader = asyncio.create_task(self._read_loop())
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._reader = None
+        # Closed first: a full "block" queue must not stall the unsubscribe.
+        self._queue.close()
         if self._ws and self._sub_id:
-            await self._ws.send(
-                json.dumps(
-                    {
-                        "jsonrpc": "2.0",
-                        "id": 2,
-                        "method": "events.unsubscribe",
-                        "params": {
-                            "subscriptionId": self._sub_id,
-                            "auth": {"token": self.token},
-                        },
-                    }
-                )
-            )
             try:
-                await self._ws.recv()
+                await asyncio.wait_for(
+                    self._request(2, "events.unsubscribe", {"subscriptionId": self._sub_id}),
+                    timeout=2.0,
+                )
             except Exception:
                 pass
         if self._ws:
@@ -189,6 +1135,41 @@ class BridgeEventStream:
         self._ws = None
         self._sub_id = None
 
+    async def _read_loop(self) -> None:
+        while True:
+            error: Exception
+            try:
+                assert self._ws is not None
+                async for raw in self._ws:
+                    msg = self.codec.loads(raw)
+                    # Expect notifications without id.
+                    if msg.get("method") == "events.notification":
+                        await self._deliver(msg.get("params", {}))
+                error = BridgeError("E_FAILED", "Event stream closed by server")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                error = e
+            if not self.resume:
+                self._queue.close(error)
+                return
+            await self._reconnect()
+
+    async def _reconnect(self) -> None:
+        self._sub_id = None
+        delay = self.backoff_initial
+        while True:
+            await asyncio.sleep(delay * (0.5 + random.random() / 2))
+            delay = min(delay * 2, self.backoff_max)
+            try:
+                await self._subscribe()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # OSError, handshake or auth errors while the extension restarts
+                continue
+            self.reconnects += 1
+            return
+
     def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
         return self._iter()
 
@@ -196,8 +1177,7 @@ class BridgeEventStream:
         if not self._ws:
             raise RuntimeError("BridgeEventStream not connected; use `async with`.")
         while True:
-            raw = await self._ws.recv()
-            msg = json.loads(raw)
-            # Expect notifications without id.
-            if msg.get("method") == "events.notification":
-                yield msg.get("params", {})
+            event = await self._queue.get()
+            if event is None:
+                return
+            yield event
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+from dataclasses import fields, is_dataclass
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+Frame = Union[str, bytes]
+
+_T = TypeVar("_T")
+
+
+_hints: Dict[Any, Dict[str, Any]] = {}
+
+
+def _field_hints(type_: Any) -> Dict[str, Any]:
+    hints = _hints.get(type_)
+    if hints is None:
+        try:
+            hints = get_type_hints(type_)
+        except Exception:  # unresolvable annotations: keep nested values as-is
+            hints = {}
+        hints = _hints[type_] = {f.name: hints.get(f.name, Any) for f in fields(type_)}
+    return hints
+
+
+def _convert(obj: Any, type_: Any) -> Any:
+    """Build a typed result from an already-decoded value (non-msgspec path)."""
+    if type_ is None or type_ is Any or obj is None:
+        return obj
+    origin = get_origin(type_)
+    if origin is Union:
+        for arg in get_args(type_):
+            if isinstance(obj, dict) and is_dataclass(arg) or isinstance(obj, list) and get_origin(arg) is list:
+                return _convert(obj, arg)
+        return obj
+    if origin is list:
+        (item,) = get_args(type_) or (Any,)
+        return obj if item is Any or not isinstance(obj, list) else [_convert(x, item) for x in obj]
+    if not isinstance(obj, dict):
+        return obj
+    from_dict = getattr(type_, "from_dict", None)
+    if callable(from_dict):
+        return from_dict(obj)
+    if is_dataclass(type_):
+        hints = _field_hints(type_)
+        return type_(**{k: _convert(v, hints[k]) for k, v in obj.items() if k in hints})
+    return obj
+
+
+def _to_wire(obj: Any) -> Any:
+    """Params dataclass -> JSON-ready dict; unset (None) fields are left out."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            f.name: _to_wire(v) for f in fields(obj) if (v := getattr(obj, f.name)) is not None
+        }
+    if isinstance(obj, list):
+        return [_to_wire(x) for x in obj]
+    return obj
+
+
+class BridgeCodec:
+    """
+    JSON codec used for every frame. This base class is the stdlib fallback.
+
+    `peek()` is what the persistent reader calls to route a frame to its
+    request id; codecs that can find the id without materialising the whole
+    message return `None` as the message and let the caller decode later,
+    possibly straight into a typed result via `loads_response()`.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    def loads(self, data: Frame) -> Any:
+        return json.loads(data)
+
+    def peek(self, data: Frame) -> Tuple[Any, Any]:
+        """Return `(id, message)`; `message` may be None if decoding was deferred."""
+        msg = self.loads(data)
+        return (msg.get("id") if isinstance(msg, dict) else None), msg
+
+    def convert(self, obj: Any, type_: Any) -> Any:
+        return _convert(obj, type_)
+
+    def loads_response(
+        self, data: Frame, type_: Any
+    ) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Decode a response frame into `(typed result, error)`."""
+        msg = self.loads(data)
+        if msg.get("error"):
+            return None, msg["error"]
+        return self.convert(msg.get("result"), type_), None
+
+
+class OrjsonCodec(BridgeCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> str:
+        # Text frames: the extension treats every message as UTF-8 JSON text.
+        return self._dumps(obj).decode("utf-8")
+
+    def loads(self, data: Frame) -> Any:
+        return self._loads(data)
+
+
+class MsgspecCodec(BridgeCodec):
+    """
+    msgspec codec. Routing only decodes the `id` field, and `loads_response()`
+    decodes results straight into msgspec Structs or dataclasses without
+    building intermediate dicts.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        class _Head(msgspec.Struct):
+            id: Any = None
+
+        class _Response(msgspec.Struct, Generic[_T]):
+            result: Optional[_T] = None
+            error: Optional[Dict[str, Any]] = None
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._head = msgspec.json.Decoder(Union[_Head, List[Dict[str, Any]]])
+        self._response = _Response
+        self._typed: Dict[Any, Any] = {}
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode("utf-8")
+
+    def loads(self, data: Frame) -> Any:
+        return self._decoder.decode(data)
+
+    def peek(self, data: Frame) -> Tuple[Any, Any]:
+        head = self._head.decode(data)
+        if isinstance(head, list):
+            return None, head
+        return head.id, None
+
+    def convert(self, obj: Any, type_: Any) -> Any:
+        if type_ is None or type_ is Any:
+            return obj
+        return self._msgspec.convert(obj, type_)
+
+    def loads_response(
+        self, data: Frame, type_: Any
+    ) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        dec = self._typed.get(type_)
+        if dec is None:
+            dec = self._typed[type_] = self._msgspec.json.Decoder(self._response[type_])
+        resp = dec.decode(data)
+        return resp.result, resp.error
+
+
+CODECS: Dict[str, Type[BridgeCodec]] = {
+    "msgspec": MsgspecCodec,
+    "orjson": OrjsonCodec,
+    "json": BridgeCodec,
+}
+
+
+_default: Optional[BridgeCodec] = None
+
+
+def get_codec(name: Optional[str] = None) -> BridgeCodec:
+    """
+    Return codec `name`, or the fastest installed one (msgspec, orjson, json).
+
+    The auto-selected codec is created once and shared.
+    """
+    global _default
+    if name is not None:
+        if name not in CODECS:
+            raise ValueError(f"Unknown codec {name!r}; expected one of {sorted(CODECS)}")
+        return CODECS[name]()
+    if _default is None:
+        for cls in CODECS.values():
+            try:
+                _default = cls()
+                break
+            except ImportError:
+                continue
+    return _default or BridgeCodec()
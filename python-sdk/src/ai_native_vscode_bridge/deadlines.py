@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# time.monotonic() by which every bridge call in this context must finish.
+_deadline: ContextVar[Optional[float]] = ContextVar("bridge_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound every bridge call made inside the block to finish within `seconds`.
+
+    The deadline is stored in a context variable, so it carries into nested
+    calls and into tasks started inside the block (`asyncio.gather`,
+    `create_task`). An inner `deadline()` can only shorten it:
+
+        with deadline(30):                     # the whole plan
+            refs = await client.call("code.references", params)
+            with deadline(5):                  # this step, and still <= 30 s total
+                await client.call("code.hover", params)
+
+    A call that would run past the deadline raises `BridgeTimeoutError`, is
+    cancelled on the server (`bridge.cancel`), and is never retried. The
+    remaining budget is also sent as `meta.timeoutMs`, so the extension
+    stops the work on its own if the cancel never arrives.
+    """
+    until = time.monotonic() + seconds
+    outer = _deadline.get()
+    token = _deadline.set(until if outer is None else min(outer, until))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def time_left() -> Optional[float]:
+    """Seconds until the current `deadline()` (may be <= 0), or None if there is none."""
+    until = _deadline.get()
+    return None if until is None else until - time.monotonic()
+
+
+def _until(timeout: Optional[float]) -> Optional[float]:
+    """Monotonic time a call must finish by: `timeout` from now or the deadline, whichever is first."""
+    until = _deadline.get()
+    if timeout is not None:
+        own = time.monotonic() + timeout
+        until = own if until is None else min(until, own)
+    return until
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import asyncio
+from array import array
+from collections import OrderedDict
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .client import BridgeError
+
+# `Diagnostic.severity` values (vscode.DiagnosticSeverity).
+ERROR, WARNING, INFORMATION, HINT = 0, 1, 2, 3
+SEVERITY_NAMES: Tuple[str, ...] = ("error", "warning", "information", "hint")
+_LEVELS = len(SEVERITY_NAMES)
+
+
+def _severity(severity: Any) -> int:
+    if isinstance(severity, str):
+        return SEVERITY_NAMES.index(severity)
+    if not isinstance(severity, int) or not 0 <= severity < _LEVELS:
+        raise ValueError(f"severity must be 0-3 or one of {SEVERITY_NAMES}")
+    return severity
+
+
+def _tally(diagnostics: List[Dict[str, Any]]) -> List[int]:
+    counts = [0] * _LEVELS
+    for d in diagnostics:
+        sev = d.get("severity")
+        if isinstance(sev, int) and 0 <= sev < _LEVELS:
+            counts[sev] += 1
+    return counts
+
+
+class DiagnosticsIndex:
+    """
+    Workspace diagnostics kept current from events instead of polling.
+
+    `load()` fetches one full `diagnostics.list`. After that, each
+    `diagnostics.changed` event (`handle_event()` / `follow(stream)`) marks
+    its URI dirty, and after `debounce` seconds the dirty URIs are re-fetched
+    with `diagnostics.list {uri}` in JSON-RPC batches of `batch_size`, so a
+    watcher downloads only the files that changed instead of the whole
+    workspace each time.
+
+    Per-severity counts live in one flat `array` (four counters per file)
+    plus running totals, so `count()`, `counts()` and `files_above()` never
+    walk the diagnostics themselves. Every applied change bumps `version`;
+    `changed_since(v)` lists the files that changed after version `v`
+    without scanning the rest. Re-fetches that return the same diagnostics
+    are not changes.
+
+        index = DiagnosticsIndex(client)
+        await index.load()
+        async with BridgeEventStream.from_workspace(
+            events=["diagnostics.changed"], overflow="coalesce", resume=True
+        ) as events:
+            asyncio.create_task(index.follow(events))
+            seen = index.version
+            ...
+            await index.flush()
+            for uri in index.changed_since(seen):
+                print(uri, index.counts(uri))
+
+    An `events.gap` event (see `BridgeEventStream(resume=True)`) schedules a
+    full reload, diffed against what is held so `changed_since()` stays
+    exact. `client` is a `BridgeClient` or `BridgeConnectionPool`.
+    """
+
+    def __init__(self, client: Any = None, *, debounce: float = 0.2, batch_size: int = 256):
+        self.client = client
+        self.debounce = debounce
+        self.batch_size = max(1, batch_size)
+        self.version = 0
+        self.fetched = 0
+        self.failures = 0
+        self.reloads = 0
+        self._uris: List[str] = []
+        self._slots: Dict[str, int] = {}
+        self._counts = array("I")  # _LEVELS counters per slot
+        self._totals = [0] * _LEVELS
+        self._items: Dict[int, List[Dict[str, Any]]] = {}  # slot -> diagnostics, if any
+        self._changed: "OrderedDict[str, int]" = OrderedDict()  # uri -> version, oldest first
+        self._dirty: Set[str] = set()
+        self._generations: Dict[str, int] = {}
+        self._reload = False
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    def __len__(self) -> int:
+        """Number of files with at least one diagnostic."""
+        return len(self._items)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "files": len(self._items),
+            "diagnostics": sum(self._totals),
+            "version": self.version,
+            "pending": len(self._dirty) + len(self._tasks),
+            "fetched": self.fetched,
+            "failures": self.failures,
+            "reloads": self.reloads,
+        }
+
+    # ── queries ───────────────────────────────────────────────────────
+
+    def count(self, severity: Any = None, uri: Optional[str] = None) -> int:
+        """Diagnostics of `severity` (0-3 or a name; None = all), in `uri` or the workspace."""
+        if uri is None:
+            return sum(self._totals) if severity is None else self._totals[_severity(severity)]
+        slot = self._slots.get(uri)
+        if slot is None:
+            return 0
+        base = slot * _LEVELS
+        if severity is None:
+            return sum(self._counts[base : base + _LEVELS])
+        return self._counts[base + _severity(severity)]
+
+    def counts(self, uri: Optional[str] = None) -> Dict[str, int]:
+        """`{"error": n, "warning": n, "information": n, "hint": n}` for `uri` or the workspace."""
+        if uri is None:
+            values: Iterable[int] = self._totals
+        else:
+            slot = self._slots.get(uri)
+            values = [0] * _LEVELS if slot is None else self._counts[slot * _LEVELS : (slot + 1) * _LEVELS]
+        return dict(zip(SEVERITY_NAMES, values))
+
+    def files_above(self, threshold: int = 0, severity: Any = ERROR) -> List[Tuple[str, int]]:
+        """`(uri, count)` of files with more than `threshold` diagnostics of `severity`, most first."""
+        column = self._counts[_severity(severity) :: _LEVELS]
+        uris = self._uris
+        hits = [(uris[slot], n) for slot, n in enumerate(column) if n > threshold]
+        hits.sort(key=lambda hit: (-hit[1], hit[0]))
+        return hits
+
+    def changed_since(self, version: int) -> List[str]:
+        """URIs whose diagnostics changed after `version` (cleared files included), oldest first."""
+        out: List[str] = []
+        for uri, changed in reversed(self._changed.items()):
+            if changed <= version:
+                break
+            out.append(uri)
+        out.reverse()
+        return out
+
+    def diagnostics(self, uri: str) -> List[Dict[str, Any]]:
+        """The diagnostics last seen for `uri` (a copy of the list)."""
+        slot = self._slots.get(uri)
+        return list(self._items.get(slot, ())) if slot is not None else []
+
+    def uris(self) -> List[str]:
+        """Files with at least one diagnostic."""
+        uris = self._uris
+        return [uris[slot] for slot in self._items]
+
+    # ── loading and refreshing ────────────────────────────────────────
+
+    async def load(self) -> int:
+        """Fetch every file's diagnostics in one call; returns the number of files with any."""
+        self._reload = False
+        generations = dict(self._generations)
+        result = await self._client().call("diagnostics.list")
+        self.fetched += 1
+        # Files that changed while the snapshot was in flight are refreshed
+        # on their own; the snapshot may be older than that refresh.
+        moved = {u for u, g in self._generations.items() if generations.get(u, 0) != g}
+        seen: Set[str] = set()
+        for item in result.get("items") or ():
+            uri = item.get("uri")
+            if isinstance(uri, str):
+                seen.add(uri)
+                if uri not in moved:
+                    self.apply(uri, item.get("diagnostics") or [])
+        for uri in [u for u in self.uris() if u not in seen and u not in moved]:
+            self.apply(uri, [])  # cleared while we were not looking
+        return len(self._items)
+
+    async def refresh(self, uris: Iterable[str]) -> None:
+        """Re-fetch the diagnostics of `uris` now, in batches."""
+        uris = list(dict.fromkeys(uris))
+        generations = {uri: self._generations.get(uri, 0) for uri in uris}
+        client = self._client()
+        for start in range(0, len(uris), self.batch_size):
+            chunk = uris[start : start + self.batch_size]
+            try:
+                async with client.batch() as batch:
+                    futs = [batch.call("diagnostics.list", {"uri": uri}) for uri in chunk]
+            except (BridgeError, OSError):
+                self.failures += len(chunk)
+                continue
+            for uri, fut in zip(chunk, futs):
+                try:
+                    result = fut.result()
+                except BridgeError:
+                    self.failures += 1
+                    continue
+                self.fetched += 1
+                if self._generations.get(uri, 0) != generations[uri]:
+                    continue  # changed again meanwhile; a newer refresh is scheduled
+                items = result.get("items") or ()
+                self.apply(uri, (items[0].get("diagnostics") or []) if items else [])
+
+    def apply(self, uri: str, diagnostics: List[Dict[str, Any]]) -> bool:
+        """Replace `uri`'s diagnostics; returns whether anything changed."""
+        slot = self._slots.get(uri)
+        if slot is None:
+            if not diagnostics:
+                return False
+            slot = self._slots[uri] = len(self._uris)
+            self._uris.append(uri)
+            self._counts.extend([0] * _LEVELS)
+        elif self._items.get(slot, []) == diagnostics:
+            return False
+        base = slot * _LEVELS
+        for sev, n in enumerate(_tally(diagnostics)):
+            self._totals[sev] += n - self._counts[base + sev]
+            self._counts[base + sev] = n
+        if diagnostics:
+            self._items[slot] = list(diagnostics)
+        else:
+            self._items.pop(slot, None)
+        self.version += 1
+        self._changed[uri] = self.version
+        self._changed.move_to_end(uri)
+        return True
+
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """Apply one `events.notification` payload; schedules a debounced refresh."""
+        name = event.get("name")
+        if name == "events.gap":
+            self._reload = True
+        elif name == "diagnostics.changed":
+            uri = (event.get("params") or {}).get("uri")
+            if not isinstance(uri, str):
+                return
+            self._generations[uri] = self._generations.get(uri, 0) + 1
+            self._dirty.add(uri)
+        else:
+            return
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.debounce, self._start_refresh)
+
+    async def follow(self, events: AsyncIterable[Dict[str, Any]]) -> None:
+        """Keep the index current from an event source (e.g. a `BridgeEventStream`)."""
+        async for event in events:
+            self.handle_event(event)
+
+    async def flush(self) -> None:
+        """Run the debounced refresh now and wait for all in-flight ones."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._start_refresh()
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def close(self) -> None:
+        """Cancel pending refreshes."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for task in self._tasks:
+            task.cancel()
+        self._dirty.clear()
+
+    # ── internals ─────────────────────────────────────────────────────
+
+    def _client(self) -> Any:
+        if self.client is None:
+            raise BridgeError("E_FAILED", "DiagnosticsIndex has no client to fetch diagnostics with")
+        return self.client
+
+    async def _reload_all(self) -> None:
+        try:
+            await self.load()
+        except (BridgeError, OSError):
+            self.failures += 1
+            self._reload = True  # retried with the next event
+
+    def _start_refresh(self) -> None:
+        self._timer = None
+        if self._reload:
+            self._dirty.clear()  # the reload covers them
+            self.reloads += 1
+            work = self._reload_all()
+        else:
+            dirty, self._dirty = self._dirty, set()
+            work = self.refresh(dirty)
+        task = asyncio.ensure_future(work)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
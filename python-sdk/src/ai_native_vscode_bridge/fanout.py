@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .client import BridgeClient, BridgeError, BridgeMethodsMixin, _read_token_file
+
+# Workspace-wide methods answered by every shard and merged.
+SCATTER_METHODS: FrozenSet[str] = frozenset(
+    {
+        "code.symbols.workspace",
+        "diagnostics.list",
+        "workspace.info",
+        "workspace.findFiles",
+        "tasks.list",
+    }
+)
+
+# Result keys naming server-side state (a transaction, task, snapshot) that
+# later calls must send back to the shard that created it.
+_HANDLES = ("txId", "taskId", "snapshotId")
+_MAX_HANDLES = 4096
+
+_PORT_SETTING = re.compile(r'"bridge\.port"\s*:\s*(\d+)')
+
+
+def _workspace_port(workspace_dir: str, default: int = 57110) -> int:
+    """`bridge.port` from the workspace's `.vscode/settings.json` (JSONC), else `default`."""
+    try:
+        text = (Path(workspace_dir) / ".vscode" / "settings.json").read_text(encoding="utf-8")
+    except OSError:
+        return default
+    m = _PORT_SETTING.search(text)
+    return int(m.group(1)) if m else default
+
+
+def _owns(prefix: str, uri: str) -> bool:
+    prefix = prefix.rstrip("/")
+    return uri == prefix or uri.startswith(prefix + "/")
+
+
+def merge_results(results: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge shard results: lists are concatenated in shard order, booleans
+    (`truncated`) OR-ed, and any other value is taken from the first shard.
+    """
+    merged: Dict[str, Any] = {}
+    for result in results:
+        for key, value in result.items():
+            if key not in merged:
+                merged[key] = list(value) if isinstance(value, list) else value
+            elif isinstance(value, list) and isinstance(merged[key], list):
+                merged[key].extend(value)
+            elif isinstance(value, bool) and isinstance(merged[key], bool):
+                merged[key] = merged[key] or value
+    return merged
+
+
+@dataclass
+class Shard:
+    """One bridge: a name, its client, and the URI prefixes it owns."""
+
+    name: str
+    client: Any  # BridgeClient or BridgeConnectionPool
+    # Empty: learned from `workspace.info` folder URIs on `open()`.
+    prefixes: List[str] = field(default_factory=list)
+
+
+class BridgeFanout(BridgeMethodsMixin):
+    """
+    One client for several bridges, e.g. headless VS Code instances that each
+    serve one shard of a repo on their own port with their own token.
+
+    `call()` (and every generated method) goes to one shard:
+
+    - the shard whose folder owns `params["uri"]` (or `folderUri`), longest
+      prefix first; folders come from each shard's `workspace.info` unless
+      `Shard.prefixes` is given,
+    - the shard that returned a `txId` / `taskId` / `snapshotId` that the
+      params send back, so `tx.begin` ... `tx.commit` stay together,
+    - or `shard=` if given.
+
+    Workspace-wide methods (`SCATTER_METHODS`: `code.symbols.workspace`,
+    `diagnostics.list` without a `uri`, `workspace.info`, ...) are sent to
+    every shard at once. `call()` / `gather()` return the results merged
+    (`merge_results`), with failed shards listed under `"errors"`;
+    `scatter()` yields each shard's result as soon as it arrives, so one
+    slow shard does not hold up the rest:
+
+        async with BridgeFanout.from_workspaces(["shards/a", "shards/b"]) as fan:
+            await fan.doc_read({"uri": "file:///shards/a/main.py"})  # shard "a"
+            async for name, result in fan.scatter("diagnostics.list"):
+                if not isinstance(result, BridgeError):
+                    print(name, len(result["items"]))
+
+    Shards whose VS Code instances open the same folder path (containers
+    that all mount `/workspace`) cannot be told apart by URI: give them
+    distinct `prefixes`, or route with `shard=`.
+    """
+
+    def __init__(
+        self,
+        shards: Iterable[Shard],
+        *,
+        scatter_methods: FrozenSet[str] = SCATTER_METHODS,
+    ):
+        self._shards: Dict[str, Shard] = {}
+        for shard in shards:
+            if shard.name in self._shards:
+                raise ValueError(f"Duplicate shard name {shard.name!r}")
+            self._shards[shard.name] = shard
+        if not self._shards:
+            raise ValueError("BridgeFanout needs at least one shard")
+        self.scatter_methods = scatter_methods
+        self._owners: "OrderedDict[Tuple[str, Any], str]" = OrderedDict()
+        self._routes: List[Tuple[str, str]] = []  # (prefix, shard), longest first
+
+    @classmethod
+    def from_workspaces(
+        cls,
+        workspace_dirs: Union[Iterable[str], Mapping[str, int]],
+        *,
+        host: str = "127.0.0.1",
+        **client_kwargs: Any,
+    ) -> "BridgeFanout":
+        """
+        One shard per workspace directory, named after it. The token is read
+        from its `.vscode/bridge.token` and the port from `bridge.port` in its
+        `.vscode/settings.json` (default 57110); pass `{dir: port}` when the
+        ports are mapped elsewhere (e.g. `docker run -p 57111:57110`).
+        `client_kwargs` go to every `BridgeClient` (`cache`, `tracer`,
+        `timeout`, ...).
+        """
+        ports = workspace_dirs if isinstance(workspace_dirs, Mapping) else None
+        shards = []
+        for workspace_dir in workspace_dirs:
+            token = _read_token_file(Path(workspace_dir) / ".vscode" / "bridge.token")
+            if not token:
+                raise BridgeError(
+                    "E_AUTH",
+                    f"Missing token: no .vscode/bridge.token in {workspace_dir}",
+                    {"workspaceDir": workspace_dir},
+                )
+            port = ports[workspace_dir] if ports is not None else _workspace_port(workspace_dir)
+            name = os.path.basename(os.path.normpath(workspace_dir))
+            if any(s.name == name for s in shards):
+                name = workspace_dir
+            client = BridgeClient(
+                port=port, host=host, token=token, workspace_dir=workspace_dir, **client_kwargs
+            )
+            shards.append(Shard(name, client))
+        return cls(shards)
+
+    @classmethod
+    def from_ports(
+        cls,
+        ports: Iterable[int],
+        *,
+        token: Union[str, Mapping[int, str]],
+        host: str = "127.0.0.1",
+        **client_kwargs: Any,
+    ) -> "BridgeFanout":
+        """One shard per port, named `"<port>"`; `token` is shared or `{port: token}`."""
+        shards = []
+        for port in ports:
+            tok = token if isinstance(token, str) else token[port]
+            client = BridgeClient(port=port, host=host, token=tok, **client_kwargs)
+            shards.append(Shard(str(port), client))
+        return cls(shards)
+
+    @property
+    def shards(self) -> List[Shard]:
+        return list(self._shards.values())
+
+    def shard(self, name: str) -> Shard:
+        try:
+            return self._shards[name]
+        except KeyError:
+            raise BridgeError("E_NOT_FOUND", f"Unknown shard {name!r}", {"shard": name}) from None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "shards": {
+                s.name: {"prefixes": list(s.prefixes), **_client_stats(s.client)}
+                for s in self._shards.values()
+            },
+            "handles": len(self._owners),
+        }
+
+    # ── lifecycle ─────────────────────────────────────────────────────
+
+    async def open(self) -> "BridgeFanout":
+        """Connect every shard in parallel and learn the folders each one serves."""
+        await asyncio.gather(*(self._open(s) for s in self._shards.values()))
+        self._routes = sorted(
+            ((p.rstrip("/"), s.name) for s in self._shards.values() for p in s.prefixes),
+            key=lambda route: -len(route[0]),
+        )
+        return self
+
+    async def close(self) -> None:
+        await asyncio.gather(
+            *(s.client.close() for s in self._shards.values()), return_exceptions=True
+        )
+
+    async def __aenter__(self) -> "BridgeFanout":
+        try:
+            return await self.open()
+        except BaseException:
+            await self.close()
+            raise
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    # ── calls ─────────────────────────────────────────────────────────
+
+    def route(self, method: str, params: Optional[Dict[str, Any]] = None) -> Optional[Shard]:
+        """The shard a call goes to, or None if it is not tied to one."""
+        params = params or {}
+        uri = params.get("uri") or params.get("folderUri")
+        if isinstance(uri, str):
+            for prefix, name in self._routes:
+                if _owns(prefix, uri):
+                    return self._shards[name]
+            raise BridgeError(
+                "E_NOT_FOUND", f"No shard serves {uri}", {"uri": uri, "method": method}
+            )
+        for key in _HANDLES:
+            value = params.get(key)
+            if value is not None:
+                owner = self._owners.get((key, value))
+                if owner is not None:
+                    return self._shards[owner]
+        return None
+
+    async def call(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        shard: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        target = self.shard(shard) if shard is not None else self.route(method, params)
+        if target is None:
+            if method in self.scatter_methods:
+                return await self.gather(method, params, timeout=timeout)
+            if len(self._shards) != 1:
+                raise BridgeError(
+                    "E_INVALID_PARAMS",
+                    f"Cannot route {method}: no uri or known handle in params; pass shard=",
+                    {"method": method, "shards": list(self._shards)},
+                )
+            (target,) = self._shards.values()
+        result = await target.client.call(method, params, timeout=timeout)
+        self._remember(target.name, result)
+        return result
+
+    async def scatter(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        shards: Optional[Iterable[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Send one call to every shard (or `shards`) at once and yield
+        `(shard name, result)` in completion order. A failed shard yields its
+        `BridgeError` instead of raising. Calls still running when the
+        iteration stops early are cancelled.
+        """
+        targets = [self.shard(n) for n in shards] if shards is not None else self.shards
+
+        async def one(s: Shard) -> Tuple[str, Any]:
+            try:
+                return s.name, await s.client.call(method, params, timeout=timeout)
+            except BridgeError as e:
+                return s.name, e
+            except OSError as e:  # the shard's bridge is not running
+                return s.name, BridgeError("E_FAILED", f"Shard unreachable: {e}", {"shard": s.name})
+
+        tasks = [asyncio.ensure_future(one(s)) for s in targets]
+        try:
+            for done in asyncio.as_completed(tasks):
+                yield await done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def gather(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        `scatter()` to every shard and merge the results in shard order.
+        Failed shards are reported under `"errors"` (`{shard: {code,
+        message}}`); if every shard failed, the first error is raised.
+        """
+        replies = {name: result async for name, result in self.scatter(method, params, timeout=timeout)}
+        ok = [replies[n] for n in self._shards if not isinstance(replies[n], BridgeError)]
+        errors = {n: r for n, r in replies.items() if isinstance(r, BridgeError)}
+        if not ok:
+            raise next(iter(errors.values()))
+        merged = merge_results(ok)
+        if errors:
+            merged["errors"] = {n: {"code": e.code, "message": e.message} for n, e in errors.items()}
+        return merged
+
+    # ── internals ─────────────────────────────────────────────────────
+
+    async def _open(self, shard: Shard) -> None:
+        client = shard.client
+        await (client.open() if hasattr(client, "open") else client.connect())
+        if not shard.prefixes:
+            info = await client.call("workspace.info")
+            shard.prefixes = [f["uri"] for f in info.get("folders") or () if f.get("uri")]
+
+    def _remember(self, name: str, result: Any) -> None:
+        if not isinstance(result, dict):
+            return
+        owners = self._owners
+        for key in _HANDLES:
+            value = result.get(key)
+            if value is not None:
+                owners[(key, value)] = name
+                owners.move_to_end((key, value))
+                if len(owners) > _MAX_HANDLES:
+                    owners.popitem(last=False)
+
+
+def _client_stats(client: Any) -> Dict[str, Any]:
+    stats = client.stats()
+    return {"connected": stats.get("connected"), "inFlight": stats.get("inFlight")}
@@ -0,0 +1,939 @@
+# Generated file. Do not edit by hand.
+# Source: protocol/schemas/v1.json
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Awaitable, Dict, List, Optional, Union
+
+
+@dataclass(slots=True)
+class Meta:
+    confidence: Optional[float] = None
+    reasoning: Optional[str] = None
+    timeoutMs: Optional[int] = None
+
+
+@dataclass(slots=True)
+class AgentPlanAndExecuteParams:
+    goal: str
+    dryRun: Optional[bool] = None
+    maxSteps: Optional[int] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class AgentPlanAndExecuteResult:
+    goal: str
+    dryRun: bool
+    steps: List[Dict[str, Any]]
+    previewUnifiedDiff: str
+    txId: Optional[str] = None
+    committed: Optional[bool] = None
+    rolledBack: Optional[bool] = None
+
+
+@dataclass(slots=True)
+class AgentSuggestNextStepsParams:
+    goal: Optional[str] = None
+    maxSuggestions: Optional[int] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class AgentSuggestNextStepsResultSuggestion:
+    id: str
+    title: str
+    rationale: str
+    method: str
+    params: Dict[str, Any]
+
+
+@dataclass(slots=True)
+class AgentSuggestNextStepsResult:
+    suggestions: List[AgentSuggestNextStepsResultSuggestion]
+
+
+@dataclass(slots=True)
+class BridgeCancelParams:
+    ids: List[Union[str, int]]
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class BridgeCancelResult:
+    cancelled: int
+
+
+@dataclass(slots=True)
+class BridgeCapabilitiesParams:
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class BridgeCapabilitiesResult:
+    methods: List[str]
+    events: List[str]
+    limitations: List[str]
+    features: Optional[List[str]] = None
+
+
+@dataclass(slots=True)
+class BridgePingParams:
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class BridgePingResult:
+    ok: bool
+    protocol: str
+
+
+@dataclass(slots=True)
+class Position:
+    line: int
+    character: int
+
+
+@dataclass(slots=True)
+class CodeDefinitionsParams:
+    uri: str
+    position: Position
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class CodeDefinitionsResult:
+    items: List[Dict[str, Any]]
+
+
+@dataclass(slots=True)
+class CodeHoverParams:
+    uri: str
+    position: Position
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class CodeHoverResult:
+    items: List[Dict[str, Any]]
+
+
+@dataclass(slots=True)
+class CodeReferencesParams:
+    uri: str
+    position: Position
+    includeDeclaration: Optional[bool] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class Range:
+    start: Position
+    end: Position
+
+
+@dataclass(slots=True)
+class Location:
+    uri: str
+    range: Range
+
+
+@dataclass(slots=True)
+class CodeReferencesResult:
+    items: List[Location]
+    includeDeclaration: Optional[bool] = None
+
+
+@dataclass(slots=True)
+class CodeSymbolsDocumentParams:
+    uri: str
+    flatten: Optional[bool] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class CodeSymbolsDocumentResult:
+    items: List[Dict[str, Any]]
+
+
+@dataclass(slots=True)
+class CodeSymbolsWorkspaceParams:
+    query: Optional[str] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class CodeSymbolsWorkspaceResult:
+    items: List[Dict[str, Any]]
+
+
+@dataclass(slots=True)
+class DebugRunTestAndCaptureFailureParams:
+    configuration: Dict[str, Any]
+    folderUri: Optional[str] = None
+    timeoutMs: Optional[int] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class DebugRunTestAndCaptureFailureResult:
+    started: bool
+    exitedCleanly: bool
+    diagnosticsAfter: List[Dict[str, Any]]
+    failures: List[Dict[str, Any]]
+
+
+@dataclass(slots=True)
+class DebugSessionsParams:
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class DebugSessionsResultSession:
+    id: Optional[str] = None
+    name: Optional[str] = None
+    type: Optional[str] = None
+
+
+@dataclass(slots=True)
+class DebugSessionsResult:
+    sessions: List[DebugSessionsResultSession]
+    activeSession: Optional[Dict[str, Any]]
+
+
+@dataclass(slots=True)
+class DebugStartParams:
+    configuration: Dict[str, Any]
+    folderUri: Optional[str] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class DebugStartResult:
+    started: bool
+
+
+@dataclass(slots=True)
+class DebugStopParams:
+    sessionId: Optional[str] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class DebugStopResult:
+    stopped: bool
+
+
+@dataclass(slots=True)
+class DebugSubscribeParams:
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class DebugSubscribeResult:
+    subscribed: bool
+
+
+@dataclass(slots=True)
+class DiagnosticsFixCommitParams:
+    txId: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class DiagnosticsFixPreviewParams:
+    txId: str
+    uri: str
+    kind: Optional[str] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class DiagnosticsListParams:
+    uri: Optional[str] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class Diagnostic:
+    range: Range
+    message: str
+    severity: int
+    source: Optional[str] = None
+    code: Optional[Union[str, int]] = None
+
+
+@dataclass(slots=True)
+class DiagnosticsListResultItem:
+    uri: str
+    diagnostics: List[Diagnostic]
+
+
+@dataclass(slots=True)
+class DiagnosticsListResult:
+    items: List[DiagnosticsListResultItem]
+
+
+@dataclass(slots=True)
+class DiagnosticsSubscribeParams:
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class DiagnosticsSubscribeResult:
+    subscribed: bool
+
+
+@dataclass(slots=True)
+class TextEdit:
+    range: Range
+    newText: str
+
+
+@dataclass(slots=True)
+class DocApplyEditsParams:
+    uri: str
+    edits: List[TextEdit]
+    expectedVersion: Optional[int] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class DocApplyEditsResult:
+    applied: bool
+    newVersion: int
+
+
+@dataclass(slots=True)
+class DocApplyEditsCommitParams:
+    txId: str
+    uri: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class DocApplyEditsCommitResult:
+    txId: str
+    applied: bool
+    newVersion: int
+
+
+@dataclass(slots=True)
+class DocApplyEditsPreviewParams:
+    txId: str
+    uri: str
+    edits: List[TextEdit]
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class DocApplyEditsPreviewResult:
+    txId: str
+    uri: str
+    editCount: int
+    unifiedDiff: str
+    impactAnalysis: Dict[str, Any]
+
+
+@dataclass(slots=True)
+class DocFormatParams:
+    uri: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class DocFormatResult:
+    applied: bool
+    editCount: int
+
+
+@dataclass(slots=True)
+class DocReadParams:
+    uri: str
+    startLine: Optional[int] = None
+    endLine: Optional[int] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class DocReadResult:
+    uri: str
+    version: int
+    languageId: str
+    text: str
+    startLine: Optional[int] = None
+    endLine: Optional[int] = None
+    totalLines: Optional[int] = None
+
+
+@dataclass(slots=True)
+class EventsSubscribeParams:
+    events: Optional[List[str]] = None
+    replay: Optional[int] = None
+    sinceSeq: Optional[int] = None
+    epoch: Optional[str] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class EventsSubscribeResult:
+    subscriptionId: str
+    filter: Optional[List[str]]
+    replayed: int
+    epoch: Optional[str] = None
+    latestSeq: Optional[int] = None
+    oldestSeq: Optional[int] = None
+    gap: Optional[bool] = None
+
+
+@dataclass(slots=True)
+class EventsUnsubscribeParams:
+    subscriptionId: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class EventsUnsubscribeResult:
+    unsubscribed: bool
+
+
+@dataclass(slots=True)
+class NotebookExecuteCellsParams:
+    uri: str
+    start: int
+    end: int
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class NotebookExecuteCellsResult:
+    started: bool
+
+
+@dataclass(slots=True)
+class NotebookOpenParams:
+    uri: str
+    show: Optional[bool] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class NotebookOpenResult:
+    uri: str
+    notebookType: str
+    cellCount: int
+
+
+@dataclass(slots=True)
+class NotebookReadParams:
+    uri: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class NotebookReadResultCell:
+    index: Optional[int] = None
+    kind: Optional[int] = None
+    languageId: Optional[str] = None
+    text: Optional[str] = None
+
+
+@dataclass(slots=True)
+class NotebookReadResult:
+    uri: str
+    notebookType: str
+    cells: List[NotebookReadResultCell]
+
+
+@dataclass(slots=True)
+class RefactorCodeActionsParams:
+    uri: str
+    range: Range
+    kind: Optional[str] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class RefactorCodeActionsResult:
+    actions: List[Dict[str, Any]]
+
+
+@dataclass(slots=True)
+class RefactorCodeActionsApplyParams:
+    actionId: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class RefactorCodeActionsApplyResult:
+    applied: bool
+    editApplied: Optional[bool] = None
+    commandExecuted: Optional[bool] = None
+
+
+@dataclass(slots=True)
+class RefactorFixAllParams:
+    uri: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class RefactorFixAllResult:
+    editCount: int
+    commandCount: int
+
+
+@dataclass(slots=True)
+class RefactorOrganizeImportsParams:
+    uri: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class RefactorOrganizeImportsResult:
+    applied: bool
+    editCount: int
+
+
+@dataclass(slots=True)
+class RefactorRenameParams:
+    uri: str
+    position: Position
+    newName: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class RefactorRenameResult:
+    applied: bool
+
+
+@dataclass(slots=True)
+class RefactorRenameCommitParams:
+    txId: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class RefactorRenamePreviewParams:
+    txId: str
+    uri: str
+    position: Position
+    newName: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class SymbolsDeepContextParams:
+    uri: str
+    maxDepth: Optional[int] = None
+    includeBlame: Optional[bool] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class SymbolsDeepContextResult:
+    uri: str
+    symbols: List[Dict[str, Any]]
+    callGraph: List[Dict[str, Any]]
+    blame: Optional[List[Dict[str, Any]]]
+
+
+@dataclass(slots=True)
+class TasksListParams:
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class TasksListResultTask:
+    name: Optional[str] = None
+    source: Optional[str] = None
+    type: Optional[str] = None
+
+
+@dataclass(slots=True)
+class TasksListResult:
+    tasks: List[TasksListResultTask]
+
+
+@dataclass(slots=True)
+class TasksRunParams:
+    name: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class TasksRunResult:
+    taskId: str
+
+
+@dataclass(slots=True)
+class TasksRunCaptureParams:
+    name: str
+    timeoutMs: Optional[int] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class TasksRunCaptureResult:
+    taskId: str
+    exitCode: Optional[int]
+    output: Any
+    failureSummary: Any
+    limitations: List[str]
+
+
+@dataclass(slots=True)
+class TasksTerminateParams:
+    taskId: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class TasksTerminateResult:
+    terminated: bool
+
+
+@dataclass(slots=True)
+class TxBeginParams:
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class TxBeginResult:
+    txId: str
+    createdAt: int
+
+
+@dataclass(slots=True)
+class TxCommitParams:
+    txId: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class TxCommitResult:
+    txId: str
+    committed: bool
+    fileCount: int
+
+
+@dataclass(slots=True)
+class TxPreviewParams:
+    txId: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class TxPreviewResultFile:
+    uri: str
+    editCount: int
+    unifiedDiff: str
+
+
+@dataclass(slots=True)
+class TxPreviewResult:
+    txId: str
+    fileCount: int
+    unifiedDiff: str
+    files: List[TxPreviewResultFile]
+
+
+@dataclass(slots=True)
+class TxRollbackParams:
+    txId: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class TxRollbackResult:
+    txId: str
+    rolledBack: bool
+
+
+@dataclass(slots=True)
+class TxSnapshotCreateParams:
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class TxSnapshotCreateResult:
+    snapshotId: str
+    kind: str
+    stashRef: str
+
+
+@dataclass(slots=True)
+class TxSnapshotRestoreParams:
+    snapshotId: str
+    dangerouslyDiscardLocalChanges: bool
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class TxSnapshotRestoreResult:
+    snapshotId: str
+    restored: bool
+
+
+@dataclass(slots=True)
+class UiFocusParams:
+    command: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class UiFocusResult:
+    focused: bool
+
+
+@dataclass(slots=True)
+class UiOpenFileParams:
+    uri: str
+    preview: Optional[bool] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class UiOpenFileResult:
+    shown: bool
+
+
+@dataclass(slots=True)
+class UiOpenPanelParams:
+    command: str
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class UiOpenPanelResult:
+    opened: bool
+
+
+@dataclass(slots=True)
+class UiQuickPickParamsItem:
+    label: Optional[str] = None
+    description: Optional[str] = None
+    id: Optional[str] = None
+
+
+@dataclass(slots=True)
+class UiQuickPickParams:
+    items: List[UiQuickPickParamsItem]
+    placeholder: Optional[str] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class UiQuickPickResult:
+    pickedId: Optional[str]
+
+
+@dataclass(slots=True)
+class UiRevealRangeParams:
+    uri: str
+    range: Range
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class UiRevealRangeResult:
+    revealed: bool
+
+
+@dataclass(slots=True)
+class WorkspaceFindFilesParams:
+    include: Optional[str] = None
+    exclude: Optional[str] = None
+    maxResults: Optional[int] = None
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class WorkspaceFindFilesResult:
+    items: List[str]
+    truncated: bool
+
+
+@dataclass(slots=True)
+class WorkspaceInfoParams:
+    meta: Optional[Meta] = None
+
+
+@dataclass(slots=True)
+class WorkspaceInfoResultFolder:
+    name: Optional[str] = None
+    uri: Optional[str] = None
+
+
+@dataclass(slots=True)
+class WorkspaceInfoResult:
+    folders: List[WorkspaceInfoResultFolder]
+    name: Optional[str] = None
+
+
+class TypedBridgeMethodsMixin:
+    # Same names as BridgeMethodsMixin; results are decoded into the models above.
+    def agent_planAndExecute(self, params: Union[AgentPlanAndExecuteParams, Dict[str, Any], None] = None) -> Awaitable[AgentPlanAndExecuteResult]:
+        return self.call_as("agent.planAndExecute", params, AgentPlanAndExecuteResult)
+
+    def agent_suggestNextSteps(self, params: Union[AgentSuggestNextStepsParams, Dict[str, Any], None] = None) -> Awaitable[AgentSuggestNextStepsResult]:
+        return self.call_as("agent.suggestNextSteps", params, AgentSuggestNextStepsResult)
+
+    def bridge_cancel(self, params: Union[BridgeCancelParams, Dict[str, Any], None] = None) -> Awaitable[BridgeCancelResult]:
+        return self.call_as("bridge.cancel", params, BridgeCancelResult)
+
+    def bridge_capabilities(self, params: Union[BridgeCapabilitiesParams, Dict[str, Any], None] = None) -> Awaitable[BridgeCapabilitiesResult]:
+        return self.call_as("bridge.capabilities", params, BridgeCapabilitiesResult)
+
+    def bridge_ping(self, params: Union[BridgePingParams, Dict[str, Any], None] = None) -> Awaitable[BridgePingResult]:
+        return self.call_as("bridge.ping", params, BridgePingResult)
+
+    def code_definitions(self, params: Union[CodeDefinitionsParams, Dict[str, Any], None] = None) -> Awaitable[CodeDefinitionsResult]:
+        return self.call_as("code.definitions", params, CodeDefinitionsResult)
+
+    def code_hover(self, params: Union[CodeHoverParams, Dict[str, Any], None] = None) -> Awaitable[CodeHoverResult]:
+        return self.call_as("code.hover", params, CodeHoverResult)
+
+    def code_references(self, params: Union[CodeReferencesParams, Dict[str, Any], None] = None) -> Awaitable[CodeReferencesResult]:
+        return self.call_as("code.references", params, CodeReferencesResult)
+
+    def code_symbols_document(self, params: Union[CodeSymbolsDocumentParams, Dict[str, Any], None] = None) -> Awaitable[CodeSymbolsDocumentResult]:
+        return self.call_as("code.symbols.document", params, CodeSymbolsDocumentResult)
+
+    def code_symbols_workspace(self, params: Union[CodeSymbolsWorkspaceParams, Dict[str, Any], None] = None) -> Awaitable[CodeSymbolsWorkspaceResult]:
+        return self.call_as("code.symbols.workspace", params, CodeSymbolsWorkspaceResult)
+
+    def debug_runTestAndCaptureFailure(self, params: Union[DebugRunTestAndCaptureFailureParams, Dict[str, Any], None] = None) -> Awaitable[DebugRunTestAndCaptureFailureResult]:
+        return self.call_as("debug.runTestAndCaptureFailure", params, DebugRunTestAndCaptureFailureResult)
+
+    def debug_sessions(self, params: Union[DebugSessionsParams, Dict[str, Any], None] = None) -> Awaitable[DebugSessionsResult]:
+        return self.call_as("debug.sessions", params, DebugSessionsResult)
+
+    def debug_start(self, params: Union[DebugStartParams, Dict[str, Any], None] = None) -> Awaitable[DebugStartResult]:
+        return self.call_as("debug.start", params, DebugStartResult)
+
+    def debug_stop(self, params: Union[DebugStopParams, Dict[str, Any], None] = None) -> Awaitable[DebugStopResult]:
+        return self.call_as("debug.stop", params, DebugStopResult)
+
+    def debug_subscribe(self, params: Union[DebugSubscribeParams, Dict[str, Any], None] = None) -> Awaitable[DebugSubscribeResult]:
+        return self.call_as("debug.subscribe", params, DebugSubscribeResult)
+
+    def diagnostics_fix_commit(self, params: Union[DiagnosticsFixCommitParams, Dict[str, Any], None] = None) -> Awaitable[Dict[str, Any]]:
+        return self.call_as("diagnostics.fix.commit", params, None)
+
+    def diagnostics_fix_preview(self, params: Union[DiagnosticsFixPreviewParams, Dict[str, Any], None] = None) -> Awaitable[Dict[str, Any]]:
+        return self.call_as("diagnostics.fix.preview", params, None)
+
+    def diagnostics_list(self, params: Union[DiagnosticsListParams, Dict[str, Any], None] = None) -> Awaitable[DiagnosticsListResult]:
+        return self.call_as("diagnostics.list", params, DiagnosticsListResult)
+
+    def diagnostics_subscribe(self, params: Union[DiagnosticsSubscribeParams, Dict[str, Any], None] = None) -> Awaitable[DiagnosticsSubscribeResult]:
+        return self.call_as("diagnostics.subscribe", params, DiagnosticsSubscribeResult)
+
+    def doc_applyEdits(self, params: Union[DocApplyEditsParams, Dict[str, Any], None] = None) -> Awaitable[DocApplyEditsResult]:
+        return self.call_as("doc.applyEdits", params, DocApplyEditsResult)
+
+    def doc_applyEdits_commit(self, params: Union[DocApplyEditsCommitParams, Dict[str, Any], None] = None) -> Awaitable[DocApplyEditsCommitResult]:
+        return self.call_as("doc.applyEdits.commit", params, DocApplyEditsCommitResult)
+
+    def doc_applyEdits_preview(self, params: Union[DocApplyEditsPreviewParams, Dict[str, Any], None] = None) -> Awaitable[DocApplyEditsPreviewResult]:
+        return self.call_as("doc.applyEdits.preview", params, DocApplyEditsPreviewResult)
+
+    def doc_format(self, params: Union[DocFormatParams, Dict[str, Any], None] = None) -> Awaitable[DocFormatResult]:
+        return self.call_as("doc.format", params, DocFormatResult)
+
+    def doc_read(self, params: Union[DocReadParams, Dict[str, Any], None] = None) -> Awaitable[DocReadResult]:
+        return self.call_as("doc.read", params, DocReadResult)
+
+    def events_subscribe(self, params: Union[EventsSubscribeParams, Dict[str, Any], None] = None) -> Awaitable[EventsSubscribeResult]:
+        return self.call_as("events.subscribe", params, EventsSubscribeResult)
+
+    def events_unsubscribe(self, params: Union[EventsUnsubscribeParams, Dict[str, Any], None] = None) -> Awaitable[EventsUnsubscribeResult]:
+        return self.call_as("events.unsubscribe", params, EventsUnsubscribeResult)
+
+    def notebook_executeCells(self, params: Union[NotebookExecuteCellsParams, Dict[str, Any], None] = None) -> Awaitable[NotebookExecuteCellsResult]:
+        return self.call_as("notebook.executeCells", params, NotebookExecuteCellsResult)
+
+    def notebook_open(self, params: Union[NotebookOpenParams, Dict[str, Any], None] = None) -> Awaitable[NotebookOpenResult]:
+        return self.call_as("notebook.open", params, NotebookOpenResult)
+
+    def notebook_read(self, params: Union[NotebookReadParams, Dict[str, Any], None] = None) -> Awaitable[NotebookReadResult]:
+        return self.call_as("notebook.read", params, NotebookReadResult)
+
+    def refactor_codeActions(self, params: Union[RefactorCodeActionsParams, Dict[str, Any], None] = None) -> Awaitable[RefactorCodeActionsResult]:
+        return self.call_as("refactor.codeActions", params, RefactorCodeActionsResult)
+
+    def refactor_codeActions_apply(self, params: Union[RefactorCodeActionsApplyParams, Dict[str, Any], None] = None) -> Awaitable[RefactorCodeActionsApplyResult]:
+        return self.call_as("refactor.codeActions.apply", params, RefactorCodeActionsApplyResult)
+
+    def refactor_fixAll(self, params: Union[RefactorFixAllParams, Dict[str, Any], None] = None) -> Awaitable[RefactorFixAllResult]:
+        return self.call_as("refactor.fixAll", params, RefactorFixAllResult)
+
+    def refactor_organizeImports(self, params: Union[RefactorOrganizeImportsParams, Dict[str, Any], None] = None) -> Awaitable[RefactorOrganizeImportsResult]:
+        return self.call_as("refactor.organizeImports", params, RefactorOrganizeImportsResult)
+
+    def refactor_rename(self, params: Union[RefactorRenameParams, Dict[str, Any], None] = None) -> Awaitable[RefactorRenameResult]:
+        return self.call_as("refactor.rename", params, RefactorRenameResult)
+
+    def refactor_rename_commit(self, params: Union[RefactorRenameCommitParams, Dict[str, Any], None] = None) -> Awaitable[Dict[str, Any]]:
+        return self.call_as("refactor.rename.commit", params, None)
+
+    def refactor_rename_preview(self, params: Union[RefactorRenamePreviewParams, Dict[str, Any], None] = None) -> Awaitable[Dict[str, Any]]:
+        return self.call_as("refactor.rename.preview", params, None)
+
+    def symbols_deepContext(self, params: Union[SymbolsDeepContextParams, Dict[str, Any], None] = None) -> Awaitable[SymbolsDeepContextResult]:
+        return self.call_as("symbols.deepContext", params, SymbolsDeepContextResult)
+
+    def tasks_list(self, params: Union[TasksListParams, Dict[str, Any], None] = None) -> Awaitable[TasksListResult]:
+        return self.call_as("tasks.list", params, TasksListResult)
+
+    def tasks_run(self, params: Union[TasksRunParams, Dict[str, Any], None] = None) -> Awaitable[TasksRunResult]:
+        return self.call_as("tasks.run", params, TasksRunResult)
+
+    def tasks_run_capture(self, params: Union[TasksRunCaptureParams, Dict[str, Any], None] = None) -> Awaitable[TasksRunCaptureResult]:
+        return self.call_as("tasks.run.capture", params, TasksRunCaptureResult)
+
+    def tasks_terminate(self, params: Union[TasksTerminateParams, Dict[str, Any], None] = None) -> Awaitable[TasksTerminateResult]:
+        return self.call_as("tasks.terminate", params, TasksTerminateResult)
+
+    def tx_begin(self, params: Union[TxBeginParams, Dict[str, Any], None] = None) -> Awaitable[TxBeginResult]:
+        return self.call_as("tx.begin", params, TxBeginResult)
+
+    def tx_commit(self, params: Union[TxCommitParams, Dict[str, Any], None] = None) -> Awaitable[TxCommitResult]:
+        return self.call_as("tx.commit", params, TxCommitResult)
+
+    def tx_preview(self, params: Union[TxPreviewParams, Dict[str, Any], None] = None) -> Awaitable[TxPreviewResult]:
+        return self.call_as("tx.preview", params, TxPreviewResult)
+
+    def tx_rollback(self, params: Union[TxRollbackParams, Dict[str, Any], None] = None) -> Awaitable[TxRollbackResult]:
+        return self.call_as("tx.rollback", params, TxRollbackResult)
+
+    def tx_snapshot_create(self, params: Union[TxSnapshotCreateParams, Dict[str, Any], None] = None) -> Awaitable[TxSnapshotCreateResult]:
+        return self.call_as("tx.snapshot.create", params, TxSnapshotCreateResult)
+
+    def tx_snapshot_restore(self, params: Union[TxSnapshotRestoreParams, Dict[str, Any], None] = None) -> Awaitable[TxSnapshotRestoreResult]:
+        return self.call_as("tx.snapshot.restore", params, TxSnapshotRestoreResult)
+
+    def ui_focus(self, params: Union[UiFocusParams, Dict[str, Any], None] = None) -> Awaitable[UiFocusResult]:
+        return self.call_as("ui.focus", params, UiFocusResult)
+
+    def ui_openFile(self, params: Union[UiOpenFileParams, Dict[str, Any], None] = None) -> Awaitable[UiOpenFileResult]:
+        return self.call_as("ui.openFile", params, UiOpenFileResult)
+
+    def ui_openPanel(self, params: Union[UiOpenPanelParams, Dict[str, Any], None] = None) -> Awaitable[UiOpenPanelResult]:
+        return self.call_as("ui.openPanel", params, UiOpenPanelResult)
+
+    def ui_quickPick(self, params: Union[UiQuickPickParams, Dict[str, Any], None] = None) -> Awaitable[UiQuickPickResult]:
+        return self.call_as("ui.quickPick", params, UiQuickPickResult)
+
+    def ui_revealRange(self, params: Union[UiRevealRangeParams, Dict[str, Any], None] = None) -> Awaitable[UiRevealRangeResult]:
+        return self.call_as("ui.revealRange", params, UiRevealRangeResult)
+
+    def workspace_findFiles(self, params: Union[WorkspaceFindFilesParams, Dict[str, Any], None] = None) -> Awaitable[WorkspaceFindFilesResult]:
+        return self.call_as("workspace.findFiles", params, WorkspaceFindFilesResult)
+
+    def workspace_info(self, params: Union[WorkspaceInfoParams, Dict[str, Any], None] = None) -> Awaitable[WorkspaceInfoResult]:
+        return self.call_as("workspace.info", params, WorkspaceInfoResult)
+
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, FrozenSet, Mapping, Optional
+
+# Reads with no side effects: safe to send again after a failure, even if the
+# server already ran the first attempt.
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset(
+    {
+        "bridge.ping",
+        "bridge.capabilities",
+        "workspace.info",
+        "workspace.findFiles",
+        "doc.read",
+        "diagnostics.list",
+        "code.definitions",
+        "code.references",
+        "code.hover",
+        "code.symbols.document",
+        "code.symbols.workspace",
+        "symbols.deepContext",
+        "refactor.codeActions",
+        "tasks.list",
+        "debug.sessions",
+        "notebook.read",
+    }
+)
+
+# Codes that mean "the extension host could not do it right now" (a language
+# server crashed or timed out, the socket dropped), as opposed to a bad
+# request (E_INVALID_PARAMS, E_NOT_FOUND, ...) that would fail again.
+OVERLOAD_CODES: FrozenSet[str] = frozenset({"E_FAILED"})
+
+# Seconds over which a family's unloaded-latency baseline follows a slowdown.
+BASELINE_HORIZON = 60.0
+
+# Families whose calls spawn processes or touch many files start lower.
+DEFAULT_FAMILY_LIMITS: Mapping[str, Mapping[str, float]] = {
+    "tasks": {"initial": 2, "max_limit": 4},
+    "debug": {"initial": 1, "max_limit": 2},
+    "refactor": {"initial": 4, "max_limit": 16},
+}
+
+
+def method_family(method: str) -> str:
+    """`code.references` -> `code`: calls of one family share a limit."""
+    return method.split(".", 1)[0]
+
+
+def _overloaded(exc: Optional[BaseException]) -> bool:
+    return getattr(exc, "code", None) in OVERLOAD_CODES
+
+
+class _Family:
+    """AIMD window for one method family."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        initial: float,
+        min_limit: float,
+        max_limit: float,
+        backoff: float,
+        tolerance: float,
+    ):
+        self.name = name
+        self.limit = float(initial)
+        self.min_limit = float(min_limit)
+        self.max_limit = float(max_limit)
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.in_flight = 0
+        self.waiters: Deque["asyncio.Future[None]"] = deque()
+        # `short` follows the last few calls' latency, `long` the family's
+        # unloaded latency; short >> long means the server is queueing.
+        self.short: Optional[float] = None
+        self.long: Optional[float] = None
+        self.last_drop = 0.0
+        self.last_sample = 0.0
+        self.completed = 0
+        self.drops = 0
+
+    async def acquire(self) -> None:
+        if self.in_flight < int(self.limit) and not self.waiters:
+            self.in_flight += 1
+            return
+        fut = asyncio.get_running_loop().create_future()
+        self.waiters.append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self._free()  # handed a slot just as we were cancelled
+            elif fut in self.waiters:
+                self.waiters.remove(fut)
+            raise
+
+    def release(self, latency: Optional[float], overloaded: bool) -> None:
+        """Give the slot back; `latency` is None for calls that say nothing about load."""
+        busy = self.in_flight * 2 >= self.limit
+        if latency is not None:
+            self._adjust(latency, overloaded, busy)
+        self._free()
+
+    def _free(self) -> None:
+        self.in_flight -= 1
+        while self.waiters and self.in_flight < int(self.limit):
+            fut = self.waiters.popleft()
+            if not fut.done():
+                self.in_flight += 1
+                fut.set_result(None)
+
+    def _adjust(self, latency: float, overloaded: bool, busy: bool) -> None:
+        self.completed += 1
+        now = time.monotonic()
+        if self.long is None or self.short is None:
+            self.long = self.short = latency
+        else:
+            self.short += (latency - self.short) * 0.2
+            # Unloaded latency: drops to any faster call at once and creeps
+            # up over about BASELINE_HORIZON seconds (for a family that really
+            # got slower, e.g. a bigger workspace), so a burst of queueing
+            # does not become the new normal however many calls it spans.
+            drift = min(1.0, (now - self.last_sample) / BASELINE_HORIZON)
+            self.long = min(latency, self.long + (latency - self.long) * drift)
+        self.last_sample = now
+        if overloaded or self.short > self.long * self.tolerance:
+            # At most one decrease per round trip, so a burst of failures
+            # from one overloaded moment does not collapse the window.
+            if now - self.last_drop >= self.short:
+                self.last_drop = now
+                self.drops += 1
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+        elif busy:
+            # Additive increase: about +1 per window of successful calls, and
+            # only while the window is actually in use.
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": round(self.limit, 2),
+            "inFlight": self.in_flight,
+            "queued": len(self.waiters),
+            "completed": self.completed,
+            "drops": self.drops,
+            "latencyMs": round(self.short * 1000, 3) if self.short is not None else None,
+            "baselineMs": round(self.long * 1000, 3) if self.long is not None else None,
+        }
+
+
+class _Slot:
+    __slots__ = ("family", "start")
+
+    def __init__(self, family: _Family):
+        self.family = family
+        self.start = 0.0
+
+    async def __aenter__(self) -> None:
+        await self.family.acquire()
+        self.start = time.perf_counter()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc is None or _overloaded(exc):
+            self.family.release(time.perf_counter() - self.start, exc is not None)
+        else:
+            # Cancelled, or the caller's own mistake: no signal about load.
+            self.family.release(None, False)
+
+
+class AdaptiveLimiter:
+    """
+    Per-family concurrency limits that adapt to how the extension copes.
+
+    Every call waits for a slot in its method family (`code`, `refactor`,
+    `tasks`, ...; see `method_family`). Each family's limit grows by about
+    one per window of successful calls while the window is in use (additive
+    increase), and is multiplied by `backoff` when a call fails with
+    `E_FAILED` or recent latency exceeds `tolerance` times the family's
+    long-run average (multiplicative decrease). Saturated language servers
+    thus get fewer concurrent requests instead of timing out, and the limit
+    climbs back once they recover.
+
+        limiter = AdaptiveLimiter(families={"code": {"max_limit": 32}})
+        async with BridgeConnectionPool.from_workspace(limiter=limiter) as pool:
+            ...
+        limiter.stats()  # {"code": {"limit": 18.4, "inFlight": 16, ...}, ...}
+
+    `families` overrides `initial`, `min_limit`, `max_limit` per family on
+    top of `DEFAULT_FAMILY_LIMITS` (tasks and debug start low). Cache hits
+    never take a slot.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: float = 8,
+        min_limit: float = 1,
+        max_limit: float = 64,
+        backoff: float = 0.7,
+        tolerance: float = 2.0,
+        families: Optional[Mapping[str, Mapping[str, float]]] = None,
+    ):
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        self.defaults = {"initial": initial, "min_limit": min_limit, "max_limit": max_limit}
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.overrides: Dict[str, Mapping[str, float]] = {
+            **DEFAULT_FAMILY_LIMITS,
+            **(families or {}),
+        }
+        self._families: Dict[str, _Family] = {}
+
+    def family(self, method: str) -> _Family:
+        name = method_family(method)
+        fam = self._families.get(name)
+        if fam is None:
+            cfg = {**self.defaults, **self.overrides.get(name, {})}
+            cfg["initial"] = min(max(cfg["initial"], cfg["min_limit"]), cfg["max_limit"])
+            fam = self._families[name] = _Family(
+                name, backoff=self.backoff, tolerance=self.tolerance, **cfg
+            )
+        return fam
+
+    def slot(self, method: str) -> _Slot:
+        """`async with limiter.slot(method):` around one request."""
+        return _Slot(self.family(method))
+
+    def timed_out(self, method: str, elapsed: float) -> None:
+        """Count a call abandoned after `elapsed` seconds (its slot is already free) as overload."""
+        fam = self.family(method)
+        fam._adjust(elapsed, True, True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {name: fam.stats() for name, fam in sorted(self._families.items())}
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retries for idempotent reads that failed transiently.
+
+    A call to one of `methods` that fails with a code in `codes` (by default
+    `E_FAILED`, which also covers a dropped socket) or an `OSError` is sent
+    again up to `attempts` times in total, sleeping a random time between 0
+    and `backoff_initial * 2**n` (capped at `backoff_max`) before retry n+1.
+    The jitter keeps many callers from retrying in lockstep, and with a
+    limiter each retry waits for a slot like any other call. Writes are
+    never retried: the first attempt may already have been applied.
+    """
+
+    attempts: int = 3
+    backoff_initial: float = 0.05
+    backoff_max: float = 2.0
+    methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    codes: FrozenSet[str] = OVERLOAD_CODES
+    retried: int = field(default=0, init=False)
+    gave_up: int = field(default=0, init=False)
+
+    def should_retry(self, method: str, error: BaseException, attempt: int) -> bool:
+        """Whether attempt number `attempt` (0 = the first) may be followed by another."""
+        if method not in self.methods:
+            return False
+        if not (isinstance(error, OSError) or getattr(error, "code", None) in self.codes):
+            return False
+        if attempt + 1 >= self.attempts:
+            self.gave_up += 1
+            return False
+        self.retried += 1
+        return True
+
+    def delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_initial * 2**attempt))
+
+    def stats(self) -> Dict[str, Any]:
+        return {"retried": self.retried, "gaveUp": self.gave_up}
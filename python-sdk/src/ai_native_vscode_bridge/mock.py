@@ -0,0 +1,419 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import secrets
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+import websockets
+
+from .codec import BridgeCodec, Frame, get_codec
+from .generated_methods import METHODS
+from .transport import BridgeTransport
+
+Latency = Union[float, Callable[[str], float]]
+Handler = Callable[[Dict[str, Any]], Union[Dict[str, Any], Awaitable[Dict[str, Any]]]]
+
+EVENT_BUFFER_MAX = 200
+
+
+def _range(line: int, start: int = 0, end: int = 8) -> Dict[str, Any]:
+    return {
+        "start": {"line": line, "character": start},
+        "end": {"line": line, "character": end},
+    }
+
+
+_WORDS = (
+    "self", "value", "result", "items", "node", "path", "config", "index", "count",
+    "return", "if", "for", "in", "not", "None", "await", "client", "params", "uri",
+)
+
+
+def _source_text(lines: int, width: int) -> str:
+    """Deterministic code-like text of `lines` lines, each exactly `width` chars
+    with its newline, so it compresses like real source rather than a constant."""
+    rng = random.Random(lines)
+    out = []
+    for i in range(lines):
+        indent = " " * (4 * rng.randrange(4))
+        words = " ".join(rng.choice(_WORDS) for _ in range(width // 6))
+        line = f"{indent}{rng.choice(_WORDS)}_{rng.randrange(10 ** 6)} = {words}"
+        out.append(line[: max(width - 1, 0)].ljust(max(width - 1, 0)) + "\n")
+    return "".join(out)
+
+
+class MockBridgeServer:
+    """
+    In-process fake of the VS Code extension's bridge server.
+
+    Speaks the same JSON-RPC 2.0 over WebSocket as the extension: token auth,
+    batch arrays, `E_*` error codes, and `events.subscribe` with replay /
+    `sinceSeq` resume. Every method in the v1 protocol answers; navigation,
+    `doc.read`, diagnostics and `tx.*` return synthetic results of the
+    configured size, everything else returns `{"ok": true}`. Override or add
+    methods with `handlers={"method": fn}` (sync or async `fn(params)`).
+
+    `latency` (seconds, or `fn(method) -> seconds`) plus up to `jitter`
+    seconds is slept before each reply. Requests can be stopped like on the
+    extension: by `bridge.cancel`, by their `meta.timeoutMs` budget running
+    out, or by their socket closing; each one stopped counts in `cancelled`.
+
+    Payloads are shaped by `doc_lines` x `line_length` for documents and
+    `result_items` for list results. `transport` sets compression and the
+    frame limit like the extension's `bridge.compression.*` /
+    `bridge.maxMessageBytes` settings (default: the same defaults);
+    `transport.stats` counts the server side's bytes.
+
+        async with MockBridgeServer(token="t") as server:
+            client = BridgeClient(port=server.port, token="t")
+            await client.call("bridge.ping")
+            await server.emit("doc.saved", {"uri": "file:///a.py"})
+    """
+
+    def __init__(
+        self,
+        *,
+        token: str = "mock-token",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Latency = 0.0,
+        jitter: float = 0.0,
+        doc_lines: int = 200,
+        line_length: int = 80,
+        result_items: int = 10,
+        files: int = 10,
+        handlers: Optional[Dict[str, Handler]] = None,
+        codec: Optional[BridgeCodec] = None,
+        transport: Optional[BridgeTransport] = None,
+    ):
+        self.token = token
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.doc_lines = doc_lines
+        self.line_length = line_length
+        self.result_items = result_items
+        self.files = files
+        self.codec = codec or get_codec()
+        self.transport = transport or BridgeTransport()
+        self.requests = 0
+        self.cancelled = 0
+        self.epoch = secrets.token_hex(8)
+        self._handlers: Dict[str, Handler] = {
+            "bridge.ping": lambda p: {"ok": True, "protocol": "v1-draft"},
+            "bridge.capabilities": self._capabilities,
+            "workspace.info": lambda p: {
+                "folders": [{"name": "mock", "uri": "file:///mock"}],
+                "name": "mock",
+            },
+            "workspace.findFiles": lambda p: {
+                "items": [f"file:///mock/file_{i}.py" for i in range(self.files)][: p.get("maxResults") or 10000],
+                "truncated": self.files > (p.get("maxResults") or 10000),
+            },
+            "doc.read": self._doc_read,
+            "diagnostics.list": self._diagnostics,
+            "code.definitions": self._locations,
+            "code.references": lambda p: {
+                "includeDeclaration": bool(p.get("includeDeclaration", True)),
+                **self._locations(p),
+            },
+            "code.hover": lambda p: {
+                "items": [{"contents": ["x" * self.line_length], "range": _range(0)}]
+            },
+            "code.symbols.document": self._document_symbols,
+            "code.symbols.workspace": self._symbols,
+            "tx.begin": lambda p: {"txId": secrets.token_hex(8), "createdAt": int(time.time() * 1000)},
+            "tx.preview": lambda p: {"txId": p.get("txId"), "fileCount": 0, "unifiedDiff": "", "files": []},
+            "tx.commit": lambda p: {"txId": p.get("txId"), "committed": True, "fileCount": 0},
+            "tx.rollback": lambda p: {"txId": p.get("txId"), "rolledBack": True},
+        }
+        self._handlers.update(handlers or {})
+        self._text: Optional[str] = None
+        self._seq = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._subs: Dict[str, Any] = {}  # subscriptionId -> (socket, filter)
+        self._replays: Dict[str, List[str]] = {}  # subscriptionId -> pending frames
+        self._server: Any = None
+        self._inflight: Dict[Any, "asyncio.Task[Dict[str, Any]]"] = {}  # (socket, id) -> work
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    async def start(self) -> "MockBridgeServer":
+        self._server = await websockets.serve(
+            self._serve, self.host, self.port, **self.transport.server_options()
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self._subs.clear()
+
+    async def __aenter__(self) -> "MockBridgeServer":
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    async def emit(self, name: str, params: Any = None) -> Dict[str, Any]:
+        """Record an event and push it to matching subscribers, like the extension."""
+        self._seq += 1
+        event = {"seq": self._seq, "ts": int(time.time() * 1000), "name": name, "params": params}
+        self._buffer.append(event)
+        del self._buffer[:-EVENT_BUFFER_MAX]
+        frame = self.codec.dumps(
+            {"jsonrpc": "2.0", "method": "events.notification", "params": event}
+        )
+        for ws, flt in list(self._subs.values()):
+            if flt is None or name in flt:
+                try:
+                    await ws.send(frame)
+                except websockets.ConnectionClosed:
+                    pass
+        return event
+
+    # ── transport ──────────────────────────────────────────────────────
+
+    async def _serve(self, ws: Any) -> None:
+        try:
+            async for raw in ws:
+                asyncio.ensure_future(self._dispatch(ws, raw))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            for sub_id, (sock, _) in list(self._subs.items()):
+                if sock is ws:
+                    del self._subs[sub_id]
+            for (sock, _), task in list(self._inflight.items()):
+                if sock is ws:
+                    task.cancel()
+
+    async def _dispatch(self, ws: Any, raw: Frame) -> None:
+        try:
+            msg = self.codec.loads(raw)
+        except ValueError:
+            reply: Any = self._error(None, "E_INVALID_PARAMS", "Invalid JSON")
+        else:
+            if isinstance(msg, list):
+                reply = (
+                    await asyncio.gather(*(self._handle(ws, m) for m in msg))
+                    if msg
+                    else self._error(None, "E_INVALID_PARAMS", "Empty batch")
+                )
+            else:
+                reply = await self._handle(ws, msg)
+        try:
+            await ws.send(self.codec.dumps(reply))
+            # Replay after the subscribe response, as the extension does.
+            for r in reply if isinstance(reply, list) else (reply,):
+                sub_id = (r.get("result") or {}).get("subscriptionId")
+                for frame in self._replays.pop(sub_id, ()):
+                    await ws.send(frame)
+        except websockets.ConnectionClosed:
+            pass
+
+    async def _handle(self, ws: Any, msg: Any) -> Dict[str, Any]:
+        if not isinstance(msg, dict) or msg.get("jsonrpc") != "2.0" or "method" not in msg:
+            return self._error(None, "E_INVALID_PARAMS", "Not a JSON-RPC request")
+        req_id = msg.get("id")
+        params = msg.get("params") or {}
+        self.requests += 1
+        if (params.get("auth") or {}).get("token") != self.token:
+            return self._error(req_id, "E_AUTH", "Invalid or missing token")
+        method = msg["method"]
+        if method == "bridge.cancel":
+            ids = params.get("ids")
+            if not isinstance(ids, list):
+                return self._error(req_id, "E_INVALID_PARAMS", "ids must be an array")
+            tasks = [self._inflight.get((ws, i)) for i in ids]
+            live = [t for t in tasks if t is not None and not t.done()]
+            for task in live:
+                task.cancel()
+            return {"jsonrpc": "2.0", "id": req_id, "result": {"cancelled": len(live)}}
+        key = (ws, req_id)
+        task = asyncio.ensure_future(self._work(ws, req_id, method, params))
+        if req_id is not None:
+            self._inflight[key] = task
+        budget = (params.get("meta") or {}).get("timeoutMs")
+        try:
+            if isinstance(budget, int) and budget > 0:
+                await asyncio.wait({task}, timeout=budget / 1000)
+                task.cancel()  # no-op if it finished in time
+            return await task
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise
+            self.cancelled += 1
+            return self._error(req_id, "E_FAILED", "Cancelled", {"cancelled": True})
+        finally:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+
+    async def _work(self, ws: Any, req_id: Any, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        delay = self.latency(method) if callable(self.latency) else self.latency
+        if self.jitter:
+            delay += random.random() * self.jitter
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if method == "events.subscribe":
+            return self._subscribe(ws, req_id, params)
+        if method == "events.unsubscribe":
+            existed = self._subs.pop(params.get("subscriptionId"), None) is not None
+            return {"jsonrpc": "2.0", "id": req_id, "result": {"unsubscribed": existed}}
+        handler = self._handlers.get(method)
+        if handler is None:
+            if method not in METHODS:
+                return self._error(req_id, "E_NOT_FOUND", "Unknown method", {"method": method})
+            handler = lambda p: {"ok": True}  # noqa: E731
+        try:
+            result = handler(params)
+            if asyncio.iscoroutine(result):
+                result = await result
+        except Exception as e:  # surfaced like the extension's catch-all
+            return self._error(req_id, "E_FAILED", str(e))
+        return {"jsonrpc": "2.0", "id": req_id, "result": result}
+
+    @staticmethod
+    def _error(req_id: Any, code: str, message: str, data: Any = None) -> Dict[str, Any]:
+        error: Dict[str, Any] = {"code": code, "message": message}
+        if data is not None:
+            error["data"] = data
+        return {"jsonrpc": "2.0", "id": req_id, "error": error}
+
+    # ── methods ────────────────────────────────────────────────────────
+
+    def _subscribe(self, ws: Any, req_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        events = params.get("events")
+        flt = set(events) if events else None
+        since = params.get("sinceSeq")
+        gap = False
+        if since is not None:
+            oldest = self._buffer[0]["seq"] if self._buffer else self._seq + 1
+            epoch = params.get("epoch")
+            restarted = (epoch is not None and epoch != self.epoch) or since > self._seq
+            gap = restarted or since + 1 < oldest
+            replay = self._buffer if restarted else [e for e in self._buffer if e["seq"] > since]
+        else:
+            n = params.get("replay") or 0
+            replay = self._buffer[-n:] if n else []
+        replay = [e for e in replay if flt is None or e["name"] in flt]
+        sub_id = secrets.token_hex(8)
+        self._subs[sub_id] = (ws, flt)
+        self._replays[sub_id] = [
+            self.codec.dumps({"jsonrpc": "2.0", "method": "events.notification", "params": e})
+            for e in replay
+        ]
+        return {
+            "jsonrpc": "2.0",
+            "id": req_id,
+            "result": {
+                "subscriptionId": sub_id,
+                "filter": sorted(flt) if flt is not None else None,
+                "replayed": len(replay),
+                "epoch": self.epoch,
+                "latestSeq": self._seq,
+                "oldestSeq": self._buffer[0]["seq"] if self._buffer else None,
+                "gap": gap,
+            },
+        }
+
+    def _capabilities(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "methods": list(METHODS),
+            "events": ["diagnostics.changed", "doc.changed", "doc.saved", "events.notification"],
+            "limitations": ["mock server: synthetic results"],
+            "features": ["batch", "cancel"],
+        }
+
+    def _doc_read(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if self._text is None:
+            self._text = _source_text(self.doc_lines, self.line_length)
+        result: Dict[str, Any] = {
+            "uri": params.get("uri"),
+            "version": 1,
+            "languageId": "plaintext",
+        }
+        start, end = params.get("startLine"), params.get("endLine")
+        if start is None and end is None:
+            result["text"] = self._text
+            return result
+        lo = min(start or 0, self.doc_lines)
+        hi = min(max(self.doc_lines if end is None else end, lo), self.doc_lines)
+        result.update(
+            text=self._text[lo * self.line_length : hi * self.line_length],
+            startLine=lo,
+            endLine=hi,
+            totalLines=self.doc_lines,
+        )
+        return result
+
+    def _locations(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        uri = params.get("uri") or "file:///mock/a.py"
+        return {"items": [{"uri": uri, "range": _range(i)} for i in range(self.result_items)]}
+
+    def _symbols(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "items": [
+                {
+                    "name": f"symbol_{i}",
+                    "kind": 12,
+                    "detail": None,
+                    "range": _range(i, 0, self.line_length),
+                    "selectionRange": _range(i),
+                    "children": 0,
+                }
+                for i in range(self.result_items)
+            ]
+        }
+
+    def _document_symbols(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        # Each symbol has one nested member, listed after it with `flatten`.
+        items = []
+        for item in self._symbols(params)["items"]:
+            items.append({**item, "children": 1})
+            if params.get("flatten"):
+                items[-1]["containerName"] = None
+                line = item["range"]["start"]["line"]
+                items.append(
+                    {
+                        "name": f"member_{line}",
+                        "kind": 6,
+                        "detail": None,
+                        "range": _range(line, 4, self.line_length),
+                        "selectionRange": _range(line, 4),
+                        "children": 0,
+                        "containerName": item["name"],
+                    }
+                )
+        return {"items": items}
+
+    def _diagnostics(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        uris = [params["uri"]] if params.get("uri") else [
+            f"file:///mock/file_{i}.py" for i in range(self.files)
+        ]
+        return {
+            "items": [
+                {
+                    "uri": uri,
+                    "diagnostics": [
+                        {
+                            "range": _range(i),
+                            "message": f"mock diagnostic {i}",
+                            "severity": i % 4,
+                            "source": "mock",
+                            "code": None,
+                        }
+                        for i in range(self.result_items)
+                    ],
+                }
+                for uri in uris
+            ]
+        }
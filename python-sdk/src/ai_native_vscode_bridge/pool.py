@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import Any, Dict, List, Optional
+
+from .cache import BridgeResultCache
+from .codec import BridgeCodec, get_codec
+from .limits import AdaptiveLimiter, RetryPolicy
+from .tracing import BridgeTracer
+from .transport import BridgeTransport
+from .client import (
+    BridgeBatch,
+    BridgeClient,
+    BridgeError,
+    BridgeMethodsMixin,
+    _BatchItem,
+    _resolve_token,
+)
+
+
+class BridgeConnectionPool(BridgeMethodsMixin):
+    """
+    Pool of persistent `BridgeClient` connections.
+
+    Calls go to the least busy open socket; a new socket is opened (up to
+    `max_size`) only when every existing one already has requests in flight.
+    Idle sockets are pinged with `bridge.ping` every `health_interval` seconds
+    and dead ones are reconnected with exponential backoff, so callers keep
+    working across extension restarts and window reloads.
+
+    A call that is already in flight when its socket drops still fails with
+    `BridgeError("E_FAILED", ...)`; it is not retried because the server may
+    have acted on it, unless `retry` allows it (idempotent reads only).
+    `limiter` and `retry` are shared by every socket; `timeout` is the
+    default per-call timeout of every socket (see `BridgeClient`).
+    """
+
+    def __init__(
+        self,
+        *,
+        port: int = 57110,
+        host: str = "127.0.0.1",
+        token: str,
+        min_size: int = 1,
+        max_size: int = 4,
+        health_interval: float = 15.0,
+        health_timeout: float = 5.0,
+        backoff_initial: float = 0.1,
+        backoff_max: float = 5.0,
+        max_attempts: int = 8,
+        cache: Optional[BridgeResultCache] = None,
+        codec: Optional[BridgeCodec] = None,
+        tracer: Optional[BridgeTracer] = None,
+        transport: Optional[BridgeTransport] = None,
+        limiter: Optional[AdaptiveLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        timeout: Optional[float] = None,
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Expected 0 <= min_size <= max_size and max_size >= 1")
+        self.port = port
+        self.host = host
+        self.token = token
+        self.min_size = min_size
+        self.max_size = max_size
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.max_attempts = max_attempts
+        self.cache = cache
+        self.codec = codec or get_codec()
+        self.tracer = tracer
+        # Shared by every socket, so `stats()["transfer"]` is the pool total.
+        self.transport = transport or BridgeTransport()
+        # Shared too: limits protect the extension, not one socket.
+        self.limiter = limiter
+        self.retry = retry
+        self.timeout = timeout
+        self.reconnects = 0
+        self._clients: List[BridgeClient] = []
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self._grow_lock = asyncio.Lock()
+        self._health: Optional["asyncio.Task[None]"] = None
+
+    @classmethod
+    def from_workspace(
+        cls,
+        *,
+        port: int = 57110,
+        token: Optional[str] = None,
+        token_file: Optional[str] = None,
+        workspace_dir: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "BridgeConnectionPool":
+        tok = _resolve_token(token, token_file, workspace_dir)
+        if not tok:
+            raise BridgeError(
+                "E_AUTH",
+                "Missing token. Provide token, set $BRIDGE_TOKEN, or create .vscode/bridge.token.",
+            )
+        return cls(port=port, token=tok, **kwargs)
+
+    @property
+    def size(self) -> int:
+        return len(self._clients)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "codec": self.codec.name,
+            "size": len(self._clients),
+            "connected": sum(1 for c in self._clients if c.connected),
+            "inFlight": [c.in_flight for c in self._clients],
+            "reconnects": self.reconnects,
+            "transfer": self.transport.stats.to_dict(),
+            **({"limits": self.limiter.stats()} if self.limiter is not None else {}),
+            **({"retry": self.retry.stats()} if self.retry is not None else {}),
+        }
+
+    async def open(self) -> "BridgeConnectionPool":
+        while len(self._clients) < self.min_size:
+            await self._add_client()
+        if self._health is None and self.health_interval > 0:
+            self._health = asyncio.create_task(self._health_loop())
+        return self
+
+    async def close(self) -> None:
+        if self._health is not None:
+            self._health.cancel()
+            try:
+                await self._health
+            except asyncio.CancelledError:
+                pass
+            self._health = None
+        clients, self._clients = self._clients, []
+        self._locks.clear()
+        await asyncio.gather(*(c.close() for c in clients), return_exceptions=True)
+
+    async def __aenter__(self) -> "BridgeConnectionPool":
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def call(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        client = await self._acquire()
+        return await client.call(method, params, timeout=timeout)
+
+    def batch(self) -> BridgeBatch:
+        """Like `BridgeClient.batch()`; the whole batch goes to one pooled socket."""
+        return BridgeBatch(self)
+
+    async def _send_batch(self, items: List[_BatchItem]) -> None:
+        client = await self._acquire()
+        await client._send_batch(items)
+
+    async def _add_client(self) -> BridgeClient:
+        client = BridgeClient(
+            port=self.port,
+            host=self.host,
+            token=self.token,
+            cache=self.cache,
+            codec=self.codec,
+            tracer=self.tracer,
+            transport=self.transport,
+            limiter=self.limiter,
+            retry=self.retry,
+            timeout=self.timeout,
+        )
+        self._locks[id(client)] = asyncio.Lock()
+        await self._connect(client)
+        self._clients.append(client)
+        return client
+
+    async def _acquire(self) -> BridgeClient:
+        live = [c for c in self._clients if c.connected]
+        best = min(live, key=lambda c: c.in_flight, default=None)
+        if best is not None and best.in_flight == 0:
+            return best
+        if len(self._clients) < self.max_size:
+            async with self._grow_lock:
+                # While we waited for the lock, another caller may have grown
+                # the pool or a socket may have gone idle: use it instead.
+                idle = next((c for c in self._clients if c.connected and c.in_flight == 0), None)
+                if idle is not None:
+                    return idle
+                if len(self._clients) < self.max_size:
+                    return await self._add_client()
+            live = [c for c in self._clients if c.connected]
+            best = min(live, key=lambda c: c.in_flight, default=None)
+        if best is not None:
+            return best
+        # Every socket is down: reconnect the least busy one before dispatching.
+        client = min(self._clients, key=lambda c: c.in_flight)
+        await self._connect(client)
+        return client
+
+    async def _connect(self, client: BridgeClient) -> None:
+        lock = self._locks.get(id(client))
+        if lock is None:
+            raise BridgeError("E_FAILED", "Connection pool is closed")
+        async with lock:
+            if client.connected:
+                return
+            delay = self.backoff_initial
+            for _ in range(self.max_attempts):
+                try:
+                    await client.connect()
+                except Exception:  # OSError or a websockets handshake error
+                    await asyncio.sleep(delay * (0.5 + random.random() / 2))
+                    delay = min(delay * 2, self.backoff_max)
+                    continue
+                if any(c is client for c in self._clients):
+                    self.reconnects += 1
+                return
+            raise BridgeError(
+                "E_FAILED",
+                f"Could not connect to {client.url} after {self.max_attempts} attempts",
+            )
+
+    async def _check(self, client: BridgeClient) -> None:
+        if client.connected:
+            if client.in_flight:
+                return
+            try:
+                await asyncio.wait_for(client.call("bridge.ping"), self.health_timeout)
+                return
+            except Exception:
+                await client.close()
+        try:
+            await self._connect(client)
+        except BridgeError:
+            pass
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval)
+            await asyncio.gather(
+                *(self._check(c) for c in list(self._clients)), return_exceptions=True
+            )
@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import mmap
+import os
+import re
+import struct
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from .cache import _normalize
+from .codec import BridgeCodec, Frame, get_codec
+from .tracing import frame_size
+from .transport import BridgeTransport
+
+MAGIC = b"AINREC\x00\x01"
+# kind, connection number, time.time(), payload length; then the payload.
+_HEADER = struct.Struct("<BIdI")
+OPENED, SENT, RECEIVED, CLOSED = 0, 1, 2, 3
+
+_Key = Tuple[str, str]
+
+
+def _key(msg: Dict[str, Any]) -> _Key:
+    return msg.get("method") or "", _normalize(msg.get("params"))
+
+
+def _utf8(frame: Frame) -> bytes:
+    return frame.encode("utf-8") if isinstance(frame, str) else bytes(frame)
+
+
+class _Connect:
+    """What `BridgeTransport.connect()` returns: awaitable, or `async with`."""
+
+    def __init__(self, open_: Callable[[], Awaitable[Any]]):
+        self._open = open_
+        self._ws: Any = None
+
+    def __await__(self) -> Any:
+        return self._open().__await__()
+
+    async def __aenter__(self) -> Any:
+        self._ws = await self._open()
+        return self._ws
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self._ws.close()
+
+
+# ── recording ─────────────────────────────────────────────────────────
+
+
+class _RecordedConnection:
+    """A live connection that logs every frame it sends and receives."""
+
+    def __init__(self, ws: Any, log: "RecordingTransport", conn: int):
+        self._ws = ws
+        self._log = log
+        self._conn = conn
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._ws, name)
+
+    async def send(self, message: Frame, text: Optional[bool] = None) -> None:
+        self._log._write(SENT, self._conn, _utf8(message))
+        await self._ws.send(message, text=text)
+
+    async def recv(self, decode: Optional[bool] = None) -> Frame:
+        message = await self._ws.recv(decode)
+        self._log._write(RECEIVED, self._conn, _utf8(message))
+        return message
+
+    async def __aiter__(self) -> Any:
+        async for message in self._ws:
+            self._log._write(RECEIVED, self._conn, _utf8(message))
+            yield message
+
+    async def close(self, *args: Any, **kwargs: Any) -> None:
+        try:
+            await self._ws.close(*args, **kwargs)
+        finally:
+            self._log._write(CLOSED, self._conn, b"")
+            self._log.flush()
+
+
+class RecordingTransport(BridgeTransport):
+    """
+    A `BridgeTransport` that appends every frame of every socket it opens to
+    `path`: requests, responses and events, each with its wall-clock time.
+
+    Use it for a real session, then hand the file to `ReplayTransport`:
+
+        recorder = RecordingTransport("session.rec")
+        async with BridgeClient.from_workspace(transport=recorder) as client:
+            ...                                  # run the agent for real
+        recorder.close()
+
+    Each record is a 17-byte header (kind, socket number, timestamp, length)
+    followed by the frame as sent, so recording costs one buffered write per
+    frame. Records are appended: several runs can share one file. The file
+    is flushed whenever a socket closes and on `close()`. Other arguments
+    are `BridgeTransport`'s (compression applies to the live sockets).
+    """
+
+    def __init__(self, path: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.path = path
+        self.records = 0
+        self._f = open(path, "ab")
+        if self._f.tell() == 0:
+            self._f.write(MAGIC)
+        self._conns = 0
+
+    def connect(self, url: str) -> Any:
+        async def open_() -> _RecordedConnection:
+            ws = await super(RecordingTransport, self).connect(url)
+            self._conns += 1
+            self._write(OPENED, self._conns, url.encode("utf-8"))
+            return _RecordedConnection(ws, self, self._conns)
+
+        return _Connect(open_)
+
+    def flush(self) -> None:
+        if not self._f.closed:
+            self._f.flush()
+
+    def close(self) -> None:
+        if not self._f.closed:
+            self._f.close()
+
+    def __enter__(self) -> "RecordingTransport":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _write(self, kind: int, conn: int, payload: bytes) -> None:
+        if self._f.closed:
+            return
+        self._f.write(_HEADER.pack(kind, conn, time.time(), len(payload)) + payload)
+        self.records += 1
+
+
+# ── replay ────────────────────────────────────────────────────────────
+
+
+class _Response:
+    __slots__ = ("offset", "length", "id_span", "obj", "latency", "events")
+
+    def __init__(self, latency: float):
+        self.offset = 0
+        self.length = 0
+        self.id_span: Optional[Tuple[int, int]] = None  # recorded id literal, relative to offset
+        self.obj: Optional[Dict[str, Any]] = None  # batch items are kept decoded
+        self.latency = latency
+        # Notifications that followed a *.subscribe response on its socket:
+        # (offset, length, seconds after the response).
+        self.events: List[Tuple[int, int, float]] = []
+
+
+def _id_span(head: bytes, req_id: Any) -> Optional[Tuple[int, int]]:
+    literal = re.escape(json.dumps(req_id, separators=(",", ":")).encode("utf-8"))
+    m = re.search(rb'"id"\s*:\s*(' + literal + rb")", head)
+    return (m.start(1), m.end(1)) if m else None
+
+
+class _ReplayConnection:
+    """Answers requests from the recording; nothing leaves the process."""
+
+    def __init__(self, transport: "ReplayTransport"):
+        self._t = transport
+        self._inbox: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue()
+        self._timers: List[asyncio.TimerHandle] = []
+        self._closed = False
+
+    async def send(self, message: Frame, text: Optional[bool] = None) -> None:
+        if self._closed:
+            raise self._t._closed_exc()
+        t = self._t
+        t.stats.messages_sent += 1
+        t.stats.payload_bytes_sent += frame_size(message)
+        t.stats.wire_bytes_sent += frame_size(message)
+        msg = t.codec.loads(message)
+        if isinstance(msg, list):
+            replies = [t._answer_obj(m) for m in msg if isinstance(m, dict) and "id" in m]
+            latency = max((lat for _, lat in replies), default=0.0)
+            self._deliver(t.codec.dumps([r for r, _ in replies]), latency)
+            return
+        if not isinstance(msg, dict) or "id" not in msg:
+            return  # a notification: nothing to answer
+        entry = t._lookup(msg)
+        if entry is None:
+            self._deliver(t.codec.dumps(t._miss(msg)), 0.0)
+            return
+        self._deliver(t._frame(entry, msg["id"]), entry.latency)
+        for offset, length, delay in entry.events:
+            t.events += 1
+            self._deliver(bytes(t._mm[offset : offset + length]), entry.latency + delay)
+
+    async def recv(self, decode: Optional[bool] = None) -> bytes:
+        frame = await self._inbox.get()
+        if frame is None:
+            self._inbox.put_nowait(None)
+            raise self._t._closed_exc()
+        stats = self._t.stats
+        stats.messages_received += 1
+        stats.payload_bytes_received += len(frame)
+        stats.wire_bytes_received += len(frame)
+        return frame
+
+    async def __aiter__(self) -> Any:
+        from websockets.exceptions import ConnectionClosedOK
+
+        while True:
+            try:
+                yield await self.recv()
+            except ConnectionClosedOK:
+                return
+
+    async def close(self, *args: Any, **kwargs: Any) -> None:
+        if not self._closed:
+            self._closed = True
+            for timer in self._timers:
+                timer.cancel()
+            self._inbox.put_nowait(None)
+
+    def _deliver(self, frame: Frame, delay: float) -> None:
+        data = _utf8(frame)
+        speed = self._t.speed
+        if speed is None or delay <= 0:
+            self._inbox.put_nowait(data)
+            return
+        loop = asyncio.get_running_loop()
+        self._timers.append(loop.call_later(delay / speed, self._put, data))
+
+    def _put(self, data: bytes) -> None:
+        if not self._closed:
+            self._inbox.put_nowait(data)
+
+
+class ReplayTransport(BridgeTransport):
+    """
+    A `BridgeTransport` that answers from a `RecordingTransport` file
+    instead of a bridge, for deterministic offline runs and for profiling
+    an agent's own overhead.
+
+        transport = ReplayTransport("session.rec")             # as fast as possible
+        transport = ReplayTransport("session.rec", speed=1.0)  # recorded latencies
+        async with BridgeClient(token="x", transport=transport) as client:
+            ...                                                # same calls as recorded
+
+    The file is memory-mapped and indexed once by request method and params
+    (`auth` and `meta` ignored). A request gets the recorded response with
+    its id rewritten; repeated identical requests get the recorded responses
+    in order, then the last one again. Events that followed an
+    `events.subscribe` / `*.subscribe` response are replayed after it, so a
+    `BridgeEventStream` on this transport sees the recorded stream. A request
+    that was never recorded gets `E_NOT_FOUND` and counts in
+    `replay_stats()["misses"]`.
+
+    `speed=None` answers at once; `speed=1.0` waits the recorded latency
+    (and event spacing), `2.0` half of it. Tokens and ports do not matter.
+    """
+
+    def __init__(self, path: str, *, speed: Optional[float] = None, codec: Optional[BridgeCodec] = None):
+        super().__init__(compression=False)
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be > 0 (or None for as fast as possible)")
+        self.path = path
+        self.speed = speed
+        self.codec = codec or get_codec()
+        self.hits = 0
+        self.misses = 0
+        self.events = 0
+        self.recorded = 0  # responses indexed
+        self.dropped = 0  # recorded notifications not tied to a subscription
+        self._responses: Dict[_Key, Deque[_Response]] = {}
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        if self._mm[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a bridge recording")
+        self._index()
+
+    def connect(self, url: str) -> Any:
+        async def open_() -> _ReplayConnection:
+            return _ReplayConnection(self)
+
+        return _Connect(open_)
+
+    def close(self) -> None:
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+
+    def replay_stats(self) -> Dict[str, Any]:
+        return {
+            "recorded": self.recorded,
+            "keys": len(self._responses),
+            "hits": self.hits,
+            "misses": self.misses,
+            "events": self.events,
+            "dropped": self.dropped,
+        }
+
+    # ── index ─────────────────────────────────────────────────────────
+
+    def _index(self) -> None:
+        mm, codec = self._mm, self.codec
+        pending: Dict[Tuple[int, Any], Tuple[_Key, float]] = {}
+        subs: Dict[int, Tuple[_Response, float]] = {}  # socket -> last subscription
+        pos, end = len(MAGIC), len(mm)
+        while pos + _HEADER.size <= end:
+            kind, conn, ts, length = _HEADER.unpack_from(mm, pos)
+            start = pos + _HEADER.size
+            pos = start + length
+            if pos > end:
+                break  # a record cut short by a crash
+            if kind == SENT:
+                msg = codec.loads(mm[start:pos])
+                for m in msg if isinstance(msg, list) else (msg,):
+                    if isinstance(m, dict) and "id" in m:
+                        pending[(conn, m["id"])] = (_key(m), ts)
+            elif kind == RECEIVED:
+                req_id, msg = codec.peek(mm[start:pos])
+                if isinstance(msg, list):
+                    for m in msg:
+                        entry = self._add(pending.pop((conn, m.get("id")), None), ts)
+                        if entry is not None:
+                            entry.obj = m
+                elif req_id is not None:
+                    sent = pending.pop((conn, req_id), None)
+                    entry = self._add(sent, ts)
+                    if entry is not None:
+                        entry.offset, entry.length = start, length
+                        entry.id_span = _id_span(mm[start : start + min(length, 128)], req_id)
+                        if sent is not None and sent[0][0].endswith("subscribe"):
+                            subs[conn] = (entry, ts)
+                elif conn in subs:
+                    entry, since = subs[conn]
+                    entry.events.append((start, length, ts - since))
+                else:
+                    self.dropped += 1
+            elif kind == CLOSED:
+                subs.pop(conn, None)
+
+    def _add(self, sent: Optional[Tuple[_Key, float]], ts: float) -> Optional[_Response]:
+        if sent is None:
+            return None
+        key, sent_at = sent
+        entry = _Response(max(0.0, ts - sent_at))
+        self.recorded += 1
+        self._responses.setdefault(key, deque()).append(entry)
+        return entry
+
+    # ── answering ─────────────────────────────────────────────────────
+
+    def _lookup(self, msg: Dict[str, Any]) -> Optional[_Response]:
+        queue = self._responses.get(_key(msg))
+        if not queue:
+            return None
+        self.hits += 1
+        return queue.popleft() if len(queue) > 1 else queue[0]
+
+    def _miss(self, msg: Dict[str, Any]) -> Dict[str, Any]:
+        self.misses += 1
+        return {
+            "jsonrpc": "2.0",
+            "id": msg.get("id"),
+            "error": {
+                "code": "E_NOT_FOUND",
+                "message": "Request not in recording",
+                "data": {"method": msg.get("method")},
+            },
+        }
+
+    def _frame(self, entry: _Response, req_id: Any) -> Frame:
+        if entry.obj is not None:
+            return self.codec.dumps({**entry.obj, "id": req_id})
+        raw = self._mm[entry.offset : entry.offset + entry.length]
+        if entry.id_span is None:
+            return self.codec.dumps({**self.codec.loads(raw), "id": req_id})
+        s, e = entry.id_span
+        new_id = json.dumps(req_id, separators=(",", ":")).encode("utf-8")
+        return raw[:s] + new_id + raw[e:]
+
+    def _answer_obj(self, msg: Dict[str, Any]) -> Tuple[Dict[str, Any], float]:
+        entry = self._lookup(msg)
+        if entry is None:
+            return self._miss(msg), 0.0
+        if entry.obj is not None:
+            return {**entry.obj, "id": msg["id"]}, entry.latency
+        return self.codec.loads(self._frame(entry, msg["id"])), entry.latency
+
+    @staticmethod
+    def _closed_exc() -> Exception:
+        from websockets.exceptions import ConnectionClosedOK
+
+        return ConnectionClosedOK(None, None)
@@ -0,0 +1,239 @@
+"""
+Run JSON-RPC requests from a JSONL stream over one persistent connection.
+
+    python -m ai_native_vscode_bridge.run requests.jsonl -j 32 > results.jsonl
+    cat session.jsonl | python -m ai_native_vscode_bridge.run --order completion
+
+Each input line is a request, `{"id": 7, "method": "doc.read", "params":
+{...}}` (`jsonrpc` optional; `auth` is replaced by this run's token). Each
+output line is its JSON-RPC response, with the request's `id`, or the
+1-based input line number for requests without one. Blank lines are
+skipped; a line that is not a request gets an `E_INVALID_PARAMS` error.
+
+Up to `--parallel` requests are in flight at once, pipelined over
+`--connections` sockets. `--order request` (default) writes responses in
+input order; `--order completion` writes each as soon as it arrives.
+Requests run concurrently, so a request that needs an earlier one's result
+(`tx.commit` after `tx.begin`) only runs reliably with `-j 1`. Exits with
+status 1 if any request failed, 2 if the bridge could not be reached.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+from .client import BridgeError
+from .codec import BridgeCodec, get_codec
+from .pool import BridgeConnectionPool
+
+_CHUNK = 256  # input lines handed from the reader thread at a time
+
+_Line = Tuple[int, bytes]
+
+
+def _error(code: str, message: str, data: Any = None) -> Dict[str, Any]:
+    error: Dict[str, Any] = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return error
+
+
+def _read_chunks(
+    f: IO[bytes], queue: "asyncio.Queue[Optional[List[_Line]]]", loop: asyncio.AbstractEventLoop
+) -> None:
+    """Reader thread: feeds numbered lines to the loop without blocking it on I/O."""
+
+    def put(item: Optional[List[_Line]]) -> None:
+        asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+    try:
+        chunk: List[_Line] = []
+        for lineno, line in enumerate(f, 1):
+            chunk.append((lineno, line))
+            if len(chunk) >= _CHUNK:
+                put(chunk)
+                chunk = []
+        if chunk:
+            put(chunk)
+    finally:
+        put(None)
+
+
+class _Runner:
+    def __init__(self, pool: BridgeConnectionPool, out: IO[bytes], args: argparse.Namespace):
+        self.pool = pool
+        self.out = out
+        self.codec: BridgeCodec = pool.codec
+        self.in_order = args.order == "request"
+        self.timeout: Optional[float] = args.timeout
+        self.inflight = asyncio.Semaphore(args.parallel)
+        # Responses held back behind a slow earlier request, at most.
+        self.window = asyncio.Semaphore(args.parallel * 16)
+        self.done: Dict[int, bytes] = {}
+        self.next = 0
+        self.requests = 0
+        self.errors = 0
+        self._flush: Optional[asyncio.TimerHandle] = None
+
+    async def run(self, lines: "asyncio.Queue[Optional[List[_Line]]]") -> None:
+        tasks = set()
+        while True:
+            chunk = await lines.get()
+            if chunk is None:
+                break
+            for lineno, line in chunk:
+                if not line.strip():
+                    continue
+                if self.in_order:
+                    await self.window.acquire()
+                await self.inflight.acquire()
+                task = asyncio.ensure_future(self._one(self.requests, lineno, line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                self.requests += 1
+        await asyncio.gather(*tasks)
+        if self._flush is not None:
+            self._flush.cancel()
+        self._flush_now()
+
+    async def _one(self, index: int, lineno: int, line: bytes) -> None:
+        try:
+            reply = await self._call(lineno, line)
+        finally:
+            self.inflight.release()
+        frame = self.codec.dumps(reply)
+        data = frame if isinstance(frame, bytes) else frame.encode("utf-8")
+        if not self.in_order:
+            self._write(data)
+            return
+        self.done[index] = data
+        while self.next in self.done:
+            self._write(self.done.pop(self.next))
+            self.next += 1
+            self.window.release()
+
+    async def _call(self, lineno: int, line: bytes) -> Dict[str, Any]:
+        req_id: Any = lineno
+        try:
+            msg = self.codec.loads(line)
+            if not isinstance(msg, dict) or not isinstance(msg.get("method"), str):
+                raise ValueError("not a JSON-RPC request")
+            req_id = msg.get("id", lineno)
+            params = msg.get("params")
+            if params is not None and not isinstance(params, dict):
+                raise ValueError("params must be an object")
+        except ValueError as e:
+            self.errors += 1
+            error = _error("E_INVALID_PARAMS", f"Line {lineno}: {e}", {"line": lineno})
+            return {"jsonrpc": "2.0", "id": req_id, "error": error}
+        try:
+            result = await self.pool.call(msg["method"], params, timeout=self.timeout)
+        except BridgeError as e:
+            self.errors += 1
+            return {"jsonrpc": "2.0", "id": req_id, "error": _error(e.code, e.message, e.data)}
+        except OSError as e:
+            self.errors += 1
+            return {"jsonrpc": "2.0", "id": req_id, "error": _error("E_FAILED", str(e))}
+        return {"jsonrpc": "2.0", "id": req_id, "result": result}
+
+    def _write(self, data: bytes) -> None:
+        self.out.write(data)
+        self.out.write(b"\n")
+        if self._flush is None:
+            # Flushed shortly after, not per line: a reading pipe sees
+            # results promptly without a syscall per response.
+            self._flush = asyncio.get_running_loop().call_later(0.05, self._flush_now)
+
+    def _flush_now(self) -> None:
+        self._flush = None
+        self.out.flush()
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    pool = BridgeConnectionPool.from_workspace(
+        port=args.port,
+        token=args.token,
+        token_file=args.token_file,
+        workspace_dir=args.workspace_dir,
+        host=args.host,
+        min_size=1,
+        max_size=args.connections,
+        codec=get_codec(args.codec),
+    )
+    src = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    out = sys.stdout.buffer if args.output in (None, "-") else open(args.output, "wb")
+    started = time.perf_counter()
+    try:
+        try:
+            await pool.open()
+        except (BridgeError, OSError) as e:
+            print(f"Cannot reach the bridge on {args.host}:{args.port}: {e}", file=sys.stderr)
+            return 2
+        loop = asyncio.get_running_loop()
+        lines: "asyncio.Queue[Optional[List[_Line]]]" = asyncio.Queue(maxsize=8)
+        reader = threading.Thread(target=_read_chunks, args=(src, lines, loop), daemon=True)
+        reader.start()
+        runner = _Runner(pool, out, args)
+        await runner.run(lines)
+        pool_stats = pool.stats()
+    finally:
+        await pool.close()
+        if src is not sys.stdin.buffer:
+            src.close()
+        if out is not sys.stdout.buffer:
+            out.close()
+    if args.stats:
+        elapsed = time.perf_counter() - started
+        summary = {
+            "requests": runner.requests,
+            "errors": runner.errors,
+            "seconds": round(elapsed, 3),
+            "perSecond": round(runner.requests / elapsed, 1) if elapsed > 0 else None,
+            **pool_stats,
+        }
+        print(json.dumps(summary), file=sys.stderr)
+    return 1 if runner.errors else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m ai_native_vscode_bridge.run",
+        description="Run JSON-RPC requests from JSONL over a persistent bridge connection.",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="JSONL file of requests (default: stdin)")
+    parser.add_argument("-o", "--output", help="Write responses here (default: stdout)")
+    parser.add_argument(
+        "-j", "--parallel", type=int, default=16,
+        help="Requests in flight at once (default: 16; 1 runs them strictly in sequence)",
+    )
+    parser.add_argument(
+        "--order", choices=["request", "completion"], default="request",
+        help="Write responses in input order (default) or as they complete",
+    )
+    parser.add_argument("--connections", type=int, default=1, help="Sockets to pipeline over (default: 1)")
+    parser.add_argument("--timeout", type=float, help="Per-request timeout, seconds (default: none)")
+    parser.add_argument("--port", type=int, default=57110, help="Bridge port (default: 57110)")
+    parser.add_argument("--host", default="127.0.0.1", help="Bridge host (default: 127.0.0.1)")
+    parser.add_argument("--token", help="Bridge token (default: $BRIDGE_TOKEN or .vscode/bridge.token)")
+    parser.add_argument("--token-file", help="Read the token from this file")
+    parser.add_argument("--workspace-dir", help="Workspace whose .vscode/bridge.token to use (default: cwd)")
+    parser.add_argument("--codec", choices=["msgspec", "orjson", "json"], help="JSON codec (default: fastest installed)")
+    parser.add_argument("--stats", action="store_true", help="Print a JSON summary to stderr at the end")
+    args = parser.parse_args(argv)
+    if args.parallel < 1 or args.connections < 1:
+        parser.error("--parallel and --connections must be >= 1")
+    try:
+        return asyncio.run(main_async(args))
+    except (BridgeError, OSError) as e:  # no token, unreadable input file
+        print(e, file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
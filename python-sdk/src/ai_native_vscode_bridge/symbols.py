@@ -0,0 +1,590 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import json
+import mmap
+import os
+import re
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterable,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .cache import INVALIDATING_EVENTS
+from .client import BridgeError
+
+MAGIC = b"AINSYM\x00\x01"
+_NONE = 0xFFFFFFFF
+# Per-symbol record: name offset, name length, kind, uri index, container
+# index, then start line/character and end line/character.
+_FIELDS = 9
+
+# Files `build()` asks symbols for by default: source code only, so the
+# language servers are not asked about images, archives or lock files.
+DEFAULT_INCLUDE = (
+    "**/*.{py,pyi,js,jsx,mjs,cjs,ts,tsx,mts,cts,java,kt,kts,scala,go,rs,c,h,cc,cpp,cxx,hh,hpp,"
+    "cs,fs,swift,m,mm,rb,php,lua,dart,ex,exs,erl,hs,ml,clj,r,jl,sh,ps1,sql,vue,svelte}"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SymbolEntry:
+    name: str
+    kind: int
+    uri: str
+    container: Optional[str]
+    start_line: int
+    start_character: int
+    end_line: int
+    end_character: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Same shape as a `code.symbols.workspace` item."""
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "containerName": self.container,
+            "location": {
+                "uri": self.uri,
+                "range": {
+                    "start": {"line": self.start_line, "character": self.start_character},
+                    "end": {"line": self.end_line, "character": self.end_character},
+                },
+            },
+        }
+
+
+def _entries(uri: str, items: Any) -> List[SymbolEntry]:
+    """`code.symbols.document` items (DocumentSymbol or SymbolInformation shape)."""
+    out: List[SymbolEntry] = []
+    for item in items if isinstance(items, list) else ():
+        if not isinstance(item, dict) or not isinstance(item.get("name"), str):
+            continue
+        loc = item.get("location") if isinstance(item.get("location"), dict) else {}
+        rng = loc.get("range") if loc else item.get("range")
+        start = (rng or {}).get("start") or {}
+        end = (rng or {}).get("end") or start
+        out.append(
+            SymbolEntry(
+                name=item["name"],
+                kind=int(item.get("kind") or 0),
+                uri=loc.get("uri") or uri,
+                container=item.get("containerName"),
+                start_line=int(start.get("line", 0)),
+                start_character=int(start.get("character", 0)),
+                end_line=int(end.get("line", 0)),
+                end_character=int(end.get("character", 0)),
+            )
+        )
+    return out
+
+
+def _fuzzy_pattern(needle: bytes) -> "re.Pattern[bytes]":
+    """
+    A lowercased name containing `needle`'s characters in order. Each gap is
+    `[^c\n]*` up to the next character `c`, so the leftmost match is found
+    without backtracking. Group 1 is the matched span; the rest of the line
+    is consumed so each name matches at most once.
+    """
+    chars = [re.escape(needle[i : i + 1]) for i in range(len(needle))]
+    body = chars[0] + b"".join(b"[^" + c + b"\n]*" + c for c in chars[1:])
+    return re.compile(b"(" + body + b")[^\n]*")
+
+
+def _fuzzy_key(m: "re.Match[bytes]", line_start: int, qlen: int) -> Tuple[bool, bool, int, int, int]:
+    # Exact, then prefix matches first; then tighter matches and shorter names.
+    start, end = m.start(1), m.end(1)
+    prefix = start == line_start and end - start == qlen
+    return (not (prefix and m.end() == end), not prefix, end - start, m.end() - line_start, line_start)
+
+
+class _Snapshot:
+    """
+    Immutable, name-sorted symbol table over a bytes-like buffer.
+
+    Layout: MAGIC, u32 header length, JSON header (uris, containers, counts),
+    padding to 4 bytes, `count * 9` little-endian u32 records, every name
+    followed by a newline, then the same names ASCII-lowercased (same
+    offsets). Queries read the buffer in place, so a memory-mapped file is
+    usable without decoding it first.
+    """
+
+    def __init__(self, buf: Any, *, mapped: Optional[mmap.mmap] = None):
+        if buf[:8] != MAGIC:
+            raise ValueError("Not a symbol index file")
+        header_len = int.from_bytes(buf[8:12], "little")
+        header = json.loads(buf[12 : 12 + header_len])
+        start = (12 + header_len + 3) & ~3
+        self.count: int = header["count"]
+        self.created_at: int = header["createdAt"]
+        self.uris: List[str] = header["uris"]
+        self.uri_counts: List[int] = header["uriCounts"]
+        self.containers: List[str] = header["containers"]
+        self.uri_index = {uri: i for i, uri in enumerate(self.uris)}
+        self._names_at = start + self.count * _FIELDS * 4
+        self._lower_at = self._names_at + header["namesSize"]
+        self._lower_end = self._lower_at + header["namesSize"]
+        view = memoryview(buf)[start : self._names_at]
+        if sys.byteorder != "little":  # stored little-endian; big-endian hosts copy
+            swapped = array("I", view.tobytes())
+            swapped.byteswap()
+            view.release()
+            view = memoryview(swapped)
+        self._view = view
+        self._recs = view.cast("I") if view.format != "I" else view
+        self._buf = buf
+        self._mapped = mapped
+
+    @staticmethod
+    def encode(entries: Iterable[SymbolEntry]) -> bytes:
+        uris: Dict[str, int] = {}
+        uri_counts: List[int] = []
+        containers: Dict[str, int] = {}
+        rows = sorted(
+            ((e.name.replace("\n", " ").encode("utf-8"), e) for e in entries),
+            key=lambda r: (r[0].lower(), r[0]),
+        )
+        recs = array("I")
+        names = bytearray()
+        for raw, e in rows:
+            u = uris.setdefault(e.uri, len(uris))
+            if u == len(uri_counts):
+                uri_counts.append(0)
+            uri_counts[u] += 1
+            c = _NONE if e.container is None else containers.setdefault(e.container, len(containers))
+            recs.extend((
+                len(names), len(raw), e.kind & _NONE, u, c,
+                e.start_line, e.start_character, e.end_line, e.end_character,
+            ))
+            names += raw + b"\n"
+        if sys.byteorder != "little":
+            recs.byteswap()
+        header = json.dumps(
+            {
+                "version": 1,
+                "createdAt": int(time.time() * 1000),
+                "count": len(rows),
+                "namesSize": len(names),
+                "uris": list(uris),
+                "uriCounts": uri_counts,
+                "containers": list(containers),
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        pad = b"\0" * (-(12 + len(header)) % 4)
+        return b"".join((
+            MAGIC, len(header).to_bytes(4, "little"), header, pad,
+            recs.tobytes(), bytes(names), bytes(names).lower(),
+        ))
+
+    @classmethod
+    def open(cls, path: str) -> "_Snapshot":
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(mapped, mapped=mapped)
+        except BaseException:
+            mapped.close()
+            raise
+
+    def close(self) -> None:
+        self._recs.release()
+        self._view.release()
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+
+    def data(self) -> bytes:
+        return bytes(self._buf)
+
+    def field(self, i: int, f: int) -> int:
+        return self._recs[i * _FIELDS + f]
+
+    def lower_name(self, i: int) -> bytes:
+        off = self._lower_at + self._recs[i * _FIELDS]
+        return self._buf[off : off + self._recs[i * _FIELDS + 1]]
+
+    def entry(self, i: int) -> SymbolEntry:
+        r = self._recs[i * _FIELDS : (i + 1) * _FIELDS].tolist()
+        off = self._names_at + r[0]
+        return SymbolEntry(
+            name=self._buf[off : off + r[1]].decode("utf-8"),
+            kind=r[2],
+            uri=self.uris[r[3]],
+            container=None if r[4] == _NONE else self.containers[r[4]],
+            start_line=r[5],
+            start_character=r[6],
+            end_line=r[7],
+            end_character=r[8],
+        )
+
+    def prefix(self, needle: bytes) -> Iterator[int]:
+        """Record indices whose lowercased name starts with `needle`, in name order."""
+        i = bisect_left(range(self.count), needle, key=self.lower_name)
+        while i < self.count and self.lower_name(i).startswith(needle):
+            yield i
+            i += 1
+
+    def fuzzy(self, pattern: "re.Pattern[bytes]", qlen: int) -> Iterator[Tuple[bool, bool, int, int, int]]:
+        """A rank key (see `_fuzzy_key`) for every name matching a `_fuzzy_pattern`."""
+        buf, lo = self._buf, self._lower_at
+        for m in pattern.finditer(buf, lo, self._lower_end):
+            nl = buf.rfind(b"\n", lo, m.start())
+            yield _fuzzy_key(m, nl + 1 if nl >= 0 else lo, qlen)
+
+    def at_offset(self, line: int) -> int:
+        """Record index of the lowercased name starting at buffer offset `line`."""
+        rel = line - self._lower_at
+        return bisect_left(range(self.count), rel, key=lambda j: self._recs[j * _FIELDS])
+
+    def by_uri(self, u: int) -> Iterator[int]:
+        uris = self._recs[3::_FIELDS].tolist()
+        return (i for i, x in enumerate(uris) if x == u)
+
+
+class SymbolIndex:
+    """
+    Client-side index of workspace symbols for instant lookups.
+
+    `build()` lists files with `workspace.findFiles` (or takes `uris`) and
+    fetches `code.symbols.document` for them in parallel. `prefix()` and
+    `search()` (fuzzy, fzf-style subsequence) then answer locally from a
+    name-sorted table without going back to the language server.
+
+    Prefix lookups bisect the name-sorted table (tens of microseconds);
+    fuzzy lookups scan a lowercased copy of all names with one regex (a few
+    ms per 100k symbols) and memoize recent queries until the index changes.
+
+    The table is an immutable snapshot that `save()` writes to disk and
+    `load()` memory-maps, so a new process starts warm without parsing it.
+    Documents that change afterwards (`handle_event()` / `follow(stream)`
+    with `doc.changed` / `doc.saved`) are re-fetched after `debounce`
+    seconds into a small overlay that shadows their snapshot entries; once
+    `compact_after` files are overlaid they are merged into a new snapshot.
+
+    Symbols are fetched with `flatten: true`, so nested DocumentSymbols
+    (methods, class members) are indexed too, with their parent's name as
+    `container`.
+    A loaded snapshot reflects the workspace at `stats()["createdAt"]`;
+    `refresh()` or `build()` if files may have changed while no process was
+    following events.
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        *,
+        concurrency: int = 16,
+        debounce: float = 0.5,
+        compact_after: int = 256,
+    ):
+        self.client = client
+        self.concurrency = max(1, concurrency)
+        self.debounce = debounce
+        self.compact_after = compact_after
+        self.path: Optional[str] = None
+        self.fetched = 0
+        self.failures = 0
+        self._snapshot = _Snapshot(_Snapshot.encode(()))
+        self._overlay: Dict[str, List[SymbolEntry]] = {}
+        self._hidden: Set[int] = set()  # snapshot uri indices shadowed by the overlay
+        self._versions: Dict[str, int] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        # Recent search() results; cleared whenever the index changes.
+        self._memo: Dict[Tuple[str, int, Optional[FrozenSet[int]]], List[SymbolEntry]] = {}
+
+    @classmethod
+    def load(cls, path: str, client: Any = None, **kwargs: Any) -> "SymbolIndex":
+        """Memory-map an index written by `save()`."""
+        index = cls(client, **kwargs)
+        index._snapshot = _Snapshot.open(path)
+        index.path = path
+        return index
+
+    def save(self, path: Optional[str] = None) -> str:
+        """Write the index (snapshot + overlay) atomically; returns the path."""
+        path = path or self.path
+        if not path:
+            raise ValueError("No path to save the symbol index to")
+        self.compact()
+        data = self._snapshot.data()
+        # Compacted into memory first: a mapped file can't be replaced on Windows.
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        self._replace(_Snapshot.open(path))
+        self.path = path
+        return path
+
+    def close(self) -> None:
+        """Cancel pending refreshes and unmap the snapshot file."""
+        for handle in self._timers.values():
+            handle.cancel()
+        self._timers.clear()
+        for task in self._tasks:
+            task.cancel()
+        self._replace(_Snapshot(_Snapshot.encode(())))
+        self._overlay.clear()
+        self._hidden.clear()
+
+    def __len__(self) -> int:
+        snap = self._snapshot
+        shadowed = sum(snap.uri_counts[u] for u in self._hidden)
+        return snap.count - shadowed + sum(len(v) for v in self._overlay.values())
+
+    def stats(self) -> Dict[str, Any]:
+        snap = self._snapshot
+        return {
+            "symbols": len(self),
+            "files": len(snap.uris) - len(self._hidden) + sum(1 for v in self._overlay.values() if v),
+            "overlayFiles": len(self._overlay),
+            "pending": len(self._timers) + len(self._tasks),
+            "fetched": self.fetched,
+            "failures": self.failures,
+            "createdAt": snap.created_at,
+            "mapped": snap._mapped is not None,
+        }
+
+    # ── queries ───────────────────────────────────────────────────────
+
+    def prefix(
+        self,
+        text: str,
+        *,
+        limit: int = 50,
+        kinds: Optional[Collection[int]] = None,
+    ) -> List[SymbolEntry]:
+        """Symbols whose name starts with `text` (ASCII case-insensitive), by name."""
+        snap, hidden = self._snapshot, self._hidden
+        needle = text.encode("utf-8").lower()
+        out: List[SymbolEntry] = []
+        for i in snap.prefix(needle):
+            if len(out) >= limit:
+                break
+            if snap.field(i, 3) in hidden or (kinds is not None and snap.field(i, 2) not in kinds):
+                continue
+            out.append(snap.entry(i))
+        extra = [
+            e
+            for e in self._overlay_entries(kinds)
+            if e.name.encode("utf-8").lower().startswith(needle)
+        ]
+        if extra:
+            out = sorted(out + extra, key=lambda e: (e.name.encode("utf-8").lower(), e.name))
+        return out[:limit]
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 50,
+        kinds: Optional[Collection[int]] = None,
+    ) -> List[SymbolEntry]:
+        """
+        Fuzzy lookup: names containing the characters of `query` in order
+        (ASCII case-insensitive). Exact and prefix matches rank first, then
+        tighter matches and shorter names.
+        """
+        if not query:
+            return []
+        memo_key = (query, limit, None if kinds is None else frozenset(kinds))
+        hit = self._memo.get(memo_key)
+        if hit is not None:
+            return list(hit)
+        snap, hidden = self._snapshot, self._hidden
+        needle = query.encode("utf-8").lower()
+        pattern = _fuzzy_pattern(needle)
+        qlen = len(needle)
+        found: List[Tuple[Tuple[bool, bool, int, int, int], int, SymbolEntry]] = [
+            (_fuzzy_key(m, 0, qlen), n, e)
+            for n, e in enumerate(self._overlay_entries(kinds))
+            if (m := pattern.search(e.name.encode("utf-8").lower())) is not None
+        ]
+        # Rank every snapshot match on offsets alone; only the best are
+        # looked up, widening the window if filters reject some of them.
+        keys = list(snap.fuzzy(pattern, qlen))
+        window = limit
+        while True:
+            picked = []
+            for key in heapq.nsmallest(window, keys):
+                i = snap.at_offset(key[4])
+                if snap.field(i, 3) in hidden or (kinds is not None and snap.field(i, 2) not in kinds):
+                    continue
+                picked.append((key, -1, snap.entry(i)))
+                if len(picked) == limit:
+                    break
+            if len(picked) == limit or window >= len(keys):
+                break
+            window *= 4
+        found += picked
+        result = [e for _, _, e in heapq.nsmallest(limit, found, key=lambda r: r[:2])]
+        if len(self._memo) >= 64:
+            self._memo.pop(next(iter(self._memo)))
+        self._memo[memo_key] = result
+        return list(result)
+
+    def symbols_in(self, uri: str) -> List[SymbolEntry]:
+        """Every indexed symbol of one document, in source order."""
+        if uri in self._overlay:
+            entries = list(self._overlay[uri])
+        else:
+            snap = self._snapshot
+            u = snap.uri_index.get(uri)
+            entries = [] if u is None else [snap.entry(i) for i in snap.by_uri(u)]
+        return sorted(entries, key=lambda e: (e.start_line, e.start_character))
+
+    # ── building and refreshing ───────────────────────────────────────
+
+    async def build(
+        self,
+        uris: Optional[Iterable[str]] = None,
+        *,
+        include: str = DEFAULT_INCLUDE,
+        exclude: Optional[str] = None,
+        max_files: int = 10000,
+    ) -> int:
+        """
+        (Re)index every file from scratch; returns the number of symbols.
+
+        Without `uris`, files come from `workspace.findFiles(include,
+        exclude, max_files)`; the default `include` matches source files
+        only (`DEFAULT_INCLUDE`). Files whose symbols can't be fetched
+        (error, timeout, dropped socket) are skipped and counted in
+        `stats()["failures"]`.
+        """
+        if uris is None:
+            params: Dict[str, Any] = {"include": include, "maxResults": max_files}
+            if exclude is not None:
+                params["exclude"] = exclude
+            uris = (await self._client().call("workspace.findFiles", params))["items"]
+        fetched = await self._fetch_all(list(dict.fromkeys(uris)))
+        entries = [e for found in fetched.values() if found for e in found]
+        self._replace(_Snapshot(_Snapshot.encode(entries)))
+        self._overlay.clear()
+        self._hidden.clear()
+        return len(entries)
+
+    async def refresh(self, uris: Iterable[str]) -> None:
+        """Re-fetch the symbols of `uris` now (e.g. files changed while offline)."""
+        versions = {uri: self._versions.get(uri, 0) for uri in uris}
+        fetched = await self._fetch_all(list(versions))
+        for uri, found in fetched.items():
+            if found is None or self._versions.get(uri, 0) != versions[uri]:
+                # Keep what we have if the fetch failed; if the document
+                # changed again meanwhile, a newer refresh is scheduled.
+                continue
+            self._put(uri, found)
+        if len(self._overlay) >= self.compact_after:
+            self.compact()
+
+    def remove(self, uri: str) -> None:
+        self._put(uri, [])
+
+    def compact(self) -> None:
+        """Merge the overlay into a new in-memory snapshot (`save()` persists it)."""
+        if not self._overlay and self._snapshot._mapped is None:
+            return
+        self._replace(_Snapshot(_Snapshot.encode(self._all_entries())))
+        self._overlay.clear()
+        self._hidden.clear()
+
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """Apply one `events.notification` payload; schedules a debounced refresh."""
+        if event.get("name") not in INVALIDATING_EVENTS:
+            return
+        uri = (event.get("params") or {}).get("uri")
+        if not isinstance(uri, str) or uri.startswith("untitled:"):
+            return
+        self._versions[uri] = self._versions.get(uri, 0) + 1
+        old = self._timers.pop(uri, None)
+        if old is not None:
+            old.cancel()
+        loop = asyncio.get_running_loop()
+        self._timers[uri] = loop.call_later(self.debounce, self._start_refresh, uri)
+
+    async def follow(self, events: AsyncIterable[Dict[str, Any]]) -> None:
+        """Keep the index current from an event source (e.g. a `BridgeEventStream`)."""
+        async for event in events:
+            self.handle_event(event)
+
+    async def flush(self) -> None:
+        """Run debounced refreshes now and wait for all in-flight ones."""
+        for uri in list(self._timers):
+            self._timers.pop(uri).cancel()
+            self._start_refresh(uri)
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    # ── internals ─────────────────────────────────────────────────────
+
+    def _client(self) -> Any:
+        if self.client is None:
+            raise BridgeError("E_FAILED", "SymbolIndex has no client to fetch symbols with")
+        return self.client
+
+    def _start_refresh(self, uri: str) -> None:
+        self._timers.pop(uri, None)
+        task = asyncio.ensure_future(self.refresh([uri]))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch_all(self, uris: List[str]) -> Dict[str, Optional[List[SymbolEntry]]]:
+        client = self._client()
+        gate = asyncio.Semaphore(self.concurrency)
+        out: Dict[str, Optional[List[SymbolEntry]]] = {}
+
+        async def one(uri: str) -> None:
+            async with gate:
+                try:
+                    res = await client.call("code.symbols.document", {"uri": uri, "flatten": True})
+                except (BridgeError, OSError, asyncio.TimeoutError):
+                    self.failures += 1
+                    out[uri] = None
+                    return
+            self.fetched += 1
+            out[uri] = _entries(uri, res.get("items"))
+
+        await asyncio.gather(*(one(u) for u in uris))
+        return out
+
+    def _put(self, uri: str, entries: List[SymbolEntry]) -> None:
+        self._memo.clear()
+        self._overlay[uri] = entries
+        u = self._snapshot.uri_index.get(uri)
+        if u is not None:
+            self._hidden.add(u)
+
+    def _overlay_entries(self, kinds: Optional[Collection[int]]) -> Iterator[SymbolEntry]:
+        for entries in self._overlay.values():
+            for e in entries:
+                if kinds is None or e.kind in kinds:
+                    yield e
+
+    def _all_entries(self) -> Iterator[SymbolEntry]:
+        snap, hidden = self._snapshot, self._hidden
+        for i in range(snap.count):
+            if snap.field(i, 3) not in hidden:
+                yield snap.entry(i)
+        yield from self._overlay_entries(None)
+
+    def _replace(self, snapshot: _Snapshot) -> None:
+        self._memo.clear()
+        old, self._snapshot = self._snapshot, snapshot
+        old.close()
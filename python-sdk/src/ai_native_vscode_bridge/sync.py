@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextlib
+import threading
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Sequence, Tuple
+
+from .cache import BridgeResultCache
+from .client import BridgeError, BridgeMethodsMixin, BridgeTimeoutError, _resolve_token
+from .codec import BridgeCodec
+from .deadlines import deadline
+from .pool import BridgeConnectionPool
+from .tracing import BridgeTracer
+from .transport import BridgeTransport
+
+
+class SyncBridgeClient(BridgeMethodsMixin):
+    """
+    Blocking client for synchronous code.
+
+    One daemon thread runs a private event loop holding a
+    `BridgeConnectionPool` (by default a single persistent socket), so calls
+    never pay for a new loop or connection. `call()` and every generated
+    method (`client.code_hover({...})`) can be used from any number of
+    threads at once: requests are handed to the loop thread-safely and
+    pipelined over the shared socket, and the pool reconnects after an
+    extension restart.
+
+        with SyncBridgeClient.from_workspace() as client:
+            caps = client.bridge_capabilities()
+            refs = client.code_references({"uri": uri, "position": pos})
+
+    The loop starts on `connect()`, `with`, or the first call. A call that
+    takes longer than `timeout` seconds is cancelled, on the server too, and
+    raises `BridgeTimeoutError`. Calling it from code running on the client's
+    own loop (e.g. a tracer exporter) raises `RuntimeError` instead of
+    deadlocking.
+    """
+
+    def __init__(
+        self,
+        *,
+        port: int = 57110,
+        host: str = "127.0.0.1",
+        token: str,
+        max_connections: int = 1,
+        timeout: Optional[float] = None,
+        cache: Optional[BridgeResultCache] = None,
+        codec: Optional[BridgeCodec] = None,
+        tracer: Optional[BridgeTracer] = None,
+        transport: Optional[BridgeTransport] = None,
+        **pool_kwargs: Any,
+    ):
+        self.port = port
+        self.host = host
+        self.timeout = timeout
+        self._pool_kwargs: Dict[str, Any] = dict(
+            port=port,
+            host=host,
+            token=token,
+            max_size=max_connections,
+            cache=cache,
+            codec=codec,
+            tracer=tracer,
+            transport=transport,
+            **pool_kwargs,
+        )
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pool: Optional[BridgeConnectionPool] = None
+
+    @classmethod
+    def from_workspace(
+        cls,
+        *,
+        port: int = 57110,
+        token: Optional[str] = None,
+        token_file: Optional[str] = None,
+        workspace_dir: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "SyncBridgeClient":
+        tok = _resolve_token(token, token_file, workspace_dir)
+        if not tok:
+            raise BridgeError(
+                "E_AUTH",
+                "Missing token. Provide token, set $BRIDGE_TOKEN, or create .vscode/bridge.token.",
+            )
+        return cls(port=port, token=tok, **kwargs)
+
+    @property
+    def connected(self) -> bool:
+        return self._pool is not None
+
+    def stats(self) -> Dict[str, Any]:
+        pool = self._pool
+        return pool.stats() if pool is not None else {"size": 0, "connected": 0}
+
+    def connect(self) -> "SyncBridgeClient":
+        """Start the loop thread and open the pool (no-op if already running)."""
+        with self._lock:
+            if self._loop is not None:
+                return self
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="bridge-sync-loop", daemon=True
+            )
+            thread.start()
+            try:
+                # Built on the loop thread so the pool's locks bind to that loop.
+                self._pool = asyncio.run_coroutine_threadsafe(self._open(), loop).result()
+            except BaseException:
+                _stop(loop, thread)
+                raise
+            self._loop, self._thread = loop, thread
+        return self
+
+    async def _open(self) -> BridgeConnectionPool:
+        return await BridgeConnectionPool(**self._pool_kwargs).open()
+
+    def close(self) -> None:
+        """Close the pool and stop the loop thread. Safe to call twice."""
+        with self._lock:
+            loop, thread, pool = self._loop, self._thread, self._pool
+            self._loop = self._thread = self._pool = None
+        if loop is None or thread is None:
+            return
+        try:
+            if pool is not None:
+                asyncio.run_coroutine_threadsafe(pool.close(), loop).result()
+        finally:
+            _stop(loop, thread)
+
+    def __enter__(self) -> "SyncBridgeClient":
+        return self.connect()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _run(
+        self,
+        fn: Callable[[BridgeConnectionPool], Coroutine[Any, Any, Any]],
+        what: str,
+        timeout: Optional[float],
+    ) -> Any:
+        if self._loop is None:
+            self.connect()
+        loop, pool = self._loop, self._pool
+        if loop is None or pool is None:
+            raise BridgeError("E_FAILED", "Client is closed")
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("SyncBridgeClient cannot be called from its own event loop")
+        fut = asyncio.run_coroutine_threadsafe(fn(pool), loop)
+        limit = self.timeout if timeout is None else timeout
+        try:
+            return fut.result(limit)
+        except concurrent.futures.TimeoutError:
+            fut.cancel()
+            raise BridgeTimeoutError(f"{what} timed out after {limit:.3g}s", limit) from None
+
+    def call(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Send one request and block until its result (or `BridgeError`)."""
+        limit = self.timeout if timeout is None else timeout
+        # The loop side enforces it too, so the server hears `meta.timeoutMs`.
+        return self._run(lambda pool: pool.call(method, params, timeout=limit), method, limit)
+
+    def call_many(
+        self,
+        calls: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        *,
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """
+        Send `(method, params)` pairs as one JSON-RPC batch. Returns results
+        in order; a failed item is returned as its `BridgeError`, not raised.
+        """
+        limit = self.timeout if timeout is None else timeout
+        return self._run(lambda pool: _call_many(pool, list(calls), limit), "batch", limit)
+
+
+async def _call_many(
+    pool: BridgeConnectionPool,
+    calls: List[Tuple[str, Optional[Dict[str, Any]]]],
+    limit: Optional[float],
+) -> List[Any]:
+    # Bound the batch on the loop side too, so the server hears `meta.timeoutMs`.
+    with deadline(limit) if limit is not None else contextlib.nullcontext():
+        async with pool.batch() as batch:
+            futures = [batch.call(method, params) for method, params in calls]
+    return list(await asyncio.gather(*futures, return_exceptions=True))
+
+
+def _stop(loop: asyncio.AbstractEventLoop, thread: threading.Thread) -> None:
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
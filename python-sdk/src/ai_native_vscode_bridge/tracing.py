@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterable, List, Optional, Protocol, Sequence
+
+# Upper bounds in milliseconds; the last bucket is open-ended.
+DEFAULT_BUCKETS_MS: Sequence[float] = (
+    0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000,
+)
+
+
+def frame_size(frame: Any) -> int:
+    """Size of a frame in bytes as sent on the wire (text frames are UTF-8)."""
+    if isinstance(frame, str):
+        return len(frame) if frame.isascii() else len(frame.encode("utf-8"))
+    return len(frame) if frame is not None else 0
+
+
+@dataclass
+class CallRecord:
+    """
+    One traced RPC, handed to exporters when it finishes.
+
+    `bytes_sent` / `bytes_received` are summed over every attempt of a
+    retried call.
+    """
+
+    method: str
+    start_ns: int
+    duration_ms: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    error_code: Optional[str] = None
+    error_message: Optional[str] = None
+    cached: bool = False
+    batch_size: int = 0
+    _t0: float = field(default=0.0, repr=False, compare=False)
+
+
+class Exporter(Protocol):
+    def export(self, record: CallRecord) -> None: ...
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram; quantiles are bucket upper bounds."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms: float) -> None:
+        self.counts[bisect_left(self.buckets, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return self.buckets[i] if i < len(self.buckets) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "meanMs": self.total_ms / self.count if self.count else 0.0,
+            "p50Ms": self.quantile(0.5),
+            "p90Ms": self.quantile(0.9),
+            "p99Ms": self.quantile(0.99),
+            "maxMs": self.max_ms,
+            "buckets": {
+                **{f"le{b:g}": n for b, n in zip(self.buckets, self.counts)},
+                "inf": self.counts[-1],
+            },
+        }
+
+
+class _MethodStats:
+    __slots__ = ("latency", "errors", "bytes_sent", "bytes_received", "in_flight", "cache_hits")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.latency = LatencyHistogram(buckets)
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.in_flight = 0
+        self.cache_hits = 0
+
+
+class BridgeTracer:
+    """
+    Opt-in client-side instrumentation for every RPC.
+
+    Pass `tracer=BridgeTracer()` to a client or pool. Per method it keeps a
+    latency histogram, bytes sent/received, error and cache-hit counts and
+    an in-flight gauge; errors are also counted by `BridgeError.code`.
+    Finished calls go to each exporter (`InMemoryExporter`,
+    `OpenTelemetryExporter`, or anything with `export(record)`).
+
+    Without a tracer the client skips all of this. Bytes are counted for
+    single calls; batched calls are recorded with their batch's latency and
+    `batch_size` but no byte counts.
+    """
+
+    def __init__(
+        self,
+        *,
+        exporters: Iterable[Exporter] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS_MS,
+    ):
+        self.exporters: List[Exporter] = list(exporters)
+        self.buckets = tuple(buckets)
+        self.errors_by_code: Dict[str, int] = {}
+        self.in_flight = 0
+        self._methods: Dict[str, _MethodStats] = {}
+
+    def _stats_for(self, method: str) -> _MethodStats:
+        stats = self._methods.get(method)
+        if stats is None:
+            stats = self._methods[method] = _MethodStats(self.buckets)
+        return stats
+
+    def start(self, method: str) -> CallRecord:
+        self._stats_for(method).in_flight += 1
+        self.in_flight += 1
+        return CallRecord(method, time.time_ns(), _t0=time.perf_counter())
+
+    def finish(self, record: CallRecord, error: Optional[BaseException] = None) -> None:
+        record.duration_ms = (time.perf_counter() - record._t0) * 1000
+        stats = self._stats_for(record.method)
+        stats.in_flight -= 1
+        self.in_flight -= 1
+        stats.latency.record(record.duration_ms)
+        stats.bytes_sent += record.bytes_sent
+        stats.bytes_received += record.bytes_received
+        if record.cached:
+            stats.cache_hits += 1
+        if error is not None:
+            code = getattr(error, "code", None) or type(error).__name__
+            record.error_code = str(code)
+            record.error_message = str(getattr(error, "message", error))
+            stats.errors += 1
+            self.errors_by_code[record.error_code] = self.errors_by_code.get(record.error_code, 0) + 1
+        for exporter in self.exporters:
+            exporter.export(record)
+
+    def reset(self) -> None:
+        """Zero all counters; gauges keep counting calls that are still in flight."""
+        self.errors_by_code.clear()
+        fresh: Dict[str, _MethodStats] = {}
+        for method, old in self._methods.items():
+            if old.in_flight:
+                fresh[method] = _MethodStats(self.buckets)
+                fresh[method].in_flight = old.in_flight
+        self._methods = fresh
+
+    def stats(self) -> Dict[str, Any]:
+        methods = {
+            method: {
+                **s.latency.to_dict(),
+                "errors": s.errors,
+                "cacheHits": s.cache_hits,
+                "bytesSent": s.bytes_sent,
+                "bytesReceived": s.bytes_received,
+                "inFlight": s.in_flight,
+            }
+            for method, s in sorted(self._methods.items())
+        }
+        return {
+            "calls": sum(s.latency.count for s in self._methods.values()),
+            "inFlight": self.in_flight,
+            "bytesSent": sum(s.bytes_sent for s in self._methods.values()),
+            "bytesReceived": sum(s.bytes_received for s in self._methods.values()),
+            "errorsByCode": dict(self.errors_by_code),
+            "methods": methods,
+        }
+
+
+class InMemoryExporter:
+    """Keeps the last `maxlen` finished calls, e.g. for tests or a debug endpoint."""
+
+    def __init__(self, maxlen: Optional[int] = 1000):
+        self.records: Deque[CallRecord] = deque(maxlen=maxlen)
+
+    def export(self, record: CallRecord) -> None:
+        self.records.append(record)
+
+    def clear(self) -> None:
+        self.records.clear()
+
+
+class OpenTelemetryExporter:
+    """
+    Emits one CLIENT span per call via the OpenTelemetry API.
+
+    Spans are created when the call finishes, with its real start and end
+    time, under whatever span is current in the calling task. Requires
+    `opentelemetry-api` (`pip install ai-native-bridge[otel]`).
+    """
+
+    def __init__(self, tracer: Any = None):
+        from opentelemetry import trace
+
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("ai_native_vscode_bridge")
+
+    def export(self, record: CallRecord) -> None:
+        trace = self._trace
+        attributes: Dict[str, Any] = {
+            "rpc.system": "jsonrpc",
+            "rpc.method": record.method,
+            "rpc.jsonrpc.version": "2.0",
+            "bridge.bytes_sent": record.bytes_sent,
+            "bridge.bytes_received": record.bytes_received,
+            "bridge.cached": record.cached,
+        }
+        if record.batch_size:
+            attributes["bridge.batch_size"] = record.batch_size
+        if record.error_code is not None:
+            # The bridge's codes are strings (`E_NOT_FOUND`); the semconv
+            # attribute is an int, so it only carries numeric JSON-RPC codes.
+            attributes["bridge.error_code"] = record.error_code
+            try:
+                attributes["rpc.jsonrpc.error_code"] = int(record.error_code)
+            except ValueError:
+                pass
+        span = self._tracer.start_span(
+            record.method,
+            kind=trace.SpanKind.CLIENT,
+            start_time=record.start_ns,
+            attributes=attributes,
+        )
+        if record.error_code is not None:
+            span.set_status(
+                trace.Status(trace.StatusCode.ERROR, f"{record.error_code}: {record.error_message}")
+            )
+        span.end(end_time=record.start_ns + int(record.duration_ms * 1_000_000))
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import ipaddress
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+from urllib.parse import urlsplit
+
+# Same as the extension's `bridge.maxMessageBytes` default (ws maxPayload).
+DEFAULT_MAX_MESSAGE_SIZE = 100 * 2**20
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+
+
+@dataclass
+class TransferStats:
+    """
+    Byte counters for every socket opened through one `BridgeTransport`.
+
+    `payload_*` is the size of the JSON frames before compression, `wire_*`
+    the size of the same frames as sent (after permessage-deflate, or equal
+    to the payload when compression was not negotiated or a message was
+    below the threshold). WebSocket framing is not counted.
+    """
+
+    messages_sent: int = 0
+    messages_received: int = 0
+    payload_bytes_sent: int = 0
+    payload_bytes_received: int = 0
+    wire_bytes_sent: int = 0
+    wire_bytes_received: int = 0
+    compressed_sent: int = 0
+    compressed_received: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        def ratio(wire: int, payload: int) -> Optional[float]:
+            return round(wire / payload, 4) if payload else None
+
+        return {
+            "messagesSent": self.messages_sent,
+            "messagesReceived": self.messages_received,
+            "payloadBytesSent": self.payload_bytes_sent,
+            "payloadBytesReceived": self.payload_bytes_received,
+            "wireBytesSent": self.wire_bytes_sent,
+            "wireBytesReceived": self.wire_bytes_received,
+            "compressedSent": self.compressed_sent,
+            "compressedReceived": self.compressed_received,
+            "ratioSent": ratio(self.wire_bytes_sent, self.payload_bytes_sent),
+            "ratioReceived": ratio(self.wire_bytes_received, self.payload_bytes_received),
+        }
+
+    def reset(self) -> None:
+        for name in self.__dataclass_fields__:
+            setattr(self, name, 0)
+
+
+class BridgeTransport:
+    """
+    How sockets to the bridge are opened: compression and frame size limits.
+
+    With compression on, the client offers permessage-deflate; if the server
+    accepts (the extension does unless `bridge.compression.enabled` is off),
+    messages of at least `threshold` bytes are deflated at zlib `level` and
+    smaller ones (pings, short results) are sent as is, since compressing
+    them costs CPU and saves nothing. Level 1 keeps most of the size
+    reduction of higher levels for JSON and source text at a fraction of
+    their CPU time.
+
+    `compression="auto"` (default) turns it on only for non-loopback hosts:
+    over a network a large `doc.read` or `diagnostics.list` crosses in a
+    fraction of the time, while on localhost deflating costs more than it
+    saves. Use `True` for a tunnel (ssh -L, a container port) that ends on
+    localhost but crosses a slow link, `False` to never offer it.
+
+    Incoming messages larger than `max_message_size` bytes (decompressed;
+    `None` = unlimited) close the socket, as on the server.
+
+    Every socket opened through one transport adds to the same `stats`, so
+    share one instance between clients to get totals:
+
+        transport = BridgeTransport(compression=True, threshold=4096)
+        async with BridgeClient.from_workspace(transport=transport) as client:
+            await client.call("doc.read", {"uri": uri})
+        print(transport.stats.to_dict())  # payload vs wire bytes
+    """
+
+    def __init__(
+        self,
+        *,
+        compression: Union[bool, str] = "auto",
+        threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        level: int = 1,
+        max_message_size: Optional[int] = DEFAULT_MAX_MESSAGE_SIZE,
+    ):
+        if compression not in (True, False, "auto"):
+            raise ValueError('compression must be True, False or "auto"')
+        if threshold < 0:
+            raise ValueError("threshold must be >= 0")
+        if not 1 <= level <= 9:
+            raise ValueError("level must be between 1 and 9")
+        self.compression = compression
+        self.threshold = threshold
+        self.level = level
+        self.max_message_size = max_message_size
+        self.stats = TransferStats()
+
+    def compresses(self, url: str) -> bool:
+        """Whether a socket to `url` offers permessage-deflate."""
+        if self.compression != "auto":
+            return bool(self.compression)
+        host = urlsplit(url).hostname or ""
+        if host == "localhost":
+            return False
+        try:
+            return not ipaddress.ip_address(host).is_loopback
+        except ValueError:  # a host name
+            return True
+
+    def __repr__(self) -> str:
+        return (
+            f"BridgeTransport(compression={self.compression}, threshold={self.threshold}, "
+            f"level={self.level}, max_message_size={self.max_message_size})"
+        )
+
+    def connect(self, url: str) -> Any:
+        """`websockets.connect(url, ...)` with this transport's settings (await or `async with`)."""
+        # Deferred so `import ai_native_vscode_bridge` does not load websockets.
+        from ._wire import connect
+
+        return connect(url, self)
+
+    def server_options(self) -> Dict[str, Any]:
+        """Keyword arguments for `websockets.serve` (used by `MockBridgeServer`)."""
+        from ._wire import server_options
+
+        return server_options(self)
+
+    def _compress_settings(self) -> Dict[str, Any]:
+        # memLevel 5 is websockets' default: 16 KiB of zlib state per socket vs 128 KiB at 8.
+        return {"level": self.level, "memLevel": 5}
+
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from .client import BridgeClient
+from .generated_models import TypedBridgeMethodsMixin
+
+
+class TypedBridgeClient(TypedBridgeMethodsMixin, BridgeClient):
+    """
+    Like `GeneratedBridgeClient`, but each method returns the slotted result
+    dataclass from `generated_models` (e.g. `code_references()` returns a
+    `CodeReferencesResult` of `Location`s) instead of nested dicts.
+
+    Lives in its own module so the ~100 model classes are only built when
+    typed results are actually used.
+    """
+
+    pass
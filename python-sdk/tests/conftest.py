@@ -0,0 +1,35 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from ai_native_vscode_bridge import BridgeClient
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+TOKEN = "test-token"
+
+
+@pytest.fixture
+async def server():
+    async with MockBridgeServer(token=TOKEN) as srv:
+        yield srv
+
+
+@pytest.fixture
+async def client(server):
+    async with BridgeClient(port=server.port, token=TOKEN) as c:
+        yield c
+
+
+async def take(stream: Any, n: int, timeout: float = 2.0) -> List[Dict[str, Any]]:
+    """The next `n` events of `stream`; fails the test after `timeout` seconds."""
+    events: List[Dict[str, Any]] = []
+
+    async def read() -> None:
+        async for event in stream:
+            events.append(event)
+            if len(events) == n:
+                return
+
+    await asyncio.wait_for(read(), timeout)
+    return events
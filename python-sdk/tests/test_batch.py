@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from ai_native_vscode_bridge import BridgeClient, BridgeError
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+from conftest import TOKEN
+
+
+async def test_items_resolve_independently(client):
+    async with client.batch() as batch:
+        ping = batch.call("bridge.ping")
+        missing = batch.call("no.such.method")
+        doc = batch.call("doc.read", {"uri": "file:///a.py"})
+    assert ping.result()["ok"] is True
+    assert doc.result()["uri"] == "file:///a.py"
+    with pytest.raises(BridgeError) as e:
+        missing.result()
+    assert e.value.code == "E_NOT_FOUND"
+
+
+async def test_sent_as_one_message(client):
+    await client.supports_batch()
+    sent = client.stats()["transfer"]["messagesSent"]
+    async with client.batch() as batch:
+        futs = [batch.call("code.hover", {"uri": f"file:///{i}.py"}) for i in range(10)]
+    assert client.stats()["transfer"]["messagesSent"] == sent + 1
+    assert all(f.done() for f in futs)
+
+
+async def test_pipelined_when_the_server_has_no_batch_support():
+    caps = {"bridge.capabilities": lambda p: {"features": []}}
+    async with MockBridgeServer(token=TOKEN, handlers=caps) as server:
+        async with BridgeClient(port=server.port, token=TOKEN) as client:
+            async with client.batch() as batch:
+                futs = [batch.call("bridge.ping") for _ in range(3)]
+            assert not await client.supports_batch()
+            assert [f.result()["ok"] for f in futs] == [True] * 3
+            # capabilities + one message per item
+            assert client.stats()["transfer"]["messagesSent"] == 4
+
+
+async def test_one_shot_client_batches_over_a_temporary_socket(server):
+    client = BridgeClient(port=server.port, token=TOKEN)
+    async with client.batch() as batch:
+        fut = batch.call("bridge.ping")
+    assert fut.result()["ok"] is True
+    assert not client.connected
+
+
+async def test_an_exception_in_the_block_cancels_the_batch(client):
+    with pytest.raises(RuntimeError):
+        async with client.batch() as batch:
+            fut = batch.call("bridge.ping")
+            raise RuntimeError("abandon")
+    assert fut.cancelled()
+    await asyncio.sleep(0)
+    assert client.in_flight == 0
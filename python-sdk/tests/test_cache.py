@@ -0,0 +1,68 @@
+import asyncio
+
+from ai_native_vscode_bridge import BridgeClient, BridgeEventStream, BridgeResultCache
+
+from conftest import TOKEN
+
+A = "file:///a.py"
+B = "file:///b.py"
+
+
+async def test_repeated_reads_are_served_locally(server):
+    cache = BridgeResultCache()
+    async with BridgeClient(port=server.port, token=TOKEN, cache=cache) as client:
+        first = await client.call("doc.read", {"uri": A})
+        assert await client.call("doc.read", {"uri": A, "meta": {"traceId": "t"}}) == first
+        await client.call("bridge.ping")
+    assert server.requests == 2
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+async def test_document_events_invalidate_by_uri(server):
+    cache = BridgeResultCache()
+    async with BridgeClient(port=server.port, token=TOKEN, cache=cache) as client:
+        stream = BridgeEventStream(port=server.port, token=TOKEN, events=["doc.changed"])
+        async with stream:
+            follower = asyncio.ensure_future(cache.follow(stream))
+            await client.call("code.references", {"uri": A})
+            await client.call("code.hover", {"uri": B})
+            await server.emit("doc.changed", {"uri": A})
+            for _ in range(100):
+                if cache.invalidations:
+                    break
+                await asyncio.sleep(0.01)
+            follower.cancel()
+        assert cache.invalidations == 1
+        before = server.requests
+        await client.call("code.references", {"uri": A})
+        assert server.requests == before + 1
+        await client.call("code.hover", {"uri": B})
+        assert server.requests == before + 1
+
+
+async def test_gap_clears_everything():
+    cache = BridgeResultCache()
+    cache.put("doc.read", {"uri": A}, {"text": "a"})
+    cache.put("doc.read", {"uri": B}, {"text": "b"})
+    cache.handle_event({"name": "doc.opened", "params": {"uri": A}})
+    assert len(cache) == 2
+    cache.handle_event({"seq": 9, "name": "events.gap", "params": {}})
+    assert len(cache) == 0
+    assert cache.stats()["invalidations"] == 2
+
+
+async def test_stale_generation_is_not_stored():
+    cache = BridgeResultCache()
+    generation = cache.generation
+    cache.invalidate(A)
+    cache.put("doc.read", {"uri": A}, {"text": "old"}, generation=generation)
+    assert cache.get("doc.read", {"uri": A}) == (False, None)
+
+
+async def test_ttl_and_lru_bounds():
+    cache = BridgeResultCache(ttl=0.01, max_entries=2)
+    for uri in ("file:///1", "file:///2", "file:///3"):
+        cache.put("doc.read", {"uri": uri}, {})
+    assert len(cache) == 2 and cache.evictions == 1
+    await asyncio.sleep(0.02)
+    assert cache.get("doc.read", {"uri": "file:///3"}) == (False, None)
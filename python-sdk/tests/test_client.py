@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from ai_native_vscode_bridge import BridgeClient, BridgeError
+from ai_native_vscode_bridge.codec import BridgeCodec
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+from conftest import TOKEN
+
+
+async def test_one_shot_calls_need_no_connect(server):
+    client = BridgeClient(port=server.port, token=TOKEN)
+    assert (await client.call("bridge.ping"))["ok"] is True
+    assert not client.connected
+
+
+def test_clients_are_hashable_by_identity():
+    a, b = BridgeClient(token=TOKEN), BridgeClient(token=TOKEN)
+    assert len({a, b, a}) == 2 and a != b and a == a
+
+
+async def test_concurrent_calls_are_pipelined_over_one_socket():
+    async with MockBridgeServer(token=TOKEN, latency=0.05) as server:
+        async with BridgeClient(port=server.port, token=TOKEN) as client:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            results = await asyncio.gather(
+                *(client.call("doc.read", {"uri": f"file:///{i}.py"}) for i in range(20))
+            )
+            # 20 calls of 50 ms each, answered in parallel on one socket.
+            assert loop.time() - started < 0.5
+            assert [r["uri"] for r in results] == [f"file:///{i}.py" for i in range(20)]
+            assert client.stats()["transfer"]["messagesSent"] == 20
+            assert client.in_flight == 0
+
+
+async def test_errors_reach_only_their_call(client):
+    ok, failed = await asyncio.gather(
+        client.call("bridge.ping"), client.call("no.such.method"), return_exceptions=True
+    )
+    assert ok["ok"] is True
+    assert isinstance(failed, BridgeError) and failed.code == "E_NOT_FOUND"
+
+
+async def test_reopens_a_dropped_socket_instead_of_going_one_shot():
+    server = await MockBridgeServer(token=TOKEN).start()
+    port = server.port
+    async with BridgeClient(port=port, token=TOKEN) as client:
+        await client.call("bridge.ping")
+        await server.stop()
+        await asyncio.sleep(0.05)
+        assert not client.connected
+
+        with pytest.raises(BridgeError) as e:
+            await client.call("bridge.ping")  # nothing to reopen to
+        assert e.value.code == "E_FAILED"
+
+        restarted = await MockBridgeServer(token=TOKEN, port=port).start()
+        try:
+            await asyncio.gather(*(client.call("bridge.ping") for _ in range(5)))
+            assert client.connected
+            assert client.stats()["reconnects"] == 1  # shared by the concurrent calls
+        finally:
+            await restarted.stop()
+
+
+async def test_calls_in_flight_fail_when_the_socket_closes():
+    async def hang(params):
+        await asyncio.sleep(10)
+
+    async with MockBridgeServer(token=TOKEN, handlers={"code.hover": hang}) as server:
+        client = BridgeClient(port=server.port, token=TOKEN)
+        await client.connect()
+        call = asyncio.ensure_future(client.call("code.hover", {"uri": "u"}))
+        await asyncio.sleep(0.05)
+        await client.close()
+        with pytest.raises(BridgeError) as e:
+            await call
+        assert e.value.code == "E_FAILED"
+
+
+class Garbled(BridgeCodec):
+    """Fails to route any frame that mentions "garbled"."""
+
+    def peek(self, data):
+        if "garbled" in (data if isinstance(data, str) else data.decode()):
+            raise ValueError("undecodable frame")
+        return super().peek(data)
+
+
+async def test_an_undecodable_frame_fails_calls_and_closes_the_socket():
+    async def garbled(params):
+        return {"garbled": True}
+
+    async with MockBridgeServer(token=TOKEN, handlers={"code.hover": garbled}) as server:
+        async with BridgeClient(port=server.port, token=TOKEN, codec=Garbled()) as client:
+            ws = client._ws
+            with pytest.raises(BridgeError) as e:
+                await client.call("code.hover", {"uri": "u"})
+            assert e.value.code == "E_FAILED"
+            await asyncio.wait_for(ws.wait_closed(), 1.0)
+            assert (await client.call("bridge.ping"))["ok"] is True  # on a fresh socket
+            assert client.stats()["reconnects"] == 1
+
+
+async def test_a_failed_connect_leaves_a_one_shot_client():
+    server = await MockBridgeServer(token=TOKEN).start()
+    await server.stop()
+    client = BridgeClient(port=server.port, token=TOKEN)
+    with pytest.raises(OSError):
+        await client.connect()
+    await server.start()
+    try:
+        assert (await client.call("bridge.ping"))["ok"] is True
+        assert not client.connected
+    finally:
+        await server.stop()
@@ -0,0 +1,63 @@
+import dataclasses
+
+import pytest
+
+from ai_native_vscode_bridge import BridgeClient, BridgeError
+from ai_native_vscode_bridge.codec import get_codec
+from ai_native_vscode_bridge.generated_models import (
+    CodeReferencesParams,
+    CodeReferencesResult,
+    DocReadResult,
+    Location,
+    Position,
+)
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+from conftest import TOKEN
+
+CODECS = ["msgspec", "orjson", "json"]
+
+
+@pytest.fixture(params=CODECS)
+async def codec_client(request):
+    codec = get_codec(request.param)
+    async with MockBridgeServer(token=TOKEN, codec=codec) as server:
+        async with BridgeClient(port=server.port, token=TOKEN, codec=get_codec(request.param)) as c:
+            yield c
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_round_trip_and_peek(name):
+    codec = get_codec(name)
+    assert codec.name == name
+    frame = codec.dumps({"jsonrpc": "2.0", "id": 7, "result": {"text": "é"}})
+    req_id, msg = codec.peek(frame.encode())
+    assert req_id == 7
+    if msg is None:  # decoding was deferred
+        msg = codec.loads(frame)
+    assert msg["result"] == {"text": "é"}
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        get_codec("pickle")
+
+
+async def test_call_as_decodes_typed_results(codec_client):
+    doc = await codec_client.call_as("doc.read", {"uri": "file:///a.py"}, DocReadResult)
+    assert isinstance(doc, DocReadResult) and doc.uri == "file:///a.py"
+    params = CodeReferencesParams(uri="file:///a.py", position=Position(line=1, character=4))
+    refs = await codec_client.call_as("code.references", params, CodeReferencesResult)
+    assert refs.items and all(isinstance(loc, Location) for loc in refs.items)
+    assert dataclasses.asdict(refs)["items"] == (
+        await codec_client.call("code.references", {"uri": "file:///a.py"})
+    )["items"]
+
+
+async def test_call_as_reports_mismatches_and_errors(codec_client):
+    with pytest.raises(BridgeError) as e:
+        await codec_client.call_as("bridge.ping", None, DocReadResult)
+    assert e.value.code == "E_FAILED" and "DocReadResult" in e.value.message
+    with pytest.raises(BridgeError) as e:
+        await codec_client.call_as("no.such.method", None, DocReadResult)
+    assert e.value.code == "E_NOT_FOUND"
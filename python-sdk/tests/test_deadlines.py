@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from ai_native_vscode_bridge import (
+    BridgeClient,
+    BridgeError,
+    BridgeTimeoutError,
+    RetryPolicy,
+    deadline,
+    time_left,
+)
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+from conftest import TOKEN
+
+
+class Slow:
+    """A handler that takes `delay` seconds and records what it was sent."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.params = []
+
+    async def __call__(self, params):
+        self.params.append(params)
+        await asyncio.sleep(self.delay)
+        return {"items": []}
+
+
+@pytest.fixture
+async def slow():
+    handler = Slow(0.3)
+    async with MockBridgeServer(token=TOKEN, handlers={"code.hover": handler}) as server:
+        handler.server = server
+        yield handler
+
+
+async def until_cancelled(server, n=1):
+    for _ in range(100):
+        if server.cancelled >= n:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"server cancelled {server.cancelled} of {n} calls")
+
+
+def test_nested_deadlines_only_shorten():
+    assert time_left() is None
+    with deadline(10):
+        assert 9 < time_left() <= 10
+        with deadline(60):
+            assert time_left() <= 10
+        with deadline(1):
+            assert time_left() <= 1
+        assert time_left() > 9
+    assert time_left() is None
+
+
+async def test_timeout_cancels_on_the_server_and_keeps_the_socket(slow):
+    async with BridgeClient(port=slow.server.port, token=TOKEN) as client:
+        with pytest.raises(BridgeTimeoutError) as e:
+            await client.call("code.hover", {"uri": "a"}, timeout=0.05)
+        assert e.value.code == "E_FAILED" and e.value.timeout == pytest.approx(0.05, abs=0.01)
+        await until_cancelled(slow.server)
+        assert (await client.call("bridge.ping"))["ok"] is True
+
+
+async def test_deadline_covers_tasks_and_is_sent_as_timeout_ms(slow):
+    async with BridgeClient(port=slow.server.port, token=TOKEN) as client:
+        with deadline(0.1):
+            results = await asyncio.gather(
+                *(client.call("code.hover", {"uri": str(i)}) for i in range(3)),
+                return_exceptions=True,
+            )
+        assert all(isinstance(r, BridgeTimeoutError) for r in results)
+        await until_cancelled(slow.server, 3)
+    budgets = [p["meta"]["timeoutMs"] for p in slow.params]
+    assert len(budgets) == 3 and all(0 < ms <= 100 for ms in budgets)
+
+
+async def test_server_enforces_meta_timeout_ms_on_its_own(slow):
+    # No client-side deadline: only the extension's copy of the budget applies.
+    async with BridgeClient(port=slow.server.port, token=TOKEN) as client:
+        with pytest.raises(BridgeError) as e:
+            await client.call("code.hover", {"uri": "a", "meta": {"timeoutMs": 20}})
+    assert e.value.data == {"cancelled": True} and slow.server.cancelled == 1
+
+
+async def test_timeouts_are_not_retried_and_expired_deadlines_send_nothing(slow):
+    retry = RetryPolicy(backoff_initial=0.001)
+    async with BridgeClient(port=slow.server.port, token=TOKEN, retry=retry) as client:
+        with pytest.raises(BridgeTimeoutError):
+            await client.call("code.hover", {"uri": "a"}, timeout=0.02)
+        with deadline(0):
+            with pytest.raises(BridgeTimeoutError):
+                await client.call("code.hover", {"uri": "b"})
+    assert len(slow.params) == 1 and retry.stats()["retried"] == 0
+
+
+async def test_batches_are_bounded_by_the_deadline_and_client_timeout(slow):
+    slow.delay = 2.0
+    async with BridgeClient(port=slow.server.port, token=TOKEN, timeout=0.2) as client:
+        started = asyncio.get_running_loop().time()
+        with deadline(0.1):
+            async with client.batch() as batch:
+                futs = [batch.call("code.hover", {"uri": str(i)}) for i in range(2)]
+        assert asyncio.get_running_loop().time() - started < 1.0
+        assert all(isinstance(f.exception(), BridgeTimeoutError) for f in futs)
+        await until_cancelled(slow.server, 2)
+        async with client.batch() as batch:
+            fut = batch.call("code.hover", {"uri": "timeout"})
+        assert isinstance(fut.exception(), BridgeTimeoutError)
+    budgets = [p["meta"]["timeoutMs"] for p in slow.params]
+    assert len(budgets) == 3 and all(0 < ms <= 200 for ms in budgets)
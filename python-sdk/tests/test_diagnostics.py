@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from ai_native_vscode_bridge import BridgeClient, BridgeEventStream, DiagnosticsIndex
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+from conftest import TOKEN
+
+A, B, C = "file:///a.py", "file:///b.py", "file:///c.py"
+
+
+def diag(severity, line=0):
+    rng = {"start": {"line": line, "character": 0}, "end": {"line": line, "character": 1}}
+    return {"range": rng, "message": f"problem {line}", "severity": severity}
+
+
+class Workspace:
+    """A `diagnostics.list` handler over diagnostics the test can edit."""
+
+    def __init__(self):
+        self.files = {A: [diag(0), diag(0, 1), diag(1, 2)], B: [diag(1)], C: [diag(3)]}
+        self.requests = []
+
+    def __call__(self, params):
+        uri = params.get("uri")
+        self.requests.append(uri)
+        if uri == "file:///broken.py":
+            raise RuntimeError("language server crashed")
+        uris = [uri] if uri else list(self.files)
+        return {"items": [{"uri": u, "diagnostics": self.files.get(u, [])} for u in uris]}
+
+
+@pytest.fixture
+async def workspace():
+    ws = Workspace()
+    async with MockBridgeServer(token=TOKEN, handlers={"diagnostics.list": ws}) as server:
+        async with BridgeClient(port=server.port, token=TOKEN) as client:
+            ws.server, ws.client = server, client
+            yield ws
+
+
+async def test_load_counts_without_walking_diagnostics(workspace):
+    index = DiagnosticsIndex(workspace.client)
+    assert await index.load() == 3
+    assert index.count() == 5 and index.count("error") == 2 and index.count(1, A) == 1
+    assert index.counts() == {"error": 2, "warning": 2, "information": 0, "hint": 1}
+    assert index.files_above(0) == [(A, 2)]
+    assert index.files_above(0, "warning") == [(A, 1), (B, 1)]
+    with pytest.raises(ValueError):
+        index.count(7)
+
+
+async def test_events_refetch_only_changed_files(workspace):
+    index = DiagnosticsIndex(workspace.client, debounce=60)
+    await index.load()
+    seen = index.version
+    workspace.files[A] = []
+    workspace.files[B] = [diag(0), diag(0, 5)]
+    for uri in (A, B, C, A):
+        index.handle_event({"name": "diagnostics.changed", "params": {"uri": uri}})
+    await index.flush()
+    assert sorted(workspace.requests[1:]) == [A, B, C]
+    # C came back unchanged, so it is not reported.
+    assert sorted(index.changed_since(seen)) == [A, B]
+    assert index.uris() == [B, C] and index.count("error") == 2
+    assert index.stats()["fetched"] == 4
+
+
+async def test_gap_reloads_everything(workspace):
+    index = DiagnosticsIndex(workspace.client, debounce=60)
+    await index.load()
+    seen = index.version
+    del workspace.files[C]
+    index.handle_event({"name": "diagnostics.changed", "params": {"uri": A}})
+    index.handle_event({"seq": None, "name": "events.gap", "params": {}})
+    await index.flush()
+    assert workspace.requests == [None, None]  # one reload instead of the refresh
+    assert index.changed_since(seen) == [C] and index.stats()["reloads"] == 1
+
+
+async def test_failures_are_counted_and_other_files_still_refresh(workspace):
+    index = DiagnosticsIndex(workspace.client, debounce=60)
+    await index.load()
+    workspace.files[A] = []
+    await index.refresh(["file:///broken.py", A])
+    assert index.stats()["failures"] == 1 and index.count(uri=A) == 0
+
+
+async def test_follows_an_event_stream(workspace):
+    index = DiagnosticsIndex(workspace.client, debounce=0.01)
+    await index.load()
+    workspace.files[C] = [diag(0)]
+    stream = BridgeEventStream(port=workspace.server.port, token=TOKEN, events=["diagnostics.changed"])
+    async with stream:
+        follower = asyncio.ensure_future(index.follow(stream))
+        await workspace.server.emit("diagnostics.changed", {"uri": C})
+        for _ in range(100):
+            if index.count("error", C):
+                break
+            await asyncio.sleep(0.01)
+        follower.cancel()
+    assert index.counts(C)["error"] == 1
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from ai_native_vscode_bridge import BridgeEventStream
+
+from conftest import TOKEN, take
+
+
+async def settle(stream, received, timeout=2.0):
+    """Wait until the reader task has queued `received` events."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while stream.stats()["received"] < received:
+        assert loop.time() < deadline, stream.stats()
+        await asyncio.sleep(0.01)
+
+
+async def emit_changes(server, uris):
+    for uri in uris:
+        await server.emit("doc.changed", {"uri": uri})
+
+
+async def test_drop_oldest_keeps_the_newest_events(server):
+    stream = BridgeEventStream(port=server.port, token=TOKEN, max_queue=3, overflow="drop-oldest")
+    async with stream:
+        await emit_changes(server, [f"file:///{i}.py" for i in range(10)])
+        await settle(stream, 10)
+        assert stream.stats()["dropped"] == 7
+        events = await take(stream, 3)
+    assert [e["params"]["uri"] for e in events] == ["file:///7.py", "file:///8.py", "file:///9.py"]
+
+
+async def test_coalesce_keeps_the_latest_event_per_uri(server):
+    stream = BridgeEventStream(port=server.port, token=TOKEN, max_queue=10, overflow="coalesce")
+    async with stream:
+        await emit_changes(server, ["file:///a.py", "file:///b.py"] * 3)
+        await server.emit("doc.saved", {"uri": "file:///a.py"})
+        await settle(stream, 7)
+        assert stream.stats()["coalesced"] == 4
+        events = await take(stream, 3)
+    assert [(e["name"], e["params"]["uri"]) for e in events] == [
+        ("doc.changed", "file:///a.py"),
+        ("doc.changed", "file:///b.py"),
+        ("doc.saved", "file:///a.py"),
+    ]
+    # The survivors are the newest of each pair.
+    assert events[0]["seq"] == 5 and events[1]["seq"] == 6
+
+
+async def test_block_applies_backpressure_without_losing_events(server):
+    stream = BridgeEventStream(port=server.port, token=TOKEN, max_queue=2)
+    async with stream:
+        await emit_changes(server, [f"file:///{i}.py" for i in range(6)])
+        await settle(stream, 3)
+        await asyncio.sleep(0.05)
+        assert stream.stats()["queued"] == 2
+        events = await take(stream, 6)
+        assert stream.stats()["dropped"] == 0
+    assert [e["seq"] for e in events] == list(range(1, 7))
+
+
+async def test_exit_with_a_full_blocking_queue_does_not_stall(server):
+    stream = BridgeEventStream(port=server.port, token=TOKEN, max_queue=1)
+    loop = asyncio.get_running_loop()
+    async with stream:
+        await emit_changes(server, [f"file:///{i}.py" for i in range(20)])
+        await settle(stream, 2)
+        started = loop.time()
+    assert loop.time() - started < 0.5
+
+
+async def test_replay_delivers_buffered_events(server):
+    await emit_changes(server, ["file:///a.py", "file:///b.py", "file:///c.py"])
+    async with BridgeEventStream(port=server.port, token=TOKEN, replay=2) as stream:
+        events = await take(stream, 2)
+    assert [e["params"]["uri"] for e in events] == ["file:///b.py", "file:///c.py"]
+
+
+@pytest.mark.parametrize("kwargs", [{"max_queue": 0}, {"overflow": "drop-newest"}])
+def test_invalid_queue_settings(kwargs):
+    with pytest.raises(ValueError):
+        BridgeEventStream(token=TOKEN, **kwargs)
@@ -0,0 +1,53 @@
+import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import ai_native_vscode_bridge as bridge
+
+SRC = str(Path(bridge.__file__).parents[1])
+
+
+def run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": SRC},
+    ).stdout
+
+
+@pytest.mark.parametrize("name", bridge.__all__)
+def test_every_public_name_resolves_to_its_module(name):
+    module = importlib.import_module(bridge._EXPORTS[name], bridge.__name__)
+    assert getattr(bridge, name) is getattr(module, name)
+    assert name in dir(bridge)
+
+
+def test_unknown_names_raise_attribute_error():
+    with pytest.raises(AttributeError):
+        bridge.NoSuchThing
+    with pytest.raises(ImportError):
+        from ai_native_vscode_bridge import NoSuchThing  # noqa: F401
+
+
+def test_importing_the_package_loads_no_dependencies():
+    loaded = run(
+        "import sys; before = set(sys.modules); import ai_native_vscode_bridge; "
+        "print(' '.join(sorted(set(sys.modules) - before)))"
+    ).split()
+    heavy = {"asyncio", "websockets", "msgspec", "orjson", "ai_native_vscode_bridge.client"}
+    assert not heavy & set(loaded)
+    assert not any(m.startswith("ai_native_vscode_bridge.generated") for m in loaded)
+
+
+def test_a_name_loads_only_its_own_module():
+    loaded = run(
+        "import sys; from ai_native_vscode_bridge import BridgeResultCache; "
+        "print(' '.join(m for m in sys.modules if m.startswith('ai_native_vscode_bridge.')))"
+    ).split()
+    assert loaded == ["ai_native_vscode_bridge.cache"]
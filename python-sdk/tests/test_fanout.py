@@ -0,0 +1,108 @@
+import asyncio
+import contextlib
+import socket
+
+import pytest
+
+from ai_native_vscode_bridge import BridgeClient, BridgeError, BridgeFanout, Shard
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+from conftest import TOKEN
+
+
+def shard_handlers(name, folders, delay=0.0, fail=False):
+    async def files(params):
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError(f"{name} is down")
+        return {"items": [f"{folders[0]}/{name}.py"], "truncated": name == "b"}
+
+    return {
+        "workspace.info": lambda p: {"folders": [{"name": name, "uri": f} for f in folders]},
+        "workspace.findFiles": files,
+        "doc.read": lambda p: {"uri": p["uri"], "version": 1, "languageId": name, "text": ""},
+        "tx.begin": lambda p: {"txId": f"{name}-tx", "createdAt": 0},
+        "tx.commit": lambda p: {"txId": p["txId"], "committed": True, "languageId": name},
+    }
+
+
+@contextlib.asynccontextmanager
+async def fanout(**options):
+    """Shards "a" (file:///repo/a) and "b" (file:///repo/b, plus file:///repo/a/vendored)."""
+    folders = {"a": ["file:///repo/a"], "b": ["file:///repo/b", "file:///repo/a/vendored"]}
+    async with contextlib.AsyncExitStack() as stack:
+        shards = []
+        for name in ("a", "b"):
+            handlers = shard_handlers(name, folders[name], **options.get(name, {}))
+            server = await stack.enter_async_context(MockBridgeServer(token=TOKEN, handlers=handlers))
+            shards.append(Shard(name, BridgeClient(port=server.port, token=TOKEN)))
+        async with BridgeFanout(shards) as fan:
+            yield fan
+
+
+async def test_calls_route_by_longest_folder_prefix():
+    async with fanout() as fan:
+        assert (await fan.doc_read({"uri": "file:///repo/a/main.py"}))["languageId"] == "a"
+        assert (await fan.doc_read({"uri": "file:///repo/a/vendored/x.py"}))["languageId"] == "b"
+        assert (await fan.doc_read({"uri": "file:///repo/b/main.py"}))["languageId"] == "b"
+        with pytest.raises(BridgeError) as e:
+            await fan.doc_read({"uri": "file:///elsewhere/x.py"})
+        assert e.value.code == "E_NOT_FOUND"
+        with pytest.raises(BridgeError) as e:
+            await fan.call("tx.begin")
+        assert e.value.code == "E_INVALID_PARAMS"
+
+
+async def test_handles_stay_on_the_shard_that_created_them():
+    async with fanout() as fan:
+        tx = await fan.call("tx.begin", shard="b")
+        assert (await fan.call("tx.commit", {"txId": tx["txId"]}))["languageId"] == "b"
+        assert fan.stats()["handles"] == 1
+
+
+async def test_workspace_wide_calls_are_merged():
+    async with fanout() as fan:
+        files = await fan.workspace_findFiles({"include": "**/*.py"})
+    assert files == {"items": ["file:///repo/a/a.py", "file:///repo/b/b.py"], "truncated": True}
+
+
+async def test_scatter_yields_in_completion_order_and_reports_failures():
+    async with fanout(a={"delay": 0.1}, b={"fail": True}) as fan:
+        replies = [r async for r in fan.scatter("workspace.findFiles")]
+        assert [name for name, _ in replies] == ["b", "a"]
+        assert isinstance(replies[0][1], BridgeError)
+        merged = await fan.gather("workspace.findFiles")
+    assert merged["items"] == ["file:///repo/a/a.py"]
+    assert merged["errors"] == {"b": {"code": "E_FAILED", "message": "b is down"}}
+
+
+async def test_unreachable_shards_are_errors_not_exceptions(server):
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        dead_port = s.getsockname()[1]
+    fan = BridgeFanout(
+        [
+            Shard("up", BridgeClient(port=server.port, token=TOKEN), ["file:///mock"]),
+            Shard("down", BridgeClient(port=dead_port, token=TOKEN), ["file:///other"]),
+        ]
+    )
+    info = await fan.gather("workspace.info")
+    assert info["errors"]["down"]["code"] == "E_FAILED" and info["folders"]
+    # With every shard failing there is nothing to merge.
+    with pytest.raises(BridgeError):
+        await BridgeFanout([fan.shard("down")]).gather("workspace.info")
+
+
+def test_from_workspaces_reads_token_and_port(tmp_path):
+    for name, settings in (("a", '{\n  // port\n  "bridge.port": 57111\n}'), ("b", "{}")):
+        vscode = tmp_path / name / ".vscode"
+        vscode.mkdir(parents=True)
+        (vscode / "bridge.token").write_text(f"token-{name}\n")
+        (vscode / "settings.json").write_text(settings)
+    fan = BridgeFanout.from_workspaces([str(tmp_path / "a"), str(tmp_path / "b")])
+    assert [(s.name, s.client.port, s.client.token) for s in fan.shards] == [
+        ("a", 57111, "token-a"),
+        ("b", 57110, "token-b"),
+    ]
+    with pytest.raises(ValueError):
+        BridgeFanout([Shard("x", None), Shard("x", None)])
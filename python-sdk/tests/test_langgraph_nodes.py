@@ -0,0 +1,76 @@
+import asyncio
+import importlib.util
+import socket
+from pathlib import Path
+
+import pytest
+
+from ai_native_vscode_bridge import BridgeConnectionPool, BridgeError
+
+from conftest import TOKEN
+
+_spec = importlib.util.spec_from_file_location(
+    "langgraph_bridge", Path(__file__).resolve().parents[2] / "nodes" / "langgraph_bridge.py"
+)
+nodes = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(nodes)
+
+
+@pytest.fixture(autouse=True)
+async def shared(monkeypatch):
+    monkeypatch.setenv("BRIDGE_TOKEN", TOKEN)
+    yield nodes._shared
+    await nodes.close_shared_bridges()
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def test_first_nodes_share_one_opened_pool(server, shared):
+    pools = await asyncio.gather(
+        *(nodes.get_bridge(None, port=server.port, min_size=2) for _ in range(5))
+    )
+    pool = pools[0]
+    assert isinstance(pool, BridgeConnectionPool) and all(p is pool for p in pools)
+    assert pool.stats()["connected"] == 2
+    assert pool._health is not None and not pool._health.done()
+    await nodes.close_shared_bridges()
+    assert pool._health is None and pool.size == 0
+    assert asyncio.get_running_loop() not in shared
+
+
+async def test_configured_bridge_is_used_as_is(client):
+    config = {"configurable": {"bridge": client}}
+    assert await nodes.get_bridge(config) is client
+    node = nodes.bridge_node("bridge.ping", key="pong")
+    assert (await node({}, config))["pong"]["result"]["ok"] is True
+
+
+async def test_failed_open_is_retried_by_the_next_node(shared):
+    port = free_port()
+    with pytest.raises((BridgeError, OSError)):
+        await nodes.get_bridge(None, port=port, max_attempts=1, backoff_initial=0.001)
+    assert port not in shared.get(asyncio.get_running_loop(), {})
+
+
+async def test_entries_of_closed_loops_are_evicted(server, shared):
+    dead = asyncio.new_event_loop()
+    dead.close()
+    shared[dead] = {}
+    await nodes.get_bridge(None, port=server.port)
+    assert dead not in shared
+
+
+async def test_fanout_keeps_order_and_isolates_errors(server):
+    node = nodes.bridge_fanout_node(
+        lambda state: [("doc.read", {"uri": u}) for u in state["uris"]] + [("no.such", None)],
+        port=server.port,
+        concurrency=2,
+    )
+    out = await node({"uris": ["file:///a.py", "file:///b.py"]})
+    entries = out["bridge:results"]
+    assert [e["result"]["uri"] for e in entries[:2]] == ["file:///a.py", "file:///b.py"]
+    assert entries[2]["error"]["code"] == "E_NOT_FOUND" and "result" not in entries[2]
@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from ai_native_vscode_bridge import AdaptiveLimiter, BridgeClient, BridgeError, RetryPolicy
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+from conftest import TOKEN
+
+
+class Load:
+    """An async handler that tracks how many calls run at once."""
+
+    def __init__(self, delay=0.02, fail=lambda: False):
+        self.delay = delay
+        self.fail = fail
+        self.running = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def __call__(self, params):
+        self.calls += 1
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail():
+                raise RuntimeError("language server busy")
+            return {"items": []}
+        finally:
+            self.running -= 1
+
+
+async def run(handlers, n, **client_kwargs):
+    async with MockBridgeServer(token=TOKEN, handlers=handlers) as server:
+        async with BridgeClient(port=server.port, token=TOKEN, **client_kwargs) as client:
+            calls = [client.call(method, {"uri": f"file:///{i}"}) for i in range(n) for method in handlers]
+            return await asyncio.gather(*calls, return_exceptions=True)
+
+
+async def test_each_family_is_capped_by_its_own_limit():
+    code, debug = Load(), Load()
+    limiter = AdaptiveLimiter(initial=3, max_limit=3)
+    await run({"code.hover": code, "debug.sessions": debug}, 12, limiter=limiter)
+    assert code.peak == 3
+    # DEFAULT_FAMILY_LIMITS start debug at 1 and never let it pass 2.
+    assert 1 <= debug.peak <= 2
+    stats = limiter.stats()
+    assert stats["code"]["inFlight"] == 0 and stats["code"]["completed"] == 12
+
+
+async def test_successes_grow_the_limit_and_failures_shrink_it():
+    limiter = AdaptiveLimiter(initial=2, max_limit=16)
+    await run({"code.hover": Load(delay=0.005)}, 40, limiter=limiter)
+    grown = limiter.stats()["code"]["limit"]
+    assert grown > 2
+    await run({"code.hover": Load(fail=lambda: True)}, 8, limiter=limiter)
+    stats = limiter.stats()["code"]
+    assert stats["drops"] >= 1 and stats["limit"] < grown
+
+
+async def test_a_cancelled_waiter_does_not_leak_its_slot():
+    limiter = AdaptiveLimiter(initial=1, max_limit=1)
+    slot = limiter.slot("code.hover")
+    await slot.__aenter__()
+    waiter = asyncio.ensure_future(limiter.slot("code.hover").__aenter__())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await slot.__aexit__(None, None, None)
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    stats = limiter.stats()["code"]
+    assert (stats["inFlight"], stats["queued"]) == (0, 0)
+
+
+async def test_transient_read_failures_are_retried():
+    failures = iter([True, True])
+    hover = Load(delay=0, fail=lambda: next(failures, False))
+    retry = RetryPolicy(backoff_initial=0.001)
+    (result,) = await run({"code.hover": hover}, 1, retry=retry)
+    assert result == {"items": []} and hover.calls == 3
+    assert retry.stats() == {"retried": 2, "gaveUp": 0}
+
+
+async def test_retries_give_up_and_skip_writes():
+    hover, commit = Load(delay=0, fail=lambda: True), Load(delay=0, fail=lambda: True)
+    retry = RetryPolicy(attempts=2, backoff_initial=0.001)
+    results = await run({"code.hover": hover, "tx.commit": commit}, 1, retry=retry)
+    assert all(isinstance(r, BridgeError) and r.code == "E_FAILED" for r in results)
+    assert (hover.calls, commit.calls) == (2, 1)
+    assert retry.stats() == {"retried": 1, "gaveUp": 1}
+
+
+class DropsFirstCall:
+    """Restarts the server under the first call; later calls answer."""
+
+    def __init__(self):
+        self.calls = 0
+        self.restarts = set()
+
+    async def __call__(self, params):
+        self.calls += 1
+        if self.calls == 1:
+            task = asyncio.ensure_future(self.restart())
+            self.restarts.add(task)
+            await asyncio.sleep(10)
+        return {"items": []}
+
+    async def restart(self):
+        await self.server.stop()
+        await self.server.start()
+
+
+@pytest.mark.parametrize("persistent", [False, True])
+async def test_a_server_dropped_mid_call_is_retried(persistent):
+    hover = DropsFirstCall()
+    retry = RetryPolicy(backoff_initial=0.01)
+    async with MockBridgeServer(token=TOKEN, handlers={"code.hover": hover}) as server:
+        hover.server = server
+        client = BridgeClient(port=server.port, token=TOKEN, retry=retry)
+        if persistent:
+            await client.connect()
+        try:
+            result = await asyncio.wait_for(client.call("code.hover", {"uri": "u"}), 5.0)
+        finally:
+            await client.close()
+    assert result == {"items": []} and hover.calls == 2
+    assert retry.stats()["retried"] >= 1
+
+
+def test_request_errors_are_not_retried():
+    retry = RetryPolicy()
+    assert not retry.should_retry("code.hover", BridgeError("E_NOT_FOUND", "no"), 0)
+    assert retry.should_retry("code.hover", ConnectionResetError(), 0)
+    assert 0 <= retry.delay(10) <= retry.backoff_max
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(initial=100, max_limit=10)
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(backoff=1.5)
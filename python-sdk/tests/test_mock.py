@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from ai_native_vscode_bridge import BridgeClient, BridgeError, BridgeEventStream
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+from conftest import TOKEN, take
+
+
+async def test_answers_every_v1_method(client, server):
+    assert (await client.call("bridge.ping"))["ok"] is True
+    caps = await client.call("bridge.capabilities")
+    assert "batch" in caps["features"]
+    doc = await client.call("doc.read", {"uri": "file:///a.py"})
+    assert len(doc["text"].splitlines()) == server.doc_lines
+    assert len((await client.call("code.references", {"uri": "file:///a.py"}))["items"]) == server.result_items
+    assert server.requests == 4
+
+
+async def test_rejects_a_wrong_token(server):
+    with pytest.raises(BridgeError) as e:
+        await BridgeClient(port=server.port, token="wrong").call("bridge.ping")
+    assert e.value.code == "E_AUTH"
+
+
+async def test_unknown_method(client):
+    with pytest.raises(BridgeError) as e:
+        await client.call("no.such.method")
+    assert e.value.code == "E_NOT_FOUND"
+
+
+async def test_handlers_override_and_fail_like_the_extension():
+    async def slow(params):
+        await asyncio.sleep(0)
+        return {"items": [params["uri"]]}
+
+    def broken(params):
+        raise RuntimeError("boom")
+
+    handlers = {"code.references": slow, "code.hover": broken}
+    async with MockBridgeServer(token=TOKEN, handlers=handlers) as server:
+        async with BridgeClient(port=server.port, token=TOKEN) as client:
+            assert await client.call("code.references", {"uri": "u"}) == {"items": ["u"]}
+            with pytest.raises(BridgeError) as e:
+                await client.call("code.hover", {"uri": "u"})
+            assert (e.value.code, e.value.message) == ("E_FAILED", "boom")
+
+
+async def test_latency_is_applied_per_method():
+    latency = lambda method: 0.05 if method == "code.references" else 0.0  # noqa: E731
+    async with MockBridgeServer(token=TOKEN, latency=latency) as server:
+        async with BridgeClient(port=server.port, token=TOKEN) as client:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            await client.call("bridge.ping")
+            assert loop.time() - started < 0.05
+            await client.call("code.references", {"uri": "u"})
+            assert loop.time() - started >= 0.05
+
+
+async def test_emit_reaches_matching_subscribers(server):
+    stream = BridgeEventStream(port=server.port, token=TOKEN, events=["doc.saved"])
+    async with stream:
+        await server.emit("doc.changed", {"uri": "file:///a.py"})
+        await server.emit("doc.saved", {"uri": "file:///b.py"})
+        (event,) = await take(stream, 1)
+    assert event["name"] == "doc.saved"
+    assert event["params"] == {"uri": "file:///b.py"}
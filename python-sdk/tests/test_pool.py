@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from ai_native_vscode_bridge import BridgeConnectionPool, BridgeError
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+from conftest import TOKEN
+
+
+async def test_sequential_calls_reuse_one_socket(server):
+    async with BridgeConnectionPool(port=server.port, token=TOKEN, max_size=4) as pool:
+        for _ in range(10):
+            await pool.call("bridge.ping")
+        assert pool.size == 1
+
+
+async def test_grows_under_load_up_to_max_size():
+    async with MockBridgeServer(token=TOKEN, latency=0.05) as server:
+        async with BridgeConnectionPool(port=server.port, token=TOKEN, max_size=3) as pool:
+            await asyncio.gather(*(pool.call("doc.read", {"uri": "u"}) for _ in range(30)))
+            assert pool.size == 3
+            assert pool.stats()["connected"] == 3
+
+
+async def test_waiters_for_the_grow_lock_take_an_idle_socket(server):
+    async with BridgeConnectionPool(port=server.port, token=TOKEN, min_size=0, max_size=8) as pool:
+        # Every caller finds the pool empty, then queues on the grow lock:
+        # once the first has added a socket, the rest find it idle.
+        clients = await asyncio.gather(*(pool._acquire() for _ in range(8)))
+        assert pool.size == 1
+        assert all(c is clients[0] for c in clients)
+
+
+async def test_health_check_reconnects_after_a_restart():
+    server = await MockBridgeServer(token=TOKEN).start()
+    port = server.port
+    pool = BridgeConnectionPool(
+        port=port, token=TOKEN, health_interval=0.05, backoff_initial=0.01
+    )
+    async with pool:
+        await pool.call("bridge.ping")
+        await server.stop()
+        server = await MockBridgeServer(token=TOKEN, port=port).start()
+        try:
+            for _ in range(100):
+                if pool.reconnects:
+                    break
+                await asyncio.sleep(0.02)
+            assert pool.reconnects >= 1
+            assert (await pool.call("bridge.ping"))["ok"] is True
+        finally:
+            await server.stop()
+
+
+async def test_gives_up_after_max_attempts():
+    pool = BridgeConnectionPool(port=1, token=TOKEN, backoff_initial=0.001, max_attempts=2)
+    with pytest.raises(BridgeError) as e:
+        await pool.open()
+    assert e.value.code == "E_FAILED"
+    await pool.close()
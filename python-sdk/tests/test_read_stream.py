@@ -0,0 +1,67 @@
+import pytest
+
+from ai_native_vscode_bridge import BridgeClient, BridgeError
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+from conftest import TOKEN
+
+URI = "file:///big.py"
+
+
+async def test_windows_rebuild_the_document():
+    async with MockBridgeServer(token=TOKEN, doc_lines=250) as server:
+        async with BridgeClient(port=server.port, token=TOKEN) as client:
+            whole = (await client.call("doc.read", {"uri": URI}))["text"]
+            chunks = [c async for c in client.read_stream(URI, chunk_lines=100)]
+    assert [(c["startLine"], c["endLine"]) for c in chunks] == [(0, 100), (100, 200), (200, 250)]
+    assert all(c["totalLines"] == 250 for c in chunks)
+    assert "".join(c["text"] for c in chunks) == whole
+
+
+async def test_a_line_range_is_streamed():
+    async with MockBridgeServer(token=TOKEN, doc_lines=250) as server:
+        async with BridgeClient(port=server.port, token=TOKEN) as client:
+            whole = (await client.call("doc.read", {"uri": URI}))["text"].splitlines(True)
+            chunks = [
+                c async for c in client.read_stream(URI, chunk_lines=40, start_line=30, end_line=110)
+            ]
+    assert [(c["startLine"], c["endLine"]) for c in chunks] == [(30, 70), (70, 110)]
+    assert "".join(c["text"] for c in chunks) == "".join(whole[30:110])
+
+
+async def test_version_change_mid_stream():
+    versions = iter(range(1, 100))
+
+    def doc_read(params):
+        return {
+            "uri": URI,
+            "version": next(versions),
+            "languageId": "python",
+            "text": "x\n",
+            "startLine": params["startLine"],
+            "endLine": params["endLine"],
+            "totalLines": 10,
+        }
+
+    async with MockBridgeServer(token=TOKEN, handlers={"doc.read": doc_read}) as server:
+        async with BridgeClient(port=server.port, token=TOKEN) as client:
+            with pytest.raises(BridgeError) as e:
+                async for _ in client.read_stream(URI, chunk_lines=5):
+                    pass
+    assert e.value.code == "E_FAILED"
+
+
+async def test_servers_without_ranged_reads():
+    handlers = {"doc.read": lambda p: {"uri": URI, "version": 1, "languageId": "python", "text": ""}}
+    async with MockBridgeServer(token=TOKEN, handlers=handlers) as server:
+        async with BridgeClient(port=server.port, token=TOKEN) as client:
+            with pytest.raises(BridgeError) as e:
+                async for _ in client.read_stream(URI):
+                    pass
+    assert e.value.code == "E_UNSUPPORTED"
+
+
+async def test_chunk_lines_must_be_positive(client):
+    with pytest.raises(ValueError):
+        async for _ in client.read_stream(URI, chunk_lines=0):
+            pass
@@ -0,0 +1,113 @@
+import asyncio
+import itertools
+
+import pytest
+
+from ai_native_vscode_bridge import (
+    BridgeClient,
+    BridgeError,
+    BridgeEventStream,
+    RecordingTransport,
+    ReplayTransport,
+)
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+from conftest import TOKEN, take
+
+
+async def session(client):
+    """The calls an agent makes; run once live and once from the recording."""
+    out = [
+        await client.call("bridge.ping"),
+        await client.call("doc.read", {"uri": "file:///a.py", "meta": {"traceId": "t1"}}),
+        await client.call("code.hover", {"uri": "file:///a.py"}),
+        await client.call("code.hover", {"uri": "file:///a.py"}),
+        await client.call("code.hover", {"uri": "file:///a.py"}),
+    ]
+    async with client.batch() as batch:
+        futs = [batch.call("code.references", {"uri": f"file:///{i}.py"}) for i in range(3)]
+    out.extend(f.result() for f in futs)
+    with pytest.raises(BridgeError) as e:
+        await client.call("no.such.method")
+    out.append(e.value.code)
+    return out
+
+
+@pytest.fixture
+async def recording(tmp_path):
+    """A recording of `session()` against a mock whose hover answers change."""
+    counter = itertools.count()
+    handlers = {"code.hover": lambda p: {"items": [{"contents": [str(next(counter))]}]}}
+    path = str(tmp_path / "session.rec")
+    async with MockBridgeServer(token=TOKEN, handlers=handlers, latency=0.02) as server:
+        with RecordingTransport(path) as recorder:
+            async with BridgeClient(port=server.port, token=TOKEN, transport=recorder) as client:
+                live = await session(client)
+            assert recorder.records > 0
+    return path, live
+
+
+async def test_replay_returns_the_recorded_answers(recording):
+    path, live = recording
+    replay = ReplayTransport(path)
+    async with BridgeClient(token="anything", transport=replay) as client:
+        await client.call("bridge.ping")  # shifts the ids; answers must not care
+        assert await session(client) == live
+        # Repeated calls got their answers in order; after that the last one repeats.
+        hover = await client.call("code.hover", {"uri": "file:///a.py"})
+        assert hover["items"][0]["contents"] == ["2"]
+        with pytest.raises(BridgeError) as e:
+            await client.call("doc.read", {"uri": "file:///never.py"})
+        assert e.value.code == "E_NOT_FOUND" and e.value.data == {"method": "doc.read"}
+    stats = replay.replay_stats()
+    # Every session call, the extra ping and hover, and batch()'s bridge.capabilities.
+    assert stats["misses"] == 1 and stats["hits"] == len(live) + 3
+    replay.close()
+
+
+async def test_one_shot_clients_replay_too(recording):
+    path, live = recording
+    replay = ReplayTransport(path)
+    client = BridgeClient(token="anything", transport=replay)
+    assert await client.call("bridge.ping") == live[0]
+    replay.close()
+
+
+async def test_speed_replays_recorded_latency(recording):
+    path, _ = recording
+    for speed, slower_than in ((None, None), (1.0, 0.015)):
+        replay = ReplayTransport(path, speed=speed)
+        async with BridgeClient(token="anything", transport=replay) as client:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            await client.call("doc.read", {"uri": "file:///a.py"})
+            elapsed = loop.time() - started
+        replay.close()
+        if slower_than is None:
+            assert elapsed < 0.015
+        else:
+            assert elapsed >= slower_than
+    with pytest.raises(ValueError):
+        ReplayTransport(path, speed=0)
+
+
+async def test_events_follow_their_subscription(server, tmp_path):
+    path = str(tmp_path / "events.rec")
+    with RecordingTransport(path) as recorder:
+        stream = BridgeEventStream(port=server.port, token=TOKEN, transport=recorder)
+        async with stream:
+            for uri in ("a", "b"):
+                await server.emit("doc.changed", {"uri": uri})
+            live = await take(stream, 2)
+    replay = ReplayTransport(path)
+    async with BridgeEventStream(token="anything", transport=replay) as stream:
+        replayed = await take(stream, 2)
+    assert replayed == live and replay.replay_stats()["events"] == 2
+    replay.close()
+
+
+def test_rejects_files_that_are_not_recordings(tmp_path):
+    path = tmp_path / "not.rec"
+    path.write_bytes(b"{}\n")
+    with pytest.raises(ValueError):
+        ReplayTransport(str(path))
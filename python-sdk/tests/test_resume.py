@@ -0,0 +1,84 @@
+import pytest
+
+from ai_native_vscode_bridge import BridgeError, BridgeEventStream
+from ai_native_vscode_bridge.mock import EVENT_BUFFER_MAX, MockBridgeServer
+
+from conftest import TOKEN, take
+
+
+def resuming(server, **kwargs):
+    return BridgeEventStream(
+        port=server.port, token=TOKEN, resume=True, backoff_initial=0.01, backoff_max=0.05, **kwargs
+    )
+
+
+async def test_reconnect_picks_up_after_last_seq(server):
+    async with resuming(server) as stream:
+        await server.emit("doc.changed", {"uri": "a"})
+        await take(stream, 1)
+        await server.stop()
+        await server.emit("doc.changed", {"uri": "b"})  # while the socket is down
+        await server.start()
+        (missed,) = await take(stream, 1)
+        await server.emit("doc.changed", {"uri": "c"})
+        (live,) = await take(stream, 1)
+        stats = stream.stats()
+    assert (missed["seq"], live["seq"]) == (2, 3)
+    assert (stats["reconnects"], stats["gaps"], stats["duplicates"]) == (1, 0, 0)
+
+
+async def test_extension_restart_is_reported_as_a_gap(server):
+    async with resuming(server) as stream:
+        await server.emit("doc.changed", {"uri": "a"})
+        await take(stream, 1)
+        old_epoch = stream.epoch
+        await server.stop()
+        async with MockBridgeServer(token=TOKEN, port=server.port) as restarted:
+            (gap,) = await take(stream, 1)
+            await restarted.emit("doc.changed", {"uri": "b"})
+            (event,) = await take(stream, 1)
+            assert stream.epoch == restarted.epoch != old_epoch
+    assert gap["name"] == "events.gap" and gap["seq"] is None
+    assert gap["params"]["restarted"] is True
+    # The new activation numbers from 1 again and is not mistaken for a duplicate.
+    assert event["seq"] == 1 and stream.stats()["duplicates"] == 0
+
+
+async def test_resume_across_runs_with_since_seq_and_epoch(server):
+    for uri in "abc":
+        await server.emit("doc.changed", {"uri": uri})
+    async with resuming(server, since_seq=1, epoch=server.epoch) as stream:
+        events = await take(stream, 2)
+        assert stream.stats()["gaps"] == 0
+    assert [e["params"]["uri"] for e in events] == ["b", "c"]
+
+
+async def test_resume_with_since_seq_alone_across_a_restart(server):
+    # A restarted extension numbers from 1 again: since_seq=50 is from before it.
+    for uri in "ab":
+        await server.emit("doc.changed", {"uri": uri})
+    async with resuming(server, since_seq=50) as stream:
+        gap, *replayed = await take(stream, 3)
+        await server.emit("doc.changed", {"uri": "c"})
+        (live,) = await take(stream, 1)
+        stats = stream.stats()
+    assert gap["name"] == "events.gap" and gap["params"]["restarted"] is True
+    assert [e["seq"] for e in replayed] == [1, 2] and live["seq"] == 3
+    assert stats["duplicates"] == 0 and stream.last_seq == 3
+
+
+async def test_evicted_events_are_reported_as_a_gap(server):
+    for i in range(EVENT_BUFFER_MAX + 5):
+        await server.emit("doc.changed", {"uri": str(i)})
+    async with resuming(server, since_seq=1, epoch=server.epoch) as stream:
+        gap, first = await take(stream, 2)
+    assert gap["name"] == "events.gap" and gap["params"]["restarted"] is False
+    assert first["seq"] == 6
+
+
+async def test_without_resume_a_dropped_socket_ends_the_stream(server):
+    async with BridgeEventStream(port=server.port, token=TOKEN) as stream:
+        await server.stop()
+        with pytest.raises(BridgeError) as e:
+            await take(stream, 1)
+    assert e.value.code == "E_FAILED"
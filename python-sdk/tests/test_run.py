@@ -0,0 +1,73 @@
+import asyncio
+import json
+
+import pytest
+
+from ai_native_vscode_bridge import run
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+from conftest import TOKEN
+
+REQUESTS = [
+    {"id": "slow", "method": "code.hover", "params": {"uri": "file:///a.py"}},
+    {"method": "bridge.ping"},
+    {"id": 3, "method": "no.such.method"},
+]
+
+
+@pytest.fixture
+async def server():
+    latency = lambda method: 0.1 if method == "code.hover" else 0.0  # noqa: E731
+    async with MockBridgeServer(token=TOKEN, latency=latency) as srv:
+        yield srv
+
+
+async def run_main(tmp_path, lines, *args):
+    src, out = tmp_path / "requests.jsonl", tmp_path / "results.jsonl"
+    src.write_text("".join(line + "\n" for line in lines))
+    # main() runs its own event loop, so it gets a thread next to the mock's.
+    status = await asyncio.to_thread(run.main, [str(src), "-o", str(out), "--token", TOKEN, *args])
+    return status, [json.loads(line) for line in out.read_text().splitlines()]
+
+
+async def test_responses_keep_input_order(server, tmp_path):
+    lines = [json.dumps(REQUESTS[0]), "", json.dumps(REQUESTS[1]), json.dumps(REQUESTS[2]), "[1, 2]"]
+    status, replies = await run_main(tmp_path, lines, "--port", str(server.port))
+    assert status == 1  # some requests failed
+    assert [r["id"] for r in replies] == ["slow", 3, 3, 5]
+    assert "items" in replies[0]["result"] and replies[1]["result"]["ok"] is True
+    assert replies[2]["error"]["code"] == "E_NOT_FOUND"
+    assert replies[3]["error"] == {
+        "code": "E_INVALID_PARAMS",
+        "message": "Line 5: not a JSON-RPC request",
+        "data": {"line": 5},
+    }
+
+
+async def test_completion_order_and_stats(server, tmp_path, capsys):
+    lines = [json.dumps(r) for r in REQUESTS[:2]]
+    status, replies = await run_main(
+        tmp_path, lines, "--port", str(server.port), "--order", "completion", "--stats"
+    )
+    assert status == 0
+    assert [r["id"] for r in replies] == [2, "slow"]
+    summary = json.loads(capsys.readouterr().err)
+    assert (summary["requests"], summary["errors"], summary["size"]) == (2, 0, 1)
+
+
+async def test_timeouts_are_reported_per_request(server, tmp_path):
+    status, replies = await run_main(
+        tmp_path, [json.dumps(r) for r in REQUESTS[:2]], "--port", str(server.port), "--timeout", "0.02"
+    )
+    assert status == 1
+    assert replies[0]["error"]["data"] == {"timeout": 0.02} and replies[1]["result"]["ok"] is True
+
+
+async def test_missing_token_exits_2(tmp_path, monkeypatch, capsys):
+    monkeypatch.delenv("BRIDGE_TOKEN", raising=False)
+    src = tmp_path / "requests.jsonl"
+    src.write_text(json.dumps(REQUESTS[1]) + "\n")
+    status = await asyncio.to_thread(
+        run.main, [str(src), "--workspace-dir", str(tmp_path), "-o", str(tmp_path / "out")]
+    )
+    assert status == 2 and "Missing token" in capsys.readouterr().err
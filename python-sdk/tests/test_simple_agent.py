@@ -0,0 +1,112 @@
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from ai_native_vscode_bridge import BridgeClient
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+from conftest import TOKEN
+
+_spec = importlib.util.spec_from_file_location(
+    "simple_agent", Path(__file__).resolve().parents[2] / "examples" / "simple_agent.py"
+)
+agent = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(agent)
+
+URIS = [f"file:///mock/file_{i}.py" for i in range(3)]
+
+
+class Transactions:
+    """tx.* handlers that remember which file each tx previewed."""
+
+    def __init__(self, staged=lambda uri: True, fail_commit=(), fail_rollback=()):
+        self.staged = staged
+        self.fail_commit = set(fail_commit)
+        self.fail_rollback = set(fail_rollback)
+        self.uri = {}
+        self.log = []
+
+    def handlers(self):
+        return {
+            "tx.begin": self.begin,
+            "diagnostics.fix.preview": self.preview,
+            "diagnostics.fix.commit": self.commit,
+            "tx.commit": self.commit,
+            "tx.rollback": self.rollback,
+        }
+
+    def begin(self, params):
+        tx_id = f"tx{len(self.uri)}"
+        self.uri[tx_id] = None
+        return {"txId": tx_id, "createdAt": 0}
+
+    def preview(self, params):
+        self.uri[params["txId"]] = params["uri"]
+        return {"staged": self.staged(params["uri"]), "title": "Fix it"}
+
+    def commit(self, params):
+        if self.uri[params["txId"]] in self.fail_commit or "*" in self.fail_commit:
+            raise RuntimeError("rejected")
+        self.log.append(("commit", self.uri[params["txId"]]))
+        return {"committed": True}
+
+    def rollback(self, params):
+        if self.uri[params["txId"]] in self.fail_rollback or "*" in self.fail_rollback:
+            raise RuntimeError("tx expired")
+        print("ROLLED BACK")
+        self.log.append(("rollback", self.uri[params["txId"]]))
+        return {"rolledBack": True}
+
+
+async def fix(tx, fn, *args):
+    async with MockBridgeServer(token=TOKEN, handlers=tx.handlers()) as server:
+        async with BridgeClient(port=server.port, token=TOKEN) as client:
+            watcher = agent.DiagnosticsWatcher(None, None)
+            return await fn(client, watcher, asyncio.Semaphore(2), *args)
+
+
+async def test_fix_file_counts_applied_and_skipped():
+    assert await fix(Transactions(), agent.fix_file, URIS[0], 2, False, 0.01) == (2, 0)
+    no_fix = Transactions(staged=lambda uri: False)
+    assert await fix(no_fix, agent.fix_file, URIS[0], 2, False, 0.01) == (0, 1)
+    rejected = Transactions(fail_commit=[URIS[0]])
+    assert await fix(rejected, agent.fix_file, URIS[0], 2, False, 0.01) == (0, 1)
+    assert rejected.log == [("rollback", URIS[0])]
+
+
+async def test_one_failing_file_does_not_abort_the_others(monkeypatch, capsys):
+    monkeypatch.setenv("BRIDGE_TOKEN", TOKEN)
+    # file_1 has no fix and its rollback fails, so fix_file raises for it alone.
+    tx = Transactions(staged=lambda uri: uri != URIS[1], fail_rollback=[URIS[1]])
+    async with MockBridgeServer(token=TOKEN, files=3, result_items=2, handlers=tx.handlers()) as server:
+        await agent.run_agent(server.port, "warning", False, settle_timeout=0.01)
+    out = capsys.readouterr().out
+    assert sorted(uri for op, uri in tx.log if op == "commit") == sorted([URIS[0], URIS[2]] * 2)
+    assert f"Could not fix {agent.short_uri(URIS[1])}" in out
+    assert "Skipped (no fix available or fix rejected): 0 file(s)" in out
+    assert "Failed: 1 file(s)" in out
+
+
+async def test_fix_bulk_reports_after_the_rollback(capsys):
+    tx = Transactions(fail_commit=["*"])
+    assert await fix(tx, agent.fix_bulk, URIS, False, False, 0.01) == (0, 3)
+    out = capsys.readouterr().out
+    assert out.index("ROLLED BACK") < out.index("❌ Transaction failed")
+    assert out.rstrip().endswith("; rolled back")
+
+
+async def test_fix_bulk_reports_a_failed_rollback(capsys):
+    tx = Transactions(fail_commit=["*"], fail_rollback=["*"])
+    assert await fix(tx, agent.fix_bulk, URIS, False, False, 0.01) == (0, 3)
+    out = capsys.readouterr().out
+    assert "Could not roll back transaction tx0: E_FAILED: tx expired" in out
+    assert out.rstrip().endswith("; rollback failed")
+
+
+@pytest.mark.parametrize("dry_run", [True, False])
+async def test_fix_bulk_commits_once(dry_run):
+    tx = Transactions(staged=lambda uri: uri != URIS[2])
+    assert await fix(tx, agent.fix_bulk, URIS, dry_run, False, 0.01) == (2, 1)
+    assert [op for op, _ in tx.log] == (["rollback"] if dry_run else ["commit"])
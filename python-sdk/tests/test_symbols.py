@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from ai_native_vscode_bridge import BridgeClient, SymbolIndex
+from ai_native_vscode_bridge.mock import MockBridgeServer
+from ai_native_vscode_bridge.symbols import DEFAULT_INCLUDE
+
+from conftest import TOKEN
+
+FILES = 3
+ITEMS = 4
+
+
+class Workspace:
+    """Symbol handlers that can rename a file's symbols or fail for it."""
+
+    def __init__(self):
+        self.requests = []
+        self.renamed = set()
+        self.broken = set()
+
+    def find_files(self, params):
+        self.requests.append(params)
+        return {"items": [f"file:///mock/file_{i}.py" for i in range(FILES)], "truncated": False}
+
+    def symbols(self, params):
+        uri = params["uri"]
+        if uri in self.broken:
+            raise RuntimeError("no language server")
+        if uri in self.renamed:
+            return {"items": [symbol("renamed", 12, 0)]}
+        assert params["flatten"] is True
+        items = []
+        for i in range(ITEMS):
+            # Parents come before their children, as the extension lists them.
+            items.append({**symbol(f"symbol_{i}", 12, i), "containerName": None})
+            items.append({**symbol(f"member_{i}", 6, i), "containerName": f"symbol_{i}"})
+        return {"items": items}
+
+
+def symbol(name, kind, line):
+    rng = {"start": {"line": line, "character": 0}, "end": {"line": line, "character": 8}}
+    return {"name": name, "kind": kind, "range": rng, "selectionRange": rng}
+
+
+@pytest.fixture
+async def mock():
+    ws = Workspace()
+    handlers = {"workspace.findFiles": ws.find_files, "code.symbols.document": ws.symbols}
+    async with MockBridgeServer(token=TOKEN, handlers=handlers) as server:
+        async with BridgeClient(port=server.port, token=TOKEN) as client:
+            yield ws, client
+
+
+async def test_build_indexes_nested_members_with_their_container(mock):
+    ws, client = mock
+    index = SymbolIndex(client)
+    assert await index.build() == FILES * ITEMS * 2
+    assert ws.requests[0]["include"] == DEFAULT_INCLUDE
+    uri = "file:///mock/file_0.py"
+    members = [e for e in index.symbols_in(uri) if e.kind == 6]
+    assert [(e.name, e.container) for e in members] == [
+        (f"member_{i}", f"symbol_{i}") for i in range(ITEMS)
+    ]
+    assert index.stats()["fetched"] == FILES and index.stats()["failures"] == 0
+
+
+async def test_prefix_and_fuzzy_search(mock):
+    _, client = mock
+    index = SymbolIndex(client)
+    await index.build()
+    assert {e.name for e in index.prefix("MEMBER_")} == {f"member_{i}" for i in range(ITEMS)}
+    assert all(e.kind == 12 for e in index.prefix("s", kinds={12}))
+    assert len(index.prefix("symbol_1", limit=2)) == 2
+    best = index.search("sym3")
+    assert best[0].name == "symbol_3"
+    assert index.search("mbr2")[0].name == "member_2"
+    assert index.search("zzz") == []
+
+
+async def test_save_load_and_refresh_from_events(mock, tmp_path):
+    ws, client = mock
+    built = SymbolIndex(client)
+    await built.build()
+    path = built.save(str(tmp_path / "symbols.idx"))
+    built.close()
+
+    index = SymbolIndex.load(path, client, debounce=60)
+    assert index.stats()["mapped"] and len(index) == FILES * ITEMS * 2
+    uri = "file:///mock/file_1.py"
+    ws.renamed.add(uri)
+    index.handle_event({"name": "doc.changed", "params": {"uri": uri}})
+    await index.flush()
+    assert [e.name for e in index.symbols_in(uri)] == ["renamed"]
+    assert index.prefix("renamed")[0].uri == uri
+    assert len(index) == (FILES - 1) * ITEMS * 2 + 1
+    index.save()
+    assert SymbolIndex.load(path).prefix("renamed")[0].uri == uri
+    index.close()
+
+
+class _FailingClient:
+    def __init__(self, error):
+        self.error = error
+
+    async def call(self, method, params=None):
+        raise self.error
+
+
+@pytest.mark.parametrize("error", [OSError("refused"), asyncio.TimeoutError()])
+async def test_transport_failures_skip_the_file(error):
+    index = SymbolIndex(_FailingClient(error))
+    assert await index.build(["file:///a.py", "file:///b.py"]) == 0
+    assert index.stats()["failures"] == 2
+
+
+async def test_server_errors_skip_only_that_file(mock):
+    ws, client = mock
+    ws.broken.add("file:///bad.py")
+    index = SymbolIndex(client)
+    assert await index.build(["file:///bad.py", "file:///good.py"]) == ITEMS * 2
+    assert index.stats()["failures"] == 1 and index.symbols_in("file:///bad.py") == []
+
+
+async def test_mock_lists_members_only_when_flattened(client, server):
+    nested = await client.call("code.symbols.document", {"uri": "file:///a.py"})
+    flat = await client.call("code.symbols.document", {"uri": "file:///a.py", "flatten": True})
+    assert len(nested["items"]) == server.result_items
+    members = [s for s in flat["items"] if s["kind"] == 6]
+    assert [s["containerName"] for s in members] == [s["name"] for s in nested["items"]]
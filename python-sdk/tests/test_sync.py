@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ai_native_vscode_bridge import BridgeError, BridgeTimeoutError, SyncBridgeClient
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+from conftest import TOKEN
+
+
+@pytest.fixture
+def server():
+    """A mock server on its own loop thread, since the tests below block."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    latency = lambda method: 0.05 if method == "code.hover" else 0.0  # noqa: E731
+    srv = MockBridgeServer(token=TOKEN, latency=latency)
+    asyncio.run_coroutine_threadsafe(srv.start(), loop).result()
+    yield srv
+    asyncio.run_coroutine_threadsafe(srv.stop(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def test_connects_on_first_call_and_closes_twice(server):
+    client = SyncBridgeClient(port=server.port, token=TOKEN)
+    assert not client.connected
+    assert client.bridge_ping()["ok"] is True
+    assert client.connected and client.stats()["size"] == 1
+    client.close()
+    client.close()
+    assert not client.connected
+
+
+def test_threads_share_one_pipelined_socket(server):
+    with SyncBridgeClient(port=server.port, token=TOKEN) as client:
+        client.connect()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(16) as pool:
+            results = list(pool.map(lambda i: client.code_hover({"uri": f"file:///{i}"}), range(16)))
+        # 16 calls of 50 ms each overlap on the one socket.
+        assert time.perf_counter() - started < 0.5
+        assert len(results) == 16 and all("items" in r for r in results)
+        assert client.stats()["size"] == 1
+
+
+def test_timeout_cancels_on_the_server(server):
+    with SyncBridgeClient(port=server.port, token=TOKEN, timeout=0.01) as client:
+        with pytest.raises(BridgeTimeoutError):
+            client.code_hover({"uri": "file:///a.py"})
+        assert client.call("code.hover", {"uri": "file:///a.py"}, timeout=1.0)["items"]
+    assert server.cancelled >= 1
+
+
+def test_call_many_returns_errors_in_place(server):
+    with SyncBridgeClient(port=server.port, token=TOKEN) as client:
+        ping, missing = client.call_many([("bridge.ping", None), ("no.such.method", None)])
+    assert ping["ok"] is True
+    assert isinstance(missing, BridgeError) and missing.code == "E_NOT_FOUND"
+
+
+def test_calls_from_its_own_loop_raise(server):
+    with SyncBridgeClient(port=server.port, token=TOKEN) as client:
+
+        async def reenter():
+            return client.bridge_ping()
+
+        with pytest.raises(RuntimeError):
+            asyncio.run_coroutine_threadsafe(reenter(), client._loop).result(2)
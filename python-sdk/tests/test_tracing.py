@@ -0,0 +1,118 @@
+import sys
+import types
+
+import pytest
+
+from ai_native_vscode_bridge import (
+    BridgeClient,
+    BridgeError,
+    BridgeResultCache,
+    BridgeTracer,
+    InMemoryExporter,
+    OpenTelemetryExporter,
+    RetryPolicy,
+)
+from ai_native_vscode_bridge.mock import MockBridgeServer
+from ai_native_vscode_bridge.tracing import CallRecord
+
+from conftest import TOKEN
+
+
+async def test_per_method_stats_and_errors(server):
+    exporter = InMemoryExporter()
+    tracer = BridgeTracer(exporters=[exporter])
+    cache = BridgeResultCache()
+    async with BridgeClient(port=server.port, token=TOKEN, tracer=tracer, cache=cache) as client:
+        await client.call("doc.read", {"uri": "file:///a.py"})
+        await client.call("doc.read", {"uri": "file:///a.py"})
+        with pytest.raises(BridgeError):
+            await client.call("no.such.method")
+    stats = tracer.stats()
+    assert stats["calls"] == 3 and stats["inFlight"] == 0
+    assert stats["errorsByCode"] == {"E_NOT_FOUND": 1}
+    doc = stats["methods"]["doc.read"]
+    assert (doc["count"], doc["cacheHits"], doc["errors"]) == (2, 1, 0)
+    assert doc["bytesReceived"] > server.doc_lines * server.line_length
+    assert [r.cached for r in exporter.records] == [False, True, False]
+    assert exporter.records[-1].error_code == "E_NOT_FOUND"
+
+
+async def test_bytes_are_summed_over_retries():
+    failures = iter([True, False])
+
+    def flaky(params):
+        if next(failures, False):
+            raise RuntimeError("busy")
+        return {"items": []}
+
+    exporter = InMemoryExporter()
+    async with MockBridgeServer(token=TOKEN, handlers={"code.hover": flaky}) as server:
+        async with BridgeClient(
+            port=server.port,
+            token=TOKEN,
+            tracer=BridgeTracer(exporters=[exporter]),
+            retry=RetryPolicy(backoff_initial=0.001),
+        ) as client:
+            await client.call("code.hover", {"uri": "file:///a.py"})
+            await client.call("code.hover", {"uri": "file:///a.py"})
+    retried, single = exporter.records
+    assert retried.error_code is None
+    assert retried.bytes_sent == 2 * single.bytes_sent
+    assert retried.bytes_received > single.bytes_received
+
+
+class _Span:
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = attributes
+        self.status = None
+
+    def set_status(self, status):
+        self.status = status
+
+    def end(self, end_time):
+        self.end_time = end_time
+
+
+@pytest.fixture
+def otel(monkeypatch):
+    """A stand-in `opentelemetry.trace` that records the spans it is asked for."""
+    spans = []
+    trace = types.SimpleNamespace(
+        SpanKind=types.SimpleNamespace(CLIENT="client"),
+        StatusCode=types.SimpleNamespace(ERROR="error"),
+        Status=lambda code, description: (code, description),
+    )
+
+    class Tracer:
+        def start_span(self, name, kind, start_time, attributes):
+            spans.append(_Span(name, attributes))
+            return spans[-1]
+
+    trace.get_tracer = lambda name: Tracer()
+    package = types.ModuleType("opentelemetry")
+    package.trace = trace
+    monkeypatch.setitem(sys.modules, "opentelemetry", package)
+    return spans
+
+
+async def test_opentelemetry_attributes(server, otel):
+    tracer = BridgeTracer(exporters=[OpenTelemetryExporter()])
+    async with BridgeClient(port=server.port, token=TOKEN, tracer=tracer) as client:
+        await client.call("bridge.ping")
+        with pytest.raises(BridgeError):
+            await client.call("no.such.method")
+    ok, failed = otel
+    assert ok.attributes["rpc.method"] == "bridge.ping" and ok.status is None
+    assert "bridge.error_code" not in ok.attributes
+    assert failed.attributes["bridge.error_code"] == "E_NOT_FOUND"
+    # The semconv attribute is an int; string codes must not be put there.
+    assert "rpc.jsonrpc.error_code" not in failed.attributes
+    assert failed.status == ("error", "E_NOT_FOUND: Unknown method")
+
+
+def test_numeric_error_codes_use_the_semconv_attribute(otel):
+    OpenTelemetryExporter().export(CallRecord("x", 0, error_code="-32601", error_message="nope"))
+    (span,) = otel
+    assert span.attributes["rpc.jsonrpc.error_code"] == -32601
+    assert span.attributes["bridge.error_code"] == "-32601"
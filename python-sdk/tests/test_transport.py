@@ -0,0 +1,62 @@
+import pytest
+
+from ai_native_vscode_bridge import BridgeClient, BridgeError, BridgeTransport
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+from conftest import TOKEN
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("ws://127.0.0.1:57110", False),
+        ("ws://localhost:57110", False),
+        ("ws://[::1]:57110", False),
+        ("ws://10.0.0.7:57110", True),
+        ("ws://devbox.internal:57110", True),
+    ],
+)
+def test_auto_compresses_only_off_loopback(url, expected):
+    assert BridgeTransport().compresses(url) is expected
+    assert BridgeTransport(compression=False).compresses(url) is False
+    assert BridgeTransport(compression=True).compresses(url) is True
+
+
+@pytest.mark.parametrize("kwargs", [{"compression": "yes"}, {"threshold": -1}, {"level": 0}])
+def test_invalid_settings(kwargs):
+    with pytest.raises(ValueError):
+        BridgeTransport(**kwargs)
+
+
+async def test_large_messages_are_deflated_small_ones_are_not():
+    server_side = BridgeTransport(compression=True)
+    async with MockBridgeServer(token=TOKEN, transport=server_side) as server:
+        transport = BridgeTransport(compression=True, threshold=1024)
+        async with BridgeClient(port=server.port, token=TOKEN, transport=transport) as client:
+            await client.call("bridge.ping")
+            assert transport.stats.compressed_received == 0
+            doc = await client.call("doc.read", {"uri": "file:///a.py"})
+    stats = transport.stats.to_dict()
+    assert stats["messagesReceived"] == 2 and stats["compressedReceived"] == 1
+    assert stats["compressedSent"] == 0  # requests are below the threshold
+    assert stats["payloadBytesReceived"] > len(doc["text"])
+    assert stats["ratioReceived"] < 0.5
+    assert stats["wireBytesSent"] == stats["payloadBytesSent"]
+
+
+async def test_auto_leaves_loopback_uncompressed():
+    async with MockBridgeServer(token=TOKEN, transport=BridgeTransport(compression=True)) as server:
+        transport = BridgeTransport()
+        async with BridgeClient(port=server.port, token=TOKEN, transport=transport) as client:
+            await client.call("doc.read", {"uri": "file:///a.py"})
+    stats = transport.stats.to_dict()
+    assert stats["compressedReceived"] == 0 and stats["ratioReceived"] == 1.0
+
+
+async def test_max_message_size_closes_the_socket():
+    async with MockBridgeServer(token=TOKEN, doc_lines=100, line_length=100) as server:
+        transport = BridgeTransport(max_message_size=4096)
+        async with BridgeClient(port=server.port, token=TOKEN, transport=transport) as client:
+            assert (await client.call("bridge.ping"))["ok"] is True
+            with pytest.raises(BridgeError):
+                await client.call("doc.read", {"uri": "file:///a.py"})
@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import ai_native_vscode_bridge
+from ai_native_vscode_bridge import BridgeError, GeneratedBridgeClient, TypedBridgeClient
+from ai_native_vscode_bridge.codec import get_codec
+from ai_native_vscode_bridge.generated_models import (
+    BridgePingResult,
+    CodeReferencesParams,
+    Diagnostic,
+    DiagnosticsListResult,
+    Location,
+    Position,
+    WorkspaceFindFilesResult,
+)
+from ai_native_vscode_bridge.mock import MockBridgeServer
+
+from conftest import TOKEN
+
+ITEMS = 4
+
+
+def broken(params):
+    raise RuntimeError("boom")
+
+
+@pytest.fixture(params=["msgspec", "json"])
+async def typed(request):
+    handlers = {"doc.read": broken, "code.hover": lambda p: {"range": None}}
+    async with MockBridgeServer(token=TOKEN, result_items=ITEMS, handlers=handlers) as server:
+        codec = get_codec(request.param)
+        async with TypedBridgeClient(port=server.port, token=TOKEN, codec=codec) as client:
+            yield client
+
+
+async def test_results_are_generated_models(typed):
+    assert await typed.bridge_ping() == BridgePingResult(ok=True, protocol="v1-draft")
+    refs = await typed.code_references(
+        CodeReferencesParams(uri="file:///a.py", position=Position(line=0, character=0))
+    )
+    assert len(refs.items) == ITEMS
+    assert all(isinstance(loc, Location) and isinstance(loc.range.start, Position) for loc in refs.items)
+    files = await typed.workspace_findFiles({"maxResults": 3})
+    assert isinstance(files, WorkspaceFindFilesResult)
+    assert len(files.items) == 3 and files.truncated is True
+
+
+async def test_nested_lists_and_optional_fields(typed):
+    diags = await typed.diagnostics_list({"uri": "file:///a.py"})
+    assert isinstance(diags, DiagnosticsListResult)
+    (item,) = diags.items
+    assert [type(d) for d in item.diagnostics] == [Diagnostic] * ITEMS
+    assert item.diagnostics[0].code is None and item.diagnostics[0].source == "mock"
+    # Slotted: no per-instance __dict__.
+    assert not hasattr(item.diagnostics[0], "__dict__")
+
+
+async def test_errors_and_mismatched_results(typed):
+    with pytest.raises(BridgeError) as e:
+        await typed.doc_read({"uri": "file:///a.py"})
+    assert (e.value.code, e.value.message) == ("E_FAILED", "boom")
+    with pytest.raises(BridgeError) as e:
+        await typed.code_hover({"uri": "file:///a.py"})
+    assert e.value.code == "E_FAILED" and "CodeHoverResult" in e.value.message
+
+
+async def test_untyped_client_keeps_returning_dicts(server):
+    async with GeneratedBridgeClient(port=server.port, token=TOKEN) as client:
+        assert await client.bridge_ping() == {"ok": True, "protocol": "v1-draft"}
+
+
+def test_models_load_only_with_the_typed_client():
+    code = (
+        "import sys, ai_native_vscode_bridge as b; b.GeneratedBridgeClient; "
+        "assert 'ai_native_vscode_bridge.generated_models' not in sys.modules; "
+        "b.TypedBridgeClient; "
+        "assert 'ai_native_vscode_bridge.generated_models' in sys.modules"
+    )
+    src = str(Path(ai_native_vscode_bridge.__file__).parents[1])
+    subprocess.run([sys.executable, "-c", code], check=True, env={**os.environ, "PYTHONPATH": src})